@@ -0,0 +1,774 @@
+# Benchmarks run against an in-process eth-tester chain and need the pinned
+# dev requirements on top of the runtime ones:
+#
+#     pip install -r requirements-dev.txt
+#     python bench.py                      # every benchmark
+#     python bench.py receipt-tracker      # or just the named ones
+#
+# compile-cache, batch-mint, factory, gas-variants and load-test compile the real
+# contracts, so py-solc-x downloads solc on their first run.
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# --- Benchmark Environment ---
+# Give the library a private compile cache, journal and factory state before its
+# config is first imported, so benchmarks never touch the real ones.
+os.environ.setdefault("COMPILE_CACHE_DIR", tempfile.mkdtemp(prefix="nft-bench-cache-"))
+os.environ.setdefault("JOURNAL_PATH", os.path.join(tempfile.mkdtemp(prefix="nft-bench-journal-"), "journal.sqlite3"))
+os.environ.setdefault("FACTORY_STATE_FILE", os.path.join(tempfile.mkdtemp(prefix="nft-bench-factory-"), "factory.json"))
+
+import nft_deployer as nft
+from nft_deployer import config, signing
+
+
+# eth-tester funds the accounts derived from private keys 0x...01, 0x...02, ...
+LOCAL_KEYS = ["0x" + f"{i:064x}" for i in range(1, 11)]
+
+
+def local_chain(block_time=None):
+    """Web3 connected to an in-process eth-tester chain.
+
+    eth-tester mines every transaction immediately. With block_time set, a
+    middleware hides each receipt until the next block boundary after its send,
+    so receipt waits behave like they would against a real node.
+    """
+    from web3 import Web3, EthereumTesterProvider
+
+    w3 = Web3(EthereumTesterProvider())
+    if block_time:
+        w3.middleware_onion.add(_block_time_middleware(block_time), "block_time")
+    return w3
+
+
+def _block_time_middleware(block_time):
+    visible_at = {}
+
+    def middleware(make_request, w3):
+        def inner(method, params):
+            response = make_request(method, params)
+            now = time.monotonic()
+            if method == "eth_sendRawTransaction" and "result" in response:
+                visible_at[response["result"]] = (now // block_time + 1) * block_time
+            elif method == "eth_getTransactionReceipt" and visible_at.get(params[0], 0) > now:
+                return {"jsonrpc": "2.0", "id": response.get("id"), "result": None}
+            return response
+        return inner
+
+    return middleware
+
+
+def async_local_chain(rpc_latency=0.0, block_time=None):
+    """AsyncWeb3 over eth-tester, with injected per-request latency and block time."""
+    from web3 import AsyncWeb3
+    from web3.providers.eth_tester import AsyncEthereumTesterProvider
+
+    w3 = AsyncWeb3(AsyncEthereumTesterProvider())
+    if block_time:
+        sync_middleware = _block_time_middleware(block_time)
+
+        async def block_time_middleware(make_request, w3):
+            async def inner(method, params):
+                response = await make_request(method, params)
+                return sync_middleware(lambda *_: response, w3)(method, params)
+            return inner
+
+        w3.middleware_onion.add(block_time_middleware, "block_time")
+    if rpc_latency:
+        async def latency_middleware(make_request, w3):
+            async def inner(method, params):
+                await asyncio.sleep(rpc_latency)
+                return await make_request(method, params)
+            return inner
+
+        w3.middleware_onion.add(latency_middleware, "rpc_latency")
+    return w3
+
+
+def _timed(fn, *args, **kwargs):
+    start = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return time.perf_counter() - start, result
+
+
+def _report(label, samples):
+    samples = sorted(samples)
+    mean = sum(samples) / len(samples)
+    print(f"{label:<24} n={len(samples):<4} mean={mean * 1000:9.3f} ms  min={samples[0] * 1000:9.3f} ms  max={samples[-1] * 1000:9.3f} ms")
+
+
+# ==============================================================================
+# --- COMPILATION CACHE ---
+# ==============================================================================
+
+def bench_compile_cache(runs=20):
+    nft.clear_compile_cache(disk=True)
+    cold, artifacts = _timed(nft.compile_contracts)
+    if artifacts is None:
+        print("Compilation failed; nothing to benchmark.")
+        return
+
+    disk_warm = []
+    for _ in range(runs):
+        nft.clear_compile_cache()
+        elapsed, _ = _timed(nft.compile_contracts)
+        disk_warm.append(elapsed)
+
+    memo_warm = [_timed(nft.compile_contracts)[0] for _ in range(runs)]
+
+    print(f"Compile stage latency per job (solc {config.SOLC_VERSION}, cache at {config.COMPILE_CACHE_DIR})")
+    _report("cold (install+compile)", [cold])
+    _report("warm (disk cache)", disk_warm)
+    _report("warm (in-process memo)", memo_warm)
+    print(f"Cache counters: {nft.COMPILE_CACHE_STATS}")
+
+
+# ==============================================================================
+# --- BATCH MINTING ---
+# ==============================================================================
+
+def bench_batch_mint(counts=(1, 5, 20), block_time=0.5):
+    from eth_account import Account
+
+    artifacts = nft.compile_contracts()
+    if artifacts is None:
+        print("Compilation failed; nothing to benchmark.")
+        return
+    abi = artifacts["MyNFT.sol"]["MyNFT"]["abi"]
+    private_key = LOCAL_KEYS[0]
+    sender = Account.from_key(private_key).address
+
+    print(f"Mint latency with {block_time}s blocks (eth-tester)")
+    for count in counts:
+        w3 = local_chain(block_time=block_time)
+        chain_id = w3.eth.chain_id
+        result = nft.deploy_and_mint(w3=w3, private_key=private_key, chain_id=chain_id, mint_count=0)
+        nft_contract = w3.eth.contract(address=result["contract_address"], abi=abi)
+
+        def sequential():
+            for _ in range(count):
+                nonce = w3.eth.get_transaction_count(sender)
+                txn = nft_contract.functions.safeMint(sender).build_transaction({
+                    "chainId": chain_id, "from": sender, "nonce": nonce, "gasPrice": w3.eth.gas_price,
+                })
+                signed = w3.eth.account.sign_transaction(txn, private_key=private_key)
+                w3.eth.wait_for_transaction_receipt(w3.eth.send_raw_transaction(signed.rawTransaction), poll_latency=0.05)
+
+        def batched():
+            nonce = w3.eth.get_transaction_count(sender, "pending")
+            nft.mint_batch(w3, nft_contract, [sender] * count, nonce, private_key=private_key, chain_id=chain_id)
+
+        _report(f"sequential N={count}", [_timed(sequential)[0]])
+        _report(f"batched N={count}", [_timed(batched)[0]])
+
+
+# ==============================================================================
+# --- ASYNC MULTI-WALLET ENGINE ---
+# ==============================================================================
+
+def bench_async_throughput(jobs=20, concurrencies=(1, 2, 5, 10), rpc_latency=0.02, block_time=0.5):
+    print(f"Async deploy+mint throughput: {jobs} jobs over {len(LOCAL_KEYS)} wallets, {rpc_latency * 1000:.0f} ms RPC latency, {block_time}s blocks")
+    keys = [LOCAL_KEYS[i % len(LOCAL_KEYS)] for i in range(jobs)]
+    for concurrency in concurrencies:
+        w3 = async_local_chain(rpc_latency=rpc_latency, block_time=block_time)
+        elapsed, results = _timed(asyncio.run, nft.run_async_jobs(keys, w3=w3, concurrency=concurrency, mint_count=1, poll_latency=0.05))
+        failures = sum(1 for result in results if isinstance(result, Exception))
+        print(f"concurrency={concurrency:<3} {jobs / elapsed:8.2f} jobs/s  wall={elapsed:7.2f} s  failures={failures}")
+
+
+# ==============================================================================
+# --- FACTORY MODE ---
+# ==============================================================================
+
+def _job_cost(w3, result):
+    receipts = [result["deploy_receipt"]] + [r for r in result["mint_receipts"] if r is not result["deploy_receipt"]]
+    gas = sum(receipt.gasUsed for receipt in receipts)
+    calldata = sum(len(w3.eth.get_transaction(receipt.transactionHash).input) for receipt in receipts)
+    return gas, calldata, len(receipts)
+
+
+def bench_factory(collections=5, mint_count=1, block_time=0.5):
+    artifacts = nft.compile_contracts()
+    if artifacts is None:
+        print("Compilation failed; nothing to benchmark.")
+        return
+    private_key = LOCAL_KEYS[0]
+
+    print(f"Per-collection cost, {collections} collections x {mint_count} mint(s), {block_time}s blocks (eth-tester)")
+    for mode in ("direct", "factory"):
+        w3 = local_chain(block_time=block_time)
+        chain_id = w3.eth.chain_id
+        if mode == "factory":
+            setup, _ = _timed(nft.ensure_factory, w3, artifacts, private_key=private_key, chain_id=chain_id)
+            print(f"factory one-time setup: {setup * 1000:.1f} ms")
+        gas, calldata, txs, latencies = 0, 0, 0, []
+        for _ in range(collections):
+            elapsed, result = _timed(nft.deploy_and_mint, w3=w3, private_key=private_key, chain_id=chain_id, mint_count=mint_count, mode=mode)
+            job_gas, job_calldata, job_txs = _job_cost(w3, result)
+            gas, calldata, txs = gas + job_gas, calldata + job_calldata, txs + job_txs
+            latencies.append(elapsed)
+        print(f"{mode:<8} gas/collection={gas // collections:>9}  calldata/collection={calldata // collections:>6} B  txs/collection={txs / collections:.1f}")
+        _report(f"{mode} latency", latencies)
+
+
+# ==============================================================================
+# --- CONTRACT VARIANTS ---
+# ==============================================================================
+
+def bench_gas_variants(counts=(1, 10, 100)):
+    artifacts = nft.compile_contracts()
+    if artifacts is None:
+        print("Compilation failed; nothing to benchmark.")
+        return
+    private_key = LOCAL_KEYS[0]
+
+    print("Mint gas: per-token safeMint (standard) vs packed mintBatch (batch), eth-tester")
+    for count in counts:
+        row = {}
+        for variant in ("standard", "batch"):
+            w3 = local_chain()
+            result = nft.deploy_and_mint(w3=w3, private_key=private_key, chain_id=w3.eth.chain_id, mint_count=count, variant=variant)
+            row[variant] = (sum(receipt.gasUsed for receipt in result["mint_receipts"]), len(result["mint_receipts"]))
+        for variant, (gas, txs) in row.items():
+            print(f"N={count:<4} {variant:<8} mint gas={gas:>10}  gas/token={gas // count:>7}  txs={txs}")
+        print(f"N={count:<4} batch/standard gas ratio: {row['batch'][0] / row['standard'][0]:.2f}")
+
+
+# ==============================================================================
+# --- GAS ESTIMATE CACHE ---
+# ==============================================================================
+
+def bench_gas_cache(jobs=10, mint_count=5):
+    from nft_deployer import gas
+
+    print(f"eth_estimateGas calls, {jobs} jobs x {mint_count} mint(s) (eth-tester)")
+    for label, ttl in (("cache disabled", 0), ("cache enabled", 600)):
+        w3 = local_chain()
+        counts = {}
+        w3.middleware_onion.add(_rpc_counter(counts), "rpc_counter")
+        cache = nft.get_gas_cache(w3)
+        cache.ttl = ttl
+        latencies = []
+        for _ in range(jobs):
+            elapsed, _ = _timed(nft.deploy_and_mint, w3=w3, private_key=LOCAL_KEYS[0], chain_id=w3.eth.chain_id, mint_count=mint_count)
+            latencies.append(elapsed)
+        estimates = counts.get("eth_estimateGas", 0)
+        print(f"{label:<16} estimateGas/job={estimates / jobs:5.2f}  rpc calls/job={sum(counts.values()) / jobs:6.2f}  "
+              f"hit rate={cache.hit_rate:.2f}  {cache.stats}")
+        _report(label, latencies)
+
+    # A stale entry: the cached mint limit is cut below what a mint needs, so the
+    # first batch runs out of gas and is retried with a live estimate.
+    for key, entry in cache._entries.items():
+        if key[1] != "constructor":
+            entry["limit"] = int(entry["estimate"] * 0.8)
+    result = nft.deploy_and_mint(w3=w3, private_key=LOCAL_KEYS[0], chain_id=w3.eth.chain_id, mint_count=mint_count)
+    succeeded = sum(1 for receipt in result["mint_receipts"] if receipt.status == 1)
+    print(f"stale limits: {succeeded}/{mint_count} mints succeeded after fallback, {cache.stats['fallbacks']} fallback(s)")
+    gas._gas_caches.clear()
+
+
+# ==============================================================================
+# --- RECEIPT TRACKER ---
+# ==============================================================================
+
+def _rpc_counter(counts):
+    def middleware(make_request, w3):
+        def inner(method, params):
+            counts[method] = counts.get(method, 0) + 1
+            return make_request(method, params)
+        return inner
+    return middleware
+
+
+def _block_receipts_middleware(make_request, w3):
+    """Serve eth_getBlockReceipts (missing from eth-tester) as a single RPC call."""
+    def inner(method, params):
+        if method != "eth_getBlockReceipts":
+            return make_request(method, params)
+        block = make_request("eth_getBlockByNumber", [params[0], False])["result"]
+        receipts = [make_request("eth_getTransactionReceipt", [tx_hash])["result"] for tx_hash in block["transactions"]]
+        return {"jsonrpc": "2.0", "id": 0, "result": receipts}
+    return inner
+
+
+def _pending_transfers(count, block_time):
+    """Broadcast one transfer from each of `count` fresh wallets on a chain that seals a block every block_time."""
+    from eth_account import Account
+    from web3 import Web3, EthereumTesterProvider
+
+    w3 = Web3(EthereumTesterProvider())
+    tester = w3.provider.ethereum_tester
+    funder = Account.from_key(LOCAL_KEYS[0])
+    wallets = [Account.create() for _ in range(count)]
+    chain_id = w3.eth.chain_id
+    gas_price = w3.eth.gas_price
+    nonce = w3.eth.get_transaction_count(funder.address)
+    for offset, wallet in enumerate(wallets):
+        tx = {"to": wallet.address, "value": 10 ** 18, "gas": 21000, "gasPrice": gas_price, "nonce": nonce + offset, "chainId": chain_id}
+        w3.eth.send_raw_transaction(funder.sign_transaction(tx).rawTransaction)
+
+    tester.disable_auto_mine_transactions()
+    tx_hashes = []
+    for wallet in wallets:
+        # eth-tester's pending pool only accepts pre-EIP-155 signatures (v of 27/28).
+        tx = {"to": wallet.address, "value": 1, "gas": 21000, "gasPrice": gas_price, "nonce": 0}
+        tx_hashes.append(w3.eth.send_raw_transaction(wallet.sign_transaction(tx).rawTransaction))
+
+    # Seal blocks on a timer from inside the request path so eth-tester stays single-threaded.
+    next_block_at = [time.monotonic() + block_time]
+
+    def miner(make_request, w3):
+        def inner(method, params):
+            if time.monotonic() >= next_block_at[0]:
+                tester.mine_blocks()
+                next_block_at[0] = time.monotonic() + block_time
+            return make_request(method, params)
+        return inner
+
+    w3.middleware_onion.add(miner, "miner")
+    w3.middleware_onion.add(_block_receipts_middleware, "block_receipts")
+    return w3, tx_hashes
+
+
+def bench_receipt_tracker(pending_counts=(1, 10, 100), block_time=1.0, poll_interval=0.1):
+    from web3.exceptions import TransactionNotFound
+
+    print(f"RPC calls to resolve N pending transactions ({block_time}s blocks, {poll_interval}s poll interval)")
+    for count in pending_counts:
+        w3, tx_hashes = _pending_transfers(count, block_time)
+        counts = {}
+        w3.middleware_onion.add(_rpc_counter(counts), "counter")
+        pending = set(tx_hashes)
+        start = time.perf_counter()
+        while pending:
+            for tx_hash in list(pending):
+                try:
+                    w3.eth.get_transaction_receipt(tx_hash)
+                    pending.discard(tx_hash)
+                except TransactionNotFound:
+                    pass
+            if pending:
+                time.sleep(poll_interval)
+        per_tx = (sum(counts.values()), time.perf_counter() - start)
+
+        w3, tx_hashes = _pending_transfers(count, block_time)
+        counts = {}
+        w3.middleware_onion.add(_rpc_counter(counts), "counter")
+        start = time.perf_counter()
+        tracker = nft.ReceiptTracker(w3, poll_interval=poll_interval).start()
+        tracker.wait(tx_hashes)
+        tracked = (sum(counts.values()), time.perf_counter() - start)
+
+        print(f"N={count:<4} per-tx polling: {per_tx[0]:>5} calls ({per_tx[1]:.2f} s)   tracker: {tracked[0]:>4} calls ({tracked[1]:.2f} s)  {counts}")
+
+
+# ==============================================================================
+# --- RPC PROVIDER ---
+# ==============================================================================
+
+class MockRPCServer:
+    """Minimal keep-alive JSON-RPC server answering the reads a job makes, with injected latency."""
+
+    RESULTS = {
+        "web3_clientVersion": "mock/1.0",
+        "eth_chainId": hex(16601),
+        "eth_getTransactionCount": "0x7",
+        "eth_blockNumber": "0x100",
+        "eth_gasPrice": hex(3 * 10 ** 9),
+        "eth_feeHistory": {"oldestBlock": "0xf7", "baseFeePerGas": [hex(10 ** 9)] * 11, "gasUsedRatio": [0.5] * 10, "reward": [[hex(10 ** 8)]] * 10},
+    }
+
+    def __init__(self, latency=0.0):
+        self.latency = latency
+        self.round_trips = 0
+        self.connections = 0
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def setup(self):
+                super().setup()
+                server.connections += 1
+
+            def log_message(self, *args):
+                pass
+
+            def do_POST(self):
+                server.round_trips += 1
+                time.sleep(server.latency)
+                request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                answer = lambda call: {"jsonrpc": "2.0", "id": call["id"], "result": server.RESULTS[call["method"]]}
+                body = json.dumps([answer(call) for call in request] if isinstance(request, list) else answer(request)).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.uri = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+def bench_rpc_provider(jobs=20, latency=0.01):
+    from eth_account import Account
+    from web3 import Web3
+
+    sender = Account.from_key(LOCAL_KEYS[0]).address
+    print(f"Per-job chain reads against a mock JSON-RPC server ({latency * 1000:.0f} ms per round trip), {jobs} jobs")
+
+    # Before: a fresh Web3 per job and one HTTP round trip per read.
+    server = MockRPCServer(latency)
+    start = time.perf_counter()
+    for _ in range(jobs):
+        w3 = Web3(Web3.HTTPProvider(server.uri))
+        w3.is_connected()
+        w3.eth.chain_id
+        w3.eth.get_transaction_count(sender, "pending")
+        w3.eth.block_number
+        w3.eth.gas_price
+    before = (server.round_trips / jobs, (time.perf_counter() - start) / jobs, server.connections)
+    server.close()
+
+    # After: one long-lived pooled provider, reads packed into a batch, fees cached by the oracle.
+    server = MockRPCServer(latency)
+    w3 = Web3(nft.PooledHTTPProvider([server.uri]))
+    oracle = nft.FeeOracle()
+    start = time.perf_counter()
+    for _ in range(jobs):
+        fee_call = oracle.refresh_request()
+        calls = [("eth_chainId", []), ("eth_getTransactionCount", [sender, "pending"]), ("eth_blockNumber", [])]
+        results = nft.batch_call(w3, calls + ([fee_call] if fee_call else []))
+        if fee_call:
+            oracle.accept(fee_call[0], results[3])
+    after = (server.round_trips / jobs, (time.perf_counter() - start) / jobs, server.connections)
+    server.close()
+
+    for label, (round_trips, wall, connections) in (("before", before), ("after", after)):
+        print(f"{label:<7} round trips/job={round_trips:5.2f}  wall/job={wall * 1000:7.2f} ms  TCP connections={connections}")
+
+    # Failover: the first endpoint refuses connections, so traffic moves to the healthy one.
+    server = MockRPCServer(latency)
+    w3 = Web3(nft.PooledHTTPProvider(["http://127.0.0.1:9", server.uri]))
+    elapsed, _ = _timed(lambda: [w3.eth.block_number for _ in range(jobs)])
+    print(f"failover: {jobs} reads in {elapsed * 1000:.1f} ms, provider stats {w3.provider.stats}")
+    server.close()
+
+
+# ==============================================================================
+# --- SIGNING PIPELINE ---
+# ==============================================================================
+
+def bench_signing(count=1000, workers=(1, 2, 4)):
+    from eth_account import Account
+    from web3 import Web3
+
+    private_key = LOCAL_KEYS[0]
+    sender = Account.from_key(private_key).address
+    nft_contract = Web3().eth.contract(address=sender, abi=[{
+        "type": "function", "name": "safeMint", "stateMutability": "nonpayable",
+        "inputs": [{"name": "to", "type": "address"}], "outputs": [],
+    }])
+    template = {"chainId": config.CHAIN_ID, "to": sender, "gas": 150000, "maxFeePerGas": 4 * 10 ** 9,
+                "maxPriorityFeePerGas": 10 ** 9, "value": 0, "data": nft_contract.encodeABI(fn_name="safeMint", args=[sender])}
+    transactions = [dict(template, nonce=nonce) for nonce in range(count)]
+
+    print(f"Signing {count} EIP-1559 mint transactions ({os.cpu_count()} CPU(s) available)")
+    for worker_count in workers:
+        signing._signing_pool = None
+        signing.SIGNING_WORKERS = worker_count
+        if worker_count > 1:
+            list(nft.sign_in_chunks(private_key, transactions[:worker_count * 2], workers=worker_count, chunk_size=1))  # warm the pool
+        elapsed, _ = _timed(lambda: [signed for chunk in nft.sign_in_chunks(private_key, transactions, workers=worker_count) for signed in chunk])
+        label = "single process" if worker_count == 1 else f"pool of {worker_count}"
+        print(f"{label:<16} {count / elapsed:9.0f} signatures/s  ({elapsed:.2f} s)")
+        if signing._signing_pool is not None:
+            signing._signing_pool.shutdown()
+
+
+# ==============================================================================
+# --- METRICS OVERHEAD ---
+# ==============================================================================
+
+def bench_metrics_overhead(spans=200000, jobs=5, mint_count=5):
+    metrics = nft.Metrics()
+
+    def spin():
+        for _ in range(spans):
+            with metrics.span("bench"):
+                pass
+
+    print(f"Instrumentation cost, {spans} spans")
+    disabled, _ = _timed(spin)
+    metrics.enable()
+    enabled, _ = _timed(spin)
+    print(f"disabled: {disabled / spans * 1e9:>7.0f} ns/span")
+    print(f"enabled:  {enabled / spans * 1e9:>7.0f} ns/span")
+
+    print(f"Job latency, {jobs} jobs x {mint_count} mint(s) (eth-tester)")
+    for label in ("disabled", "enabled"):
+        if label == "enabled":
+            nft.METRICS.enable()
+        w3 = local_chain()
+        latencies = [
+            _timed(nft.deploy_and_mint, w3=w3, private_key=LOCAL_KEYS[0], chain_id=w3.eth.chain_id, mint_count=mint_count)[0]
+            for _ in range(jobs)
+        ]
+        _report(f"metrics {label}", latencies)
+    nft.METRICS.disable()
+
+
+# ==============================================================================
+# --- INVENTORY INDEXER ---
+# ==============================================================================
+
+def _log_range_cap(max_range):
+    # Nodes cap the block range of one eth_getLogs call; this rejects anything wider.
+    def middleware(make_request, w3):
+        def inner(method, params):
+            if method == "eth_getLogs":
+                query = params[0]
+                if nft.to_int(query["toBlock"]) - nft.to_int(query["fromBlock"]) + 1 > max_range:
+                    raise ValueError(f"query exceeds max block range {max_range}")
+            return make_request(method, params)
+        return inner
+    return middleware
+
+
+def bench_indexer(collections=20, mint_count=5, max_range=16):
+    from nft_deployer.indexer import InventoryIndexer
+
+    w3 = local_chain()
+    journal = nft.get_journal()
+    for index in range(collections):
+        nft.deploy_and_mint(w3=w3, private_key=LOCAL_KEYS[index % len(LOCAL_KEYS)], chain_id=w3.eth.chain_id, mint_count=mint_count, journal=journal)
+    counts = {}
+    w3.middleware_onion.add(_rpc_counter(counts), "rpc_counter")
+    w3.middleware_onion.add(_log_range_cap(max_range), "log_range_cap")
+    indexer = InventoryIndexer(w3, path=os.path.join(tempfile.mkdtemp(prefix="nft-bench-index-"), "inventory.sqlite3"))
+    indexer.track_journal(journal)
+    head = w3.eth.block_number
+
+    print(f"{collections} collection(s) x {mint_count} mint(s) over {head} blocks, eth_getLogs capped at {max_range} blocks")
+    for label in ("initial sync", "incremental sync"):
+        counts.clear()
+        elapsed, applied = _timed(indexer.sync)
+        print(f"{label:<18} {elapsed * 1000:9.1f} ms  {applied:>5} transfer(s)  eth_getLogs={counts.get('eth_getLogs', 0):>3}  "
+              f"rpc calls={sum(counts.values()):>4}  chunk={indexer.chunk_size}")
+    elapsed, per_collection = _timed(indexer.tokens_per_collection)
+    tokens = sum(per_collection.values())
+    print(f"{'local query':<18} {elapsed * 1000:9.1f} ms  {tokens:>5} token(s) in {len(per_collection)} collection(s), "
+          f"replacing {tokens} ownerOf + {len(per_collection)} balanceOf call(s)")
+    print(f"Indexer stats: {indexer.stats}")
+    indexer.close()
+
+
+# ==============================================================================
+# --- LOAD TEST ---
+# ==============================================================================
+# The full compile -> deploy -> mint flow against one eth-tester chain, with
+# every wallet running its jobs on its own thread like the scheduler does. The
+# grid and the simulated network come from the environment:
+#   LOAD_TEST_WALLETS=1,4,10  LOAD_TEST_BATCH_SIZES=1,10  LOAD_TEST_VARIANTS=standard
+#   LOAD_TEST_JOBS_PER_WALLET=2  LOAD_TEST_RPC_LATENCY=0.02  LOAD_TEST_BLOCK_TIME=0.5
+#   LOAD_TEST_OUTPUT=load_test_results.json  LOAD_TEST_BASELINE=<earlier results file>
+
+def _env_list(name, default, cast):
+    return [cast(value.strip()) for value in os.getenv(name, default).split(",") if value.strip()]
+
+
+def _shared_node(rpc_latency):
+    # One node serves every wallet: requests wait out the network latency
+    # concurrently, then reach the (single-threaded) chain one at a time.
+    lock = threading.Lock()
+
+    def middleware(make_request, w3):
+        def inner(method, params):
+            if rpc_latency:
+                time.sleep(rpc_latency)
+            with lock:
+                return make_request(method, params)
+        return inner
+    return middleware
+
+
+def _percentile(samples, percent):
+    samples = sorted(samples)
+    return samples[max(0, min(len(samples) - 1, -(-len(samples) * percent // 100) - 1))]
+
+
+def _git_revision():
+    import subprocess
+
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=os.path.dirname(os.path.abspath(__file__)),
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _load_scenario(wallets, batch_size, variant, jobs_per_wallet, rpc_latency, block_time):
+    import contextlib
+    import io
+    from concurrent.futures import ThreadPoolExecutor
+
+    w3 = local_chain(block_time=block_time)
+    counts = {}
+    w3.middleware_onion.add(_rpc_counter(counts), "rpc_counter")
+    # Innermost, so requests web3's own middleware makes along the way queue separately.
+    w3.middleware_onion.inject(_shared_node(rpc_latency), "shared_node", layer=0)
+    chain_id = w3.eth.chain_id
+    counts.clear()
+    span_log = os.path.join(tempfile.mkdtemp(prefix="nft-bench-load-"), "spans.jsonl")
+
+    def run_wallet(private_key):
+        results = []
+        for _ in range(jobs_per_wallet):
+            try:
+                with nft.METRICS.span("job"):
+                    results.append(nft.deploy_and_mint(w3=w3, private_key=private_key, chain_id=chain_id, mint_count=batch_size, variant=variant))
+            except Exception as e:
+                results.append(e)
+        return results
+
+    nft.METRICS.enable(log_path=span_log)
+    try:
+        with contextlib.redirect_stdout(io.StringIO()), ThreadPoolExecutor(max_workers=wallets) as pool:
+            elapsed, per_wallet = _timed(lambda: [result for results in pool.map(run_wallet, LOCAL_KEYS[:wallets]) for result in results])
+    finally:
+        nft.METRICS.disable()
+
+    durations = {}
+    with open(span_log) as f:
+        for line in f:
+            record = json.loads(line)
+            durations.setdefault(record["stage"], []).append(record["duration"])
+    completed = [result for result in per_wallet if isinstance(result, dict)]
+    mint_receipts = [receipt for result in completed for receipt in result["mint_receipts"]]
+    minted = len(completed) * batch_size
+    jobs = wallets * jobs_per_wallet
+    return {
+        "wallets": wallets, "batch_size": batch_size, "variant": variant, "jobs": jobs, "failures": jobs - len(completed),
+        "wall_seconds": elapsed, "jobs_per_second": len(completed) / elapsed,
+        "stages": {stage: {"count": len(samples), "mean": sum(samples) / len(samples),
+                           "p50": _percentile(samples, 50), "p99": _percentile(samples, 99)}
+                   for stage, samples in sorted(durations.items())},
+        "rpc_calls_per_job": sum(counts.values()) / jobs,
+        "rpc_methods_per_job": {method: count / jobs for method, count in sorted(counts.items())},
+        "deploy_gas": sum(result["deploy_receipt"].gasUsed for result in completed) / len(completed) if completed else None,
+        "gas_per_mint": sum(receipt.gasUsed for receipt in mint_receipts) / minted if minted else None,
+    }
+
+
+def bench_load_test():
+    import platform
+
+    wallet_counts = [min(count, len(LOCAL_KEYS)) for count in _env_list("LOAD_TEST_WALLETS", "1,4,10", int)]
+    batch_sizes = _env_list("LOAD_TEST_BATCH_SIZES", "1,10", int)
+    variants = _env_list("LOAD_TEST_VARIANTS", "standard", str)
+    jobs_per_wallet = int(os.getenv("LOAD_TEST_JOBS_PER_WALLET", "2"))
+    rpc_latency = float(os.getenv("LOAD_TEST_RPC_LATENCY", "0.02"))
+    block_time = float(os.getenv("LOAD_TEST_BLOCK_TIME", "0.5"))
+    output = os.getenv("LOAD_TEST_OUTPUT", "load_test_results.json")
+
+    # Compile once up front (a cold compile, given the benchmark's private cache dir).
+    compile_seconds, artifacts = _timed(nft.compile_contracts)
+    if artifacts is None:
+        print("Compilation failed; nothing to load-test.")
+        return
+    print(f"Load test: {jobs_per_wallet} job(s) per wallet, {rpc_latency * 1000:.0f} ms RPC latency, {block_time}s blocks, compile {compile_seconds:.2f} s")
+    print(f"{'variant':<9} {'wallets':>7} {'batch':>5} {'jobs/s':>8} {'job p50':>9} {'job p99':>9} {'rpc/job':>8} {'gas/mint':>9} {'failures':>8}")
+    scenarios = []
+    for variant in variants:
+        for wallets in wallet_counts:
+            for batch_size in batch_sizes:
+                result = _load_scenario(wallets, batch_size, variant, jobs_per_wallet, rpc_latency, block_time)
+                scenarios.append(result)
+                job = result["stages"].get("job", {"p50": 0.0, "p99": 0.0})
+                gas_per_mint = f"{result['gas_per_mint']:9.0f}" if result["gas_per_mint"] is not None else f"{'-':>9}"
+                print(f"{variant:<9} {wallets:>7} {batch_size:>5} {result['jobs_per_second']:8.2f} {job['p50']:8.2f}s {job['p99']:8.2f}s "
+                      f"{result['rpc_calls_per_job']:8.1f} {gas_per_mint} {result['failures']:>8}")
+
+    report = {
+        "suite": "load-test", "created_at": time.strftime("%Y-%m-%dT%H:%M:%S%z"), "revision": _git_revision(),
+        "python": platform.python_version(),
+        "parameters": {"jobs_per_wallet": jobs_per_wallet, "rpc_latency": rpc_latency, "block_time": block_time,
+                       "compile_seconds": compile_seconds, "solc_version": config.SOLC_VERSION},
+        "scenarios": scenarios,
+    }
+    with open(output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"Results written to {output}")
+
+    baseline_path = os.getenv("LOAD_TEST_BASELINE")
+    if baseline_path:
+        with open(baseline_path) as f:
+            baseline = json.load(f)
+        earlier = {(s["variant"], s["wallets"], s["batch_size"]): s for s in baseline["scenarios"]}
+        print(f"Compared with {baseline_path} (revision {baseline.get('revision') or 'unknown'}):")
+        for result in scenarios:
+            before = earlier.get((result["variant"], result["wallets"], result["batch_size"]))
+            if before and before["jobs_per_second"]:
+                change = (result["jobs_per_second"] / before["jobs_per_second"] - 1) * 100
+                print(f"  {result['variant']:<9} wallets={result['wallets']:<3} batch={result['batch_size']:<4} "
+                      f"jobs/s {before['jobs_per_second']:.2f} -> {result['jobs_per_second']:.2f} ({change:+.1f}%)")
+
+
+# ==============================================================================
+# --- STARTUP ---
+# ==============================================================================
+
+def bench_startup(runs=5):
+    import subprocess
+
+    here = os.path.dirname(os.path.abspath(__file__))
+    commands = [
+        ("interpreter", [sys.executable, "-c", "pass"]),
+        ("import nft_deployer", [sys.executable, "-c", "import nft_deployer"]),
+        ("import scheduler", [sys.executable, "-c", "import nft_deployer.scheduler"]),
+        ("import full library", [sys.executable, "-c", "import nft_deployer.jobs, nft_deployer.async_engine"]),
+        ("deploy.py --help", [sys.executable, "deploy.py", "--help"]),
+        ("deploy.py status", [sys.executable, "deploy.py", "status"]),
+    ]
+    print(f"Cold start, {runs} fresh interpreter(s) per command")
+    for label, command in commands:
+        samples = [_timed(subprocess.run, command, cwd=here, stdout=subprocess.DEVNULL, check=True)[0] for _ in range(runs)]
+        _report(label, samples)
+
+
+BENCHMARKS = {
+    "compile-cache": bench_compile_cache,
+    "batch-mint": bench_batch_mint,
+    "async-throughput": bench_async_throughput,
+    "factory": bench_factory,
+    "gas-variants": bench_gas_variants,
+    "gas-cache": bench_gas_cache,
+    "receipt-tracker": bench_receipt_tracker,
+    "rpc-provider": bench_rpc_provider,
+    "signing": bench_signing,
+    "metrics-overhead": bench_metrics_overhead,
+    "indexer": bench_indexer,
+    "load-test": bench_load_test,
+    "startup": bench_startup,
+}
+
+if __name__ == "__main__":
+    names = sys.argv[1:] or list(BENCHMARKS)
+    for name in names:
+        if name not in BENCHMARKS:
+            print(f"Unknown benchmark '{name}'. Available: {', '.join(BENCHMARKS)}")
+            sys.exit(1)
+        print(f"=== {name} ===")
+        BENCHMARKS[name]()
@@ -0,0 +1,40 @@
+# NFT deploy/mint library behind deploy.py.
+#
+# Importing the package is cheap and has no side effects: the submodules (and
+# with them web3, eth_account, solcx and aiohttp) load on first attribute
+# access, so `from nft_deployer import Scheduler` never pulls in web3.
+import importlib
+
+_EXPORTS = {
+    "Metrics": "metrics", "METRICS": "metrics", "start_metrics": "metrics",
+    "COMPILE_CACHE_STATS": "compiler", "build_standard_input": "compiler", "compilation_key": "compiler",
+    "compile_contracts": "compiler", "clear_compile_cache": "compiler", "CONTRACT_VARIANTS": "compiler",
+    "variant_artifact": "compiler",
+    "to_int": "rpc", "EndpointState": "rpc", "PooledHTTPProvider": "rpc", "batch_call": "rpc", "get_web3": "rpc",
+    "instrument_web3": "rpc", "BatchRefused": "rpc",
+    "FeeOracle": "fees", "get_fee_oracle": "fees",
+    "GasEstimateCache": "gas", "get_gas_cache": "gas", "send_with_gas_retry": "gas", "send_with_gas_retry_async": "gas",
+    "ReceiptTracker": "receipts", "get_receipt_tracker": "receipts",
+    "InventoryIndexer": "indexer",
+    "JobJournal": "journal", "get_journal": "journal",
+    "get_signing_pool": "signing", "sign_in_chunks": "signing", "Broadcaster": "signing",
+    "broadcast_raw": "signing", "NonceAlreadyUsed": "signing", "sign_and_journal": "signing",
+    "generate_collection_name": "minting", "plan_mint_calls": "minting", "mint_batch": "minting",
+    "ensure_factory": "factory", "deploy_and_mint_via_factory": "factory",
+    "deploy_and_mint": "jobs", "resume_unfinished_jobs": "jobs", "wallet_job": "jobs", "job": "jobs",
+    "create_async_web3": "async_engine", "async_deploy_and_mint": "async_engine", "run_async_jobs": "async_engine",
+    "CronSchedule": "scheduler", "IntervalSchedule": "scheduler", "ScheduledJob": "scheduler", "Scheduler": "scheduler",
+}
+
+__all__ = sorted(_EXPORTS)
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
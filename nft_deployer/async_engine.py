@@ -0,0 +1,127 @@
+import asyncio
+import uuid
+
+from eth_account import Account
+from web3 import AsyncHTTPProvider, AsyncWeb3
+
+from .compiler import build_standard_input, compilation_key, compile_contracts
+from .config import ASYNC_CONCURRENCY, CHAIN_ID, MINT_COUNT, RECEIPT_POLL_INTERVAL, RPC_ENDPOINTS
+from .fees import get_fee_oracle
+from .gas import argument_shape, code_hash, send_with_gas_retry_async
+from .journal import get_journal
+from .metrics import METRICS
+from .minting import generate_collection_name
+from .receipts import ReceiptTracker
+from .rpc import instrument_web3
+from .signing import sign_and_journal
+
+# ==============================================================================
+# --- ASYNC MULTI-WALLET ENGINE ---
+# ==============================================================================
+# Runs deploy-then-mint for many wallets concurrently over one AsyncWeb3 instance
+# (and therefore one aiohttp connection pool). Jobs for the same wallet are
+# serialised with a per-address lock so its nonces stay strictly increasing.
+# Signing and journal writes (synchronous SQLite commits) run in worker threads
+# so they never stall the other wallets on the event loop. The engine talks to
+# a single endpoint without failover, so run-scheduler keeps using the sync
+# per-wallet path; this is the entry point for callers driving many wallets
+# from their own event loop.
+
+async def create_async_web3(endpoint=RPC_ENDPOINTS[0], pool_size=ASYNC_CONCURRENCY):
+    from aiohttp import ClientSession, TCPConnector
+
+    provider = AsyncHTTPProvider(endpoint)
+    session = ClientSession(connector=TCPConnector(limit=pool_size))
+    await provider.cache_async_session(session)
+    return instrument_web3(AsyncWeb3(provider)), session
+
+async def _send_and_wait(w3, transactions, private_key, tracker, journal, job_id, step, minted=None):
+    signed_txns = await asyncio.to_thread(sign_and_journal, w3, transactions, private_key, journal, job_id, step, minted)
+    tx_hashes = [await w3.eth.send_raw_transaction(signed_txn.rawTransaction) for signed_txn in signed_txns]
+    await asyncio.to_thread(journal.mark_sent, tx_hashes)
+    receipts = await tracker.wait_async(tx_hashes)
+    await asyncio.to_thread(_record_receipts, journal, job_id, receipts)
+    return receipts
+
+def _record_receipts(journal, job_id, receipts):
+    for receipt in receipts:
+        journal.record_receipt(job_id, receipt)
+
+async def async_deploy_and_mint(w3, abi, bytecode, private_key, chain_id=CHAIN_ID, mint_count=1, tracker=None, journal=None):
+    sender = Account.from_key(private_key).address
+    if tracker is None:
+        tracker = await ReceiptTracker(w3).start_async()
+    if journal is None:
+        journal = get_journal()
+    contract_name, token_symbol = generate_collection_name()
+    with METRICS.span("preflight"):
+        nonce = await w3.eth.get_transaction_count(sender, "pending")
+        fees = await get_fee_oracle(w3).fees_async(w3)
+    fields = {"chainId": chain_id, "value": 0, **fees}
+
+    MyNFT = w3.eth.contract(abi=abi, bytecode=bytecode)
+    constructor = MyNFT.constructor(contract_name, token_symbol)
+    bytecode_hash = code_hash(bytecode)
+    deploy_key = (bytecode_hash, "constructor", argument_shape([contract_name, token_symbol]))
+    job_id = uuid.uuid4().hex
+    await asyncio.to_thread(journal.start_job, job_id, sender, chain_id, "direct", compilation_key(build_standard_input()),
+                            contract_name, token_symbol, [sender] * mint_count)
+
+    async def send_deploy(_, transactions):
+        return await _send_and_wait(w3, transactions, private_key, tracker, journal, job_id, "deploy")
+
+    (tx_receipt,), nonce = await send_with_gas_retry_async(
+        w3, [{"from": sender, "data": constructor.data_in_transaction}], [deploy_key], nonce, fields, send_deploy, "deployment")
+    if tx_receipt.status != 1:
+        await asyncio.to_thread(journal.finish_job, job_id, "failed", "deployment reverted")
+        raise RuntimeError(f"deployment reverted (tx {tx_receipt.transactionHash.hex()})")
+    contract_address = tx_receipt.contractAddress
+    print(f"[{sender}] Deployed {contract_name} ({token_symbol}) at {contract_address}")
+
+    nft_contract = w3.eth.contract(address=contract_address, abi=abi)
+    data = nft_contract.encodeABI(fn_name="safeMint", args=[sender])
+    mint_key = (bytecode_hash, data[:10], argument_shape([sender]))
+
+    async def send_mints(_, transactions):
+        return await _send_and_wait(w3, transactions, private_key, tracker, journal, job_id, "mint", minted=[(sender, 1)] * len(transactions))
+
+    mint_receipts, _ = await send_with_gas_retry_async(
+        w3, [{"from": sender, "to": contract_address, "data": data}] * mint_count, [mint_key] * mint_count, nonce, fields, send_mints, "mint")
+    await asyncio.to_thread(journal.finish_job, job_id)
+    print(f"[{sender}] Minted {len(mint_receipts)} token(s) on {contract_address}")
+    return {"contract_address": contract_address, "deploy_receipt": tx_receipt, "mint_receipts": mint_receipts}
+
+async def run_async_jobs(private_keys, w3=None, concurrency=ASYNC_CONCURRENCY, chain_id=None, mint_count=None, poll_latency=RECEIPT_POLL_INTERVAL):
+    """Run one deploy+mint job per key; returns results (or exceptions) in key order."""
+    artifacts = compile_contracts()
+    if artifacts is None:
+        return []
+    abi = artifacts["MyNFT.sol"]["MyNFT"]["abi"]
+    bytecode = artifacts["MyNFT.sol"]["MyNFT"]["bytecode"]
+    if mint_count is None:
+        mint_count = MINT_COUNT
+
+    session = None
+    if w3 is None:
+        w3, session = await create_async_web3(pool_size=concurrency)
+    try:
+        if chain_id is None:
+            chain_id = await w3.eth.chain_id
+        tracker = await ReceiptTracker(w3, poll_interval=poll_latency).start_async()
+        semaphore = asyncio.Semaphore(concurrency)
+        wallet_locks = {}
+
+        async def run_one(private_key):
+            sender = Account.from_key(private_key).address
+            lock = wallet_locks.setdefault(sender, asyncio.Lock())
+            async with lock, semaphore:
+                try:
+                    return await async_deploy_and_mint(w3, abi, bytecode, private_key, chain_id=chain_id, mint_count=mint_count, tracker=tracker)
+                except Exception as e:
+                    print(f"[{sender}] Job failed: {e}")
+                    return e
+
+        return await asyncio.gather(*(run_one(key) for key in private_keys))
+    finally:
+        if session is not None:
+            await session.close()
@@ -0,0 +1,277 @@
+import argparse
+import json
+import os
+import sys
+
+# Subcommands import what they need when they run: `status` and `compile` never
+# load web3, and nothing touches the private keys until a command has to sign.
+
+def _wallets():
+    from eth_account import Account
+
+    from .config import require_private_keys
+
+    wallets = []
+    for private_key in require_private_keys():
+        try:
+            address = Account.from_key(private_key).address
+        except Exception as e:
+            raise ValueError(f"Invalid PRIVATE_KEY. Please check your .env file. Error: {e}")
+        print(f"Successfully derived address: {address}")
+        wallets.append((address, private_key))
+    return wallets
+
+def _wallet(args):
+    wallets = _wallets()
+    if not 0 <= args.wallet < len(wallets):
+        raise ValueError(f"--wallet {args.wallet} is out of range; {len(wallets)} key(s) configured")
+    return wallets[args.wallet]
+
+def cmd_compile(args):
+    from .compiler import COMPILE_CACHE_STATS, build_standard_input, clear_compile_cache, compilation_key, compile_contracts
+
+    if args.clear_cache:
+        clear_compile_cache(disk=True)
+    artifacts = compile_contracts()
+    if artifacts is None:
+        return 1
+    print(f"Artifact key: {compilation_key(build_standard_input())}")
+    for source, contracts in sorted(artifacts.items()):
+        for name, artifact in sorted(contracts.items()):
+            if artifact["bytecode"]:
+                print(f"  {source}:{name}  {len(artifact['bytecode']) // 2} bytes")
+    print(f"Cache: {COMPILE_CACHE_STATS}")
+    return 0
+
+def cmd_deploy(args):
+    from .jobs import deploy_and_mint
+    from .metrics import start_metrics
+
+    _, private_key = _wallet(args)
+    start_metrics()
+    result = deploy_and_mint(private_key=private_key, mint_count=args.count, mode=args.mode, variant=args.variant)
+    return 0 if result else 1
+
+def cmd_mint(args):
+    import uuid
+
+    from .compiler import build_standard_input, compilation_key, compile_contracts, variant_artifact
+    from .config import CONTRACT_VARIANT
+    from .gas import code_hash
+    from .journal import get_journal
+    from .metrics import start_metrics
+    from .minting import mint_batch
+    from .rpc import get_web3
+
+    sender, private_key = _wallet(args)
+    start_metrics()
+    artifacts = compile_contracts()
+    if artifacts is None:
+        return 1
+    w3 = get_web3()
+    variant = args.variant or CONTRACT_VARIANT
+    contract_address = w3.to_checksum_address(args.contract)
+    recipients = [w3.to_checksum_address(args.to) if args.to else sender] * args.count
+    artifact = variant_artifact(artifacts, variant)
+    nft_contract = w3.eth.contract(address=contract_address, abi=artifact["abi"])
+
+    # Journaled like the mint step of a deploy job, so an interrupted run resumes from the next recipient.
+    journal = get_journal()
+    job_id = uuid.uuid4().hex
+    chain_id = w3.eth.chain_id
+    journal.start_job(job_id, sender, chain_id, "batch" if variant == "batch" else "direct",
+                      compilation_key(build_standard_input()), None, None, recipients)
+    journal.set_contract(job_id, contract_address)
+    nonce = w3.eth.get_transaction_count(sender, "pending")
+    receipts = mint_batch(w3, nft_contract, recipients, nonce, private_key=private_key, chain_id=chain_id,
+                          journal=journal, job_id=job_id, variant=variant, code_hash=code_hash(artifact["bytecode"]))
+    journal.finish_job(job_id)
+    for receipt in receipts:
+        print(f"NFT minted successfully! Transaction Hash: {receipt.transactionHash.hex()}")
+    return 0
+
+def cmd_run_scheduler(args):
+    from .config import PRIVATE_KEYS, SCHEDULE_CRON, SCHEDULE_INTERVAL
+    from .jobs import resume_unfinished_jobs, wallet_job
+    from .metrics import start_metrics
+    from .scheduler import CronSchedule, IntervalSchedule, Scheduler
+
+    wallets = _wallets()
+    start_metrics()
+    try:
+        resume_unfinished_jobs()
+    except Exception as e:
+        print(f"An error occurred while resuming journaled jobs: {e}")
+    scheduler = Scheduler()
+    for address, private_key in wallets:
+        trigger = IntervalSchedule(SCHEDULE_INTERVAL) if SCHEDULE_INTERVAL else CronSchedule(SCHEDULE_CRON)
+        scheduler.add(f"deploy-and-mint:{address}", trigger, lambda key=private_key: wallet_job(key), wallet=address, run_now=True)
+    description = f"every {SCHEDULE_INTERVAL:g}s" if SCHEDULE_INTERVAL else f"on cron '{SCHEDULE_CRON}'"
+    print(f"Scheduler started for {len(PRIVATE_KEYS)} wallet(s), running {description}.")
+    try:
+        scheduler.run_forever()
+    except KeyboardInterrupt:
+        print("\nScheduler stopped by user.")
+        print(f"Scheduler metrics: {scheduler.metrics()}")
+        scheduler.stop(wait=False)
+    return 0
+
+def cmd_status(args):
+    from . import config
+
+    print(f"RPC endpoints:  {', '.join(config.RPC_ENDPOINTS)}")
+    print(f"Chain ID:       {config.CHAIN_ID}")
+    print(f"Wallets:        {len(config.PRIVATE_KEYS)} key(s) configured")
+    print(f"Mode/variant:   {config.DEPLOY_MODE} / {config.CONTRACT_VARIANT}, {config.MINT_COUNT} mint(s) per job")
+    schedule = f"every {config.SCHEDULE_INTERVAL:g}s" if config.SCHEDULE_INTERVAL else f"cron '{config.SCHEDULE_CRON}'"
+    print(f"Schedule:       {schedule}")
+    cached = [entry for entry in os.listdir(config.COMPILE_CACHE_DIR) if entry.endswith(".json")] if os.path.isdir(config.COMPILE_CACHE_DIR) else []
+    print(f"Compile cache:  {len(cached)} artifact set(s) in {config.COMPILE_CACHE_DIR}")
+    try:
+        with open(config.FACTORY_STATE_FILE) as f:
+            factories = json.load(f)
+    except (OSError, ValueError):
+        factories = {}
+    print(f"Factories:      {len(factories)} deployed")
+
+    if args.rpc:
+        from .rpc import get_web3
+
+        provider = get_web3().provider
+        for uri, latency in provider.health_check().items():
+            print(f"  {uri}: {'unreachable' if latency is None else f'{latency * 1000:.0f} ms'}")
+
+    if not os.path.exists(config.JOURNAL_PATH):
+        print("Journal:        empty")
+        return 0
+    from .journal import JobJournal
+
+    journal = JobJournal(config.JOURNAL_PATH)
+    try:
+        jobs = journal.recent_jobs(args.limit)
+    finally:
+        journal.close()
+    print(f"Journal:        {config.JOURNAL_PATH} (latest {len(jobs)} job(s))")
+    for job in jobs:
+        txs = ", ".join(f"{count} {status}" for status, count in sorted(job["txs"].items())) or "no txs"
+        collection = job["contract_address"] or "-"
+        print(f"  {job['job_id'][:12]}  {job['status']:<9} {job['mode']:<7} {len(job['recipients']):>4} token(s)  {collection}  [{txs}]")
+        if job["error"]:
+            print(f"      error: {job['error']}")
+    return 0
+
+def cmd_index(args):
+    from .config import CHAIN_ID
+    from .indexer import InventoryIndexer
+    from .journal import get_journal
+    from .rpc import get_web3
+
+    w3 = get_web3()
+    indexer = InventoryIndexer(w3, chain_id=CHAIN_ID if args.no_sync else None)
+    try:
+        if not args.no_sync:
+            tracked = indexer.track_journal(get_journal())
+            for address in args.track:
+                indexer.track(address, args.from_block)
+            head = w3.eth.block_number
+            applied = indexer.sync(head)
+            print(f"Indexed {tracked + len(args.track)} collection(s) up to block {head}: {applied} new transfer(s) "
+                  f"in {indexer.stats['log_requests']} eth_getLogs request(s).")
+        collections = indexer.collections(args.owner)
+        print(f"{'Collection':<44} {'Name':<32} {'Tokens':>6}  Synced to")
+        for collection in collections:
+            name = f"{collection['name'] or '-'} ({collection['symbol'] or '-'})"
+            print(f"{collection['address']:<44} {name:<32} {collection['tokens']:>6}  {collection['synced_to']}")
+        print(f"Total: {sum(collection['tokens'] for collection in collections)} token(s) in {len(collections)} collection(s)")
+    finally:
+        indexer.close()
+    return 0
+
+def cmd_dry_run(args):
+    from .compiler import compile_contracts, variant_artifact
+    from .config import CONTRACT_VARIANT, DEPLOY_MODE, MINT_COUNT
+    from .fees import get_fee_oracle
+    from .minting import generate_collection_name, plan_mint_calls
+    from .rpc import get_web3
+
+    sender, _ = _wallet(args)
+    artifacts = compile_contracts()
+    if artifacts is None:
+        return 1
+    w3 = get_web3()
+    mode = args.mode or DEPLOY_MODE
+    variant = args.variant or CONTRACT_VARIANT
+    count = MINT_COUNT if args.count is None else args.count
+    nonce = w3.eth.get_transaction_count(sender, "pending")
+    balance = w3.eth.get_balance(sender)
+    fees = get_fee_oracle(w3).fees(w3)
+    fee_per_gas = fees.get("maxFeePerGas", fees.get("gasPrice"))
+    print(f"Chain ID {w3.eth.chain_id}, sender {sender}, next nonce {nonce}, balance {w3.from_wei(balance, 'ether')}")
+    print(f"Fees: {fees}")
+
+    if mode == "factory":
+        print(f"Plan: factory mode, one createAndMint transaction for {count} token(s) (plus a one-time factory setup if none is recorded).")
+        return 0
+    artifact = variant_artifact(artifacts, variant)
+    contract_name, token_symbol = generate_collection_name()
+    deploy_gas = w3.eth.contract(abi=artifact["abi"], bytecode=artifact["bytecode"]).constructor(contract_name, token_symbol).estimate_gas({"from": sender})
+    calls = plan_mint_calls([sender] * count, variant)
+    print(f"Plan: deploy {contract_name} ({token_symbol}) as the {variant} variant at nonce {nonce}, "
+          f"then {len(calls)} mint transaction(s) at nonces {nonce + 1}..{nonce + len(calls)}.")
+    print(f"Deploy gas estimate: {deploy_gas} (max cost {w3.from_wei(deploy_gas * fee_per_gas, 'ether')} at current fees)")
+    print("Nothing was signed or sent.")
+    return 0
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="deploy.py", description="Compile, deploy and mint NFT collections on 0G.")
+    commands = parser.add_subparsers(dest="command")
+
+    compile_parser = commands.add_parser("compile", help="compile the embedded contracts (through the artifact cache)")
+    compile_parser.add_argument("--clear-cache", action="store_true", help="drop cached artifacts first")
+    compile_parser.set_defaults(func=cmd_compile)
+
+    for name, func, help_text in (("deploy", cmd_deploy, "deploy a new collection and mint into it"),
+                                  ("dry-run", cmd_dry_run, "show what deploy would do, without signing anything")):
+        sub = commands.add_parser(name, help=help_text)
+        sub.add_argument("--count", type=int, default=None, help="tokens to mint (default: MINT_COUNT)")
+        sub.add_argument("--mode", choices=("direct", "factory"), default=None, help="default: DEPLOY_MODE")
+        sub.add_argument("--variant", choices=("standard", "batch"), default=None, help="default: CONTRACT_VARIANT")
+        sub.add_argument("--wallet", type=int, default=0, help="index into PRIVATE_KEYS")
+        sub.set_defaults(func=func)
+
+    mint_parser = commands.add_parser("mint", help="mint more tokens on an existing collection")
+    mint_parser.add_argument("--contract", required=True, help="collection address")
+    mint_parser.add_argument("--count", type=int, default=1)
+    mint_parser.add_argument("--to", default=None, help="recipient (default: the sender)")
+    mint_parser.add_argument("--variant", choices=("standard", "batch"), default=None, help="default: CONTRACT_VARIANT")
+    mint_parser.add_argument("--wallet", type=int, default=0, help="index into PRIVATE_KEYS")
+    mint_parser.set_defaults(func=cmd_mint)
+
+    scheduler_parser = commands.add_parser("run-scheduler", help="resume journaled jobs, then deploy and mint on the schedule (default)")
+    scheduler_parser.set_defaults(func=cmd_run_scheduler)
+
+    index_parser = commands.add_parser("index", help="sync the local token inventory and list tokens per collection")
+    index_parser.add_argument("--owner", default=None, help="only count tokens held by this address")
+    index_parser.add_argument("--track", action="append", default=[], metavar="ADDRESS", help="also index this collection (repeatable)")
+    index_parser.add_argument("--from-block", type=int, default=0, help="first block to index --track collections from")
+    index_parser.add_argument("--no-sync", action="store_true", help="answer from the local index without any RPC calls")
+    index_parser.set_defaults(func=cmd_index)
+
+    status_parser = commands.add_parser("status", help="show configuration, caches and recent journaled jobs")
+    status_parser.add_argument("--limit", type=int, default=10, help="jobs to list")
+    status_parser.add_argument("--rpc", action="store_true", help="also probe every RPC endpoint")
+    status_parser.set_defaults(func=cmd_status)
+    return parser
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    # .env has to be loaded before nft_deployer.config is first imported.
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    func = getattr(args, "func", cmd_run_scheduler)
+    try:
+        return func(args)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
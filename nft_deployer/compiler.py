@@ -0,0 +1,125 @@
+import hashlib
+import json
+import os
+
+from .config import COMPILE_CACHE_DIR, CONTRACT_VARIANT, SOLC_VERSION
+from .metrics import METRICS
+
+# ==============================================================================
+# --- COMPILATION CACHE ---
+# ==============================================================================
+# Artifacts are keyed by a hash of the standard-JSON input plus the solc version,
+# so any edit to the embedded sources or settings produces a fresh compile.
+
+_compile_memo = {}
+COMPILE_CACHE_STATS = {"memory_hits": 0, "disk_hits": 0, "misses": 0}
+
+def build_standard_input():
+    from .contracts import (
+        ADDRESS_SOURCE_CODE, BATCH_NFT_SOURCE_CODE, CONTEXT_SOURCE_CODE, ERC165_SOURCE_CODE, ERC721_SOURCE_CODE,
+        FACTORY_SOURCE_CODE, IERC165_SOURCE_CODE, IERC721_METADATA_SOURCE_CODE, IERC721_RECEIVER_SOURCE_CODE,
+        IERC721_SOURCE_CODE, OWNABLE_SOURCE_CODE, SOLIDITY_SOURCE_CODE, STRINGS_SOURCE_CODE,
+    )
+
+    return {
+        "language": "Solidity",
+        "sources": {
+            "MyNFT.sol": {"content": SOLIDITY_SOURCE_CODE},
+            "MyNFTFactory.sol": {"content": FACTORY_SOURCE_CODE},
+            "MyNFTBatch.sol": {"content": BATCH_NFT_SOURCE_CODE},
+            "@openzeppelin/contracts/token/ERC721/ERC721.sol": {"content": ERC721_SOURCE_CODE},
+            "@openzeppelin/contracts/access/Ownable.sol": {"content": OWNABLE_SOURCE_CODE},
+            "@openzeppelin/contracts/utils/Context.sol": {"content": CONTEXT_SOURCE_CODE},
+            "@openzeppelin/contracts/utils/introspection/ERC165.sol": {"content": ERC165_SOURCE_CODE},
+            "@openzeppelin/contracts/utils/introspection/IERC165.sol": {"content": IERC165_SOURCE_CODE},
+            "@openzeppelin/contracts/token/ERC721/IERC721.sol": {"content": IERC721_SOURCE_CODE},
+            "@openzeppelin/contracts/token/ERC721/IERC721Receiver.sol": {"content": IERC721_RECEIVER_SOURCE_CODE},
+            "@openzeppelin/contracts/token/ERC721/IERC721Metadata.sol": {"content": IERC721_METADATA_SOURCE_CODE},
+            "@openzeppelin/contracts/utils/Address.sol": {"content": ADDRESS_SOURCE_CODE},
+            "@openzeppelin/contracts/utils/Strings.sol": {"content": STRINGS_SOURCE_CODE},
+        },
+        "settings": { "outputSelection": { "*": { "*": ["abi", "evm.bytecode"] } } },
+    }
+
+def compilation_key(standard_input, solc_version=SOLC_VERSION):
+    payload = json.dumps(standard_input, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(f"{solc_version}:{payload}".encode()).hexdigest()
+
+def _load_cached_artifacts(key):
+    path = os.path.join(COMPILE_CACHE_DIR, f"{key}.json")
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def _store_cached_artifacts(key, artifacts):
+    os.makedirs(COMPILE_CACHE_DIR, exist_ok=True)
+    path = os.path.join(COMPILE_CACHE_DIR, f"{key}.json")
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(artifacts, f)
+    os.replace(tmp_path, path)
+
+def compile_contracts(standard_input=None, solc_version=SOLC_VERSION):
+    """Return {source: {contract: {"abi", "bytecode"}}}, or None on compile errors."""
+    if standard_input is None:
+        standard_input = build_standard_input()
+    key = compilation_key(standard_input, solc_version)
+
+    if key in _compile_memo:
+        COMPILE_CACHE_STATS["memory_hits"] += 1
+        METRICS.inc("compile_cache_total", result="memory_hit")
+        return _compile_memo[key]
+
+    artifacts = _load_cached_artifacts(key)
+    if artifacts is not None:
+        COMPILE_CACHE_STATS["disk_hits"] += 1
+        METRICS.inc("compile_cache_total", result="disk_hit")
+        _compile_memo[key] = artifacts
+        return artifacts
+
+    COMPILE_CACHE_STATS["misses"] += 1
+    from solcx import compile_standard, install_solc
+
+    METRICS.inc("compile_cache_total", result="miss")
+    with METRICS.span("install_solc"):
+        install_solc(solc_version)
+    with METRICS.span("compile"):
+        compiled_sol = compile_standard(standard_input, solc_version=solc_version)
+
+    if 'errors' in compiled_sol:
+        has_errors = False
+        for error in compiled_sol['errors']:
+            if error['severity'] == 'error':
+                print(f"Solidity Compilation Error: {error['formattedMessage']}")
+                has_errors = True
+        if has_errors:
+            return None
+
+    artifacts = {
+        source: {
+            name: {"abi": contract["abi"], "bytecode": contract["evm"]["bytecode"]["object"]}
+            for name, contract in contracts.items()
+        }
+        for source, contracts in compiled_sol["contracts"].items()
+    }
+    try:
+        _store_cached_artifacts(key, artifacts)
+    except OSError as e:
+        print(f"Warning: could not write compilation cache: {e}")
+    _compile_memo[key] = artifacts
+    return artifacts
+
+def clear_compile_cache(disk=False):
+    _compile_memo.clear()
+    if disk and os.path.isdir(COMPILE_CACHE_DIR):
+        for entry in os.listdir(COMPILE_CACHE_DIR):
+            if entry.endswith(".json"):
+                os.remove(os.path.join(COMPILE_CACHE_DIR, entry))
+
+CONTRACT_VARIANTS = {"standard": ("MyNFT.sol", "MyNFT"), "batch": ("MyNFTBatch.sol", "MyNFTBatch")}
+
+def variant_artifact(artifacts, variant=None):
+    source, name = CONTRACT_VARIANTS[variant or CONTRACT_VARIANT]
+    return artifacts[source][name]
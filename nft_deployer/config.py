@@ -0,0 +1,56 @@
+import os
+
+# --- Configuration ---
+# Read from the environment once, at first import. Importing this module has no
+# other effect: the CLI loads .env before importing anything from the package,
+# and keys are only validated by the commands that sign (see require_private_keys).
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RPC_ENDPOINT = "https://evmrpc-testnet.0g.ai"
+RPC_ENDPOINTS = [uri.strip() for uri in os.getenv("RPC_ENDPOINTS", RPC_ENDPOINT).split(",") if uri.strip()]
+RPC_TIMEOUT = float(os.getenv("RPC_TIMEOUT", "30"))
+RPC_POOL_SIZE = int(os.getenv("RPC_POOL_SIZE", "10"))
+RPC_FAILURE_COOLDOWN = float(os.getenv("RPC_FAILURE_COOLDOWN", "5"))
+CHAIN_ID = 16601
+PRIVATE_KEY = os.getenv("PRIVATE_KEY")
+PRIVATE_KEYS = [key.strip() for key in os.getenv("PRIVATE_KEYS", "").split(",") if key.strip()] or ([PRIVATE_KEY] if PRIVATE_KEY else [])
+ASYNC_CONCURRENCY = int(os.getenv("ASYNC_CONCURRENCY", "8"))
+MINT_COUNT = int(os.getenv("MINT_COUNT", "1"))
+FEE_PERCENTILE = float(os.getenv("FEE_PERCENTILE", "50"))
+FEE_HISTORY_BLOCKS = int(os.getenv("FEE_HISTORY_BLOCKS", "10"))
+FEE_CACHE_TTL = float(os.getenv("FEE_CACHE_TTL", "10"))
+FEE_MIN_PRIORITY_WEI = int(os.getenv("FEE_MIN_PRIORITY_WEI", "0"))
+GAS_ESTIMATE_MARGIN = float(os.getenv("GAS_ESTIMATE_MARGIN", "0.1"))  # headroom added to every gas estimate
+GAS_CACHE_TTL = float(os.getenv("GAS_CACHE_TTL", "600"))  # seconds before a cached estimate is re-estimated; 0 disables the cache
+GAS_REVALIDATE_EVERY = int(os.getenv("GAS_REVALIDATE_EVERY", "50"))  # re-estimate after this many cache hits
+RECEIPT_CONFIRMATIONS = int(os.getenv("RECEIPT_CONFIRMATIONS", "0"))
+RECEIPT_POLL_INTERVAL = float(os.getenv("RECEIPT_POLL_INTERVAL", "0.5"))
+RECEIPT_TIMEOUT = float(os.getenv("RECEIPT_TIMEOUT", "120"))
+JOURNAL_PATH = os.getenv("JOURNAL_PATH", os.path.join(PROJECT_DIR, ".job_journal.sqlite3"))
+JOURNAL_BATCH_SIZE = int(os.getenv("JOURNAL_BATCH_SIZE", "64"))
+JOURNAL_FLUSH_INTERVAL = float(os.getenv("JOURNAL_FLUSH_INTERVAL", "1.0"))
+SCHEDULE_CRON = os.getenv("SCHEDULE_CRON", "0 9 * * *")  # daily at 09:00 local time
+SCHEDULE_INTERVAL = float(os.getenv("SCHEDULE_INTERVAL", "0"))  # seconds; overrides SCHEDULE_CRON when set
+SCHEDULER_WORKERS = int(os.getenv("SCHEDULER_WORKERS", "4"))
+SIGNING_WORKERS = int(os.getenv("SIGNING_WORKERS", str(os.cpu_count() or 1)))
+SIGNING_CHUNK_SIZE = int(os.getenv("SIGNING_CHUNK_SIZE", "64"))
+DEPLOY_MODE = os.getenv("DEPLOY_MODE", "direct")  # "direct" or "factory"
+CONTRACT_VARIANT = os.getenv("CONTRACT_VARIANT", "standard")  # "standard" (MyNFT) or "batch" (ERC721A-style MyNFTBatch)
+MINT_BATCH_MAX = int(os.getenv("MINT_BATCH_MAX", "100"))  # tokens per mintBatch call with the batch variant
+FACTORY_STATE_FILE = os.getenv("FACTORY_STATE_FILE", os.path.join(PROJECT_DIR, ".factory_deployments.json"))
+METRICS_PORT = int(os.getenv("METRICS_PORT", "0"))  # Prometheus scrape endpoint on /metrics; 0 disables it
+METRICS_ADDR = os.getenv("METRICS_ADDR", "127.0.0.1")
+METRICS_LOG = os.getenv("METRICS_LOG", "")  # JSON-lines span log; empty disables it
+INDEX_PATH = os.getenv("INDEX_PATH", os.path.join(PROJECT_DIR, ".inventory.sqlite3"))
+INDEX_REORG_DEPTH = int(os.getenv("INDEX_REORG_DEPTH", "64"))  # blocks re-checked for reorgs on every sync
+INDEX_CHUNK_SIZE = int(os.getenv("INDEX_CHUNK_SIZE", "2000"))  # initial eth_getLogs block range; adapts per response
+INDEX_MAX_CHUNK = int(os.getenv("INDEX_MAX_CHUNK", "50000"))
+INDEX_TARGET_LOGS = int(os.getenv("INDEX_TARGET_LOGS", "5000"))  # logs per response the chunk size steers towards
+SOLC_VERSION = "0.8.0"
+COMPILE_CACHE_DIR = os.getenv("COMPILE_CACHE_DIR", os.path.join(PROJECT_DIR, ".compile_cache"))
+
+
+def require_private_keys():
+    """Return the configured signing keys, or raise the setup error the commands that sign need."""
+    if not PRIVATE_KEYS:
+        raise ValueError("PRIVATE_KEY not found in .env file. Please set it.")
+    return PRIVATE_KEYS
@@ -0,0 +1,455 @@
+# ==============================================================================
+# --- SOLIDITY CODE SECTION ---
+# ==============================================================================
+
+SOLIDITY_SOURCE_CODE = """
+// SPDX-License-Identifier: MIT
+pragma solidity ^0.8.0;
+import "@openzeppelin/contracts/token/ERC721/ERC721.sol";
+import "@openzeppelin/contracts/access/Ownable.sol";
+contract MyNFT is ERC721, Ownable {
+    uint256 private _nextTokenId;
+    bool private _initialized;
+    constructor(string memory name, string memory symbol) ERC721(name, symbol) { _initialized = true; }
+    function initialize(string memory name_, string memory symbol_, address owner_) external {
+        require(!_initialized, "MyNFT: already initialized");
+        _initialized = true;
+        _initializeMetadata(name_, symbol_);
+        _setOwner(owner_);
+    }
+    function safeMint(address to) public onlyOwner {
+        uint256 tokenId = _nextTokenId++;
+        _safeMint(to, tokenId);
+    }
+}
+"""
+FACTORY_SOURCE_CODE = """
+// SPDX-License-Identifier: MIT
+pragma solidity ^0.8.0;
+import "MyNFT.sol";
+contract MyNFTFactory {
+    event CollectionCreated(address indexed collection, address indexed owner, address implementation);
+    function createAndMint(address implementation, string calldata name, string calldata symbol, address[] calldata recipients) external returns (address collection) {
+        collection = _clone(implementation);
+        MyNFT nft = MyNFT(collection);
+        nft.initialize(name, symbol, address(this));
+        for (uint256 i = 0; i < recipients.length; i++) { nft.safeMint(recipients[i]); }
+        nft.transferOwnership(msg.sender);
+        emit CollectionCreated(collection, msg.sender, implementation);
+    }
+    function _clone(address implementation) internal returns (address instance) {
+        assembly {
+            let ptr := mload(0x40)
+            mstore(ptr, 0x3d602d80600a3d3981f3363d3d373d3d3d363d73000000000000000000000000)
+            mstore(add(ptr, 0x14), shl(0x60, implementation))
+            mstore(add(ptr, 0x28), 0x5af43d82803e903d91602b57fd5bf30000000000000000000000000000000000)
+            instance := create(0, ptr, 0x37)
+        }
+        require(instance != address(0), "MyNFTFactory: clone failed");
+    }
+}
+"""
+# ERC721A-style variant: one packed ownership slot is written per batch and
+# ownerOf walks back to the nearest initialized slot, so mintBatch(to, N) costs
+# roughly one storage write set instead of N.
+BATCH_NFT_SOURCE_CODE = """
+// SPDX-License-Identifier: MIT
+pragma solidity ^0.8.0;
+import "@openzeppelin/contracts/access/Ownable.sol";
+import "@openzeppelin/contracts/utils/Context.sol";
+import "@openzeppelin/contracts/utils/Address.sol";
+import "@openzeppelin/contracts/utils/Strings.sol";
+import "@openzeppelin/contracts/utils/introspection/ERC165.sol";
+import "@openzeppelin/contracts/token/ERC721/IERC721.sol";
+import "@openzeppelin/contracts/token/ERC721/IERC721Metadata.sol";
+import "@openzeppelin/contracts/token/ERC721/IERC721Receiver.sol";
+contract MyNFTBatch is Context, ERC165, IERC721, IERC721Metadata, Ownable {
+    using Address for address;
+    using Strings for uint256;
+    struct TokenOwnership { address addr; uint64 startTimestamp; }
+    struct AddressData { uint128 balance; uint128 numberMinted; }
+    string private _name;
+    string private _symbol;
+    uint256 private _currentIndex;
+    mapping(uint256 => TokenOwnership) private _ownerships;
+    mapping(address => AddressData) private _addressData;
+    mapping(uint256 => address) private _tokenApprovals;
+    mapping(address => mapping(address => bool)) private _operatorApprovals;
+    constructor(string memory name_, string memory symbol_) {
+        _name = name_;
+        _symbol = symbol_;
+    }
+    function supportsInterface(bytes4 interfaceId) public view virtual override(ERC165, IERC165) returns (bool) {
+        return
+            interfaceId == type(IERC721).interfaceId ||
+            interfaceId == type(IERC721Metadata).interfaceId ||
+            super.supportsInterface(interfaceId);
+    }
+    function totalSupply() public view returns (uint256) { return _currentIndex; }
+    function balanceOf(address owner) public view virtual override returns (uint256) {
+        require(owner != address(0), "ERC721A: balance query for the zero address");
+        return uint256(_addressData[owner].balance);
+    }
+    function numberMinted(address owner) public view returns (uint256) { return uint256(_addressData[owner].numberMinted); }
+    function _ownershipOf(uint256 tokenId) internal view returns (TokenOwnership memory) {
+        require(_exists(tokenId), "ERC721A: owner query for nonexistent token");
+        unchecked {
+            for (uint256 curr = tokenId; ; curr--) {
+                TokenOwnership memory ownership = _ownerships[curr];
+                if (ownership.addr != address(0)) { return ownership; }
+            }
+        }
+    }
+    function ownerOf(uint256 tokenId) public view virtual override returns (address) { return _ownershipOf(tokenId).addr; }
+    function name() public view virtual override returns (string memory) { return _name; }
+    function symbol() public view virtual override returns (string memory) { return _symbol; }
+    function tokenURI(uint256 tokenId) public view virtual override returns (string memory) {
+        require(_exists(tokenId), "ERC721Metadata: URI query for nonexistent token");
+        string memory baseURI = _baseURI();
+        return bytes(baseURI).length > 0 ? string(abi.encodePacked(baseURI, tokenId.toString())) : "";
+    }
+    function _baseURI() internal view virtual returns (string memory) { return ""; }
+    function approve(address to, uint256 tokenId) public virtual override {
+        address owner = ownerOf(tokenId);
+        require(to != owner, "ERC721A: approval to current owner");
+        require(_msgSender() == owner || isApprovedForAll(owner, _msgSender()), "ERC721A: approve caller is not owner nor approved for all");
+        _approve(to, tokenId, owner);
+    }
+    function getApproved(uint256 tokenId) public view virtual override returns (address) {
+        require(_exists(tokenId), "ERC721A: approved query for nonexistent token");
+        return _tokenApprovals[tokenId];
+    }
+    function setApprovalForAll(address operator, bool approved) public virtual override {
+        require(operator != _msgSender(), "ERC721A: approve to caller");
+        _operatorApprovals[_msgSender()][operator] = approved;
+        emit ApprovalForAll(_msgSender(), operator, approved);
+    }
+    function isApprovedForAll(address owner, address operator) public view virtual override returns (bool) { return _operatorApprovals[owner][operator]; }
+    function transferFrom(address from, address to, uint256 tokenId) public virtual override { _transfer(from, to, tokenId); }
+    function safeTransferFrom(address from, address to, uint256 tokenId) public virtual override { safeTransferFrom(from, to, tokenId, ""); }
+    function safeTransferFrom(address from, address to, uint256 tokenId, bytes memory _data) public virtual override {
+        _transfer(from, to, tokenId);
+        require(_checkOnERC721Received(from, to, tokenId, _data), "ERC721A: transfer to non ERC721Receiver implementer");
+    }
+    function safeMint(address to) public onlyOwner { _safeMint(to, 1); }
+    function mintBatch(address to, uint256 quantity) public onlyOwner { _safeMint(to, quantity); }
+    function _exists(uint256 tokenId) internal view returns (bool) { return tokenId < _currentIndex; }
+    function _safeMint(address to, uint256 quantity) internal {
+        uint256 startTokenId = _currentIndex;
+        require(to != address(0), "ERC721A: mint to the zero address");
+        require(quantity != 0, "ERC721A: quantity must be greater than 0");
+        unchecked {
+            _addressData[to].balance += uint128(quantity);
+            _addressData[to].numberMinted += uint128(quantity);
+            _ownerships[startTokenId] = TokenOwnership(to, uint64(block.timestamp));
+            uint256 updatedIndex = startTokenId;
+            uint256 end = startTokenId + quantity;
+            if (to.isContract()) {
+                do {
+                    emit Transfer(address(0), to, updatedIndex);
+                    require(_checkOnERC721Received(address(0), to, updatedIndex++, ""), "ERC721A: transfer to non ERC721Receiver implementer");
+                } while (updatedIndex != end);
+                require(_currentIndex == startTokenId, "ERC721A: reentrant mint");
+            } else {
+                do { emit Transfer(address(0), to, updatedIndex++); } while (updatedIndex != end);
+            }
+            _currentIndex = updatedIndex;
+        }
+    }
+    function _transfer(address from, address to, uint256 tokenId) private {
+        TokenOwnership memory prevOwnership = _ownershipOf(tokenId);
+        require(prevOwnership.addr == from, "ERC721A: transfer of token that is not own");
+        require(to != address(0), "ERC721A: transfer to the zero address");
+        require(_msgSender() == from || isApprovedForAll(from, _msgSender()) || getApproved(tokenId) == _msgSender(), "ERC721A: transfer caller is not owner nor approved");
+        _approve(address(0), tokenId, from);
+        unchecked {
+            _addressData[from].balance -= 1;
+            _addressData[to].balance += 1;
+            _ownerships[tokenId] = TokenOwnership(to, uint64(block.timestamp));
+            // Keep the rest of the sender's run resolvable once this slot stops pointing at it.
+            uint256 nextTokenId = tokenId + 1;
+            if (_ownerships[nextTokenId].addr == address(0) && _exists(nextTokenId)) {
+                _ownerships[nextTokenId] = TokenOwnership(prevOwnership.addr, prevOwnership.startTimestamp);
+            }
+        }
+        emit Transfer(from, to, tokenId);
+    }
+    function _approve(address to, uint256 tokenId, address owner) private {
+        _tokenApprovals[tokenId] = to;
+        emit Approval(owner, to, tokenId);
+    }
+    function _checkOnERC721Received(address from, address to, uint256 tokenId, bytes memory _data) private returns (bool) {
+        if (to.isContract()) {
+            try IERC721Receiver(to).onERC721Received(_msgSender(), from, tokenId, _data) returns (bytes4 retval) {
+                return retval == IERC721Receiver.onERC721Received.selector;
+            } catch (bytes memory reason) {
+                if (reason.length == 0) {
+                    revert("ERC721A: transfer to non ERC721Receiver implementer");
+                } else { assembly { revert(add(32, reason), mload(reason)) } }
+            }
+        } else { return true; }
+    }
+}
+"""
+CONTEXT_SOURCE_CODE = """
+// SPDX-License-Identifier: MIT
+pragma solidity ^0.8.0;
+abstract contract Context {
+    function _msgSender() internal view virtual returns (address) { return msg.sender; }
+    function _msgData() internal view virtual returns (bytes calldata) { return msg.data; }
+}
+"""
+OWNABLE_SOURCE_CODE = """
+// SPDX-License-Identifier: MIT
+pragma solidity ^0.8.0;
+import "@openzeppelin/contracts/utils/Context.sol";
+abstract contract Ownable is Context {
+    address private _owner;
+    event OwnershipTransferred(address indexed previousOwner, address indexed newOwner);
+    constructor() { _setOwner(_msgSender()); }
+    function owner() public view virtual returns (address) { return _owner; }
+    modifier onlyOwner() { require(owner() == _msgSender(), "Ownable: caller is not the owner"); _; }
+    function renounceOwnership() public virtual onlyOwner { _setOwner(address(0)); }
+    function transferOwnership(address newOwner) public virtual onlyOwner { require(newOwner != address(0), "Ownable: new owner is the zero address"); _setOwner(newOwner); }
+    function _setOwner(address newOwner) internal { address oldOwner = _owner; _owner = newOwner; emit OwnershipTransferred(oldOwner, newOwner); }
+}
+"""
+IERC165_SOURCE_CODE = """
+// SPDX-License-Identifier: MIT
+pragma solidity ^0.8.0;
+interface IERC165 {
+    function supportsInterface(bytes4 interfaceId) external view returns (bool);
+}
+"""
+ERC165_SOURCE_CODE = """
+// SPDX-License-Identifier: MIT
+pragma solidity ^0.8.0;
+import "@openzeppelin/contracts/utils/introspection/IERC165.sol";
+abstract contract ERC165 is IERC165 {
+    function supportsInterface(bytes4 interfaceId) public view virtual override returns (bool) {
+        return interfaceId == type(IERC165).interfaceId;
+    }
+}
+"""
+IERC721_SOURCE_CODE = """
+// SPDX-License-Identifier: MIT
+pragma solidity ^0.8.0;
+import "@openzeppelin/contracts/utils/introspection/IERC165.sol";
+interface IERC721 is IERC165 {
+    event Transfer(address indexed from, address indexed to, uint256 indexed tokenId);
+    event Approval(address indexed owner, address indexed approved, uint256 indexed tokenId);
+    event ApprovalForAll(address indexed owner, address indexed operator, bool approved);
+    function balanceOf(address owner) external view returns (uint256 balance);
+    function ownerOf(uint256 tokenId) external view returns (address owner);
+    function safeTransferFrom(address from, address to, uint256 tokenId) external;
+    function transferFrom(address from, address to, uint256 tokenId) external;
+    function approve(address to, uint256 tokenId) external;
+    function getApproved(uint256 tokenId) external view returns (address operator);
+    function setApprovalForAll(address operator, bool _approved) external;
+    function isApprovedForAll(address owner, address operator) external view returns (bool);
+    function safeTransferFrom(address from, address to, uint256 tokenId, bytes calldata data) external;
+}
+"""
+IERC721_RECEIVER_SOURCE_CODE = """
+// SPDX-License-Identifier: MIT
+pragma solidity ^0.8.0;
+interface IERC721Receiver {
+    function onERC721Received(address operator, address from, uint256 tokenId, bytes calldata data) external returns (bytes4);
+}
+"""
+IERC721_METADATA_SOURCE_CODE = """
+// SPDX-License-Identifier: MIT
+pragma solidity ^0.8.0;
+import "@openzeppelin/contracts/token/ERC721/IERC721.sol";
+interface IERC721Metadata is IERC721 {
+    function name() external view returns (string memory);
+    function symbol() external view returns (string memory);
+    function tokenURI(uint256 tokenId) external view returns (string memory);
+}
+"""
+ADDRESS_SOURCE_CODE = """
+// SPDX-License-Identifier: MIT
+pragma solidity ^0.8.0;
+library Address {
+    function isContract(address account) internal view returns (bool) { return account.code.length > 0; }
+    function sendValue(address payable recipient, uint256 amount) internal {
+        require(address(this).balance >= amount, "Address: insufficient balance");
+        (bool success, ) = recipient.call{value: amount}("");
+        require(success, "Address: unable to send value, recipient may have reverted");
+    }
+    function functionCall(address target, bytes memory data) internal returns (bytes memory) { return functionCall(target, data, "Address: low-level call failed"); }
+    function functionCall(address target, bytes memory data, string memory errorMessage) internal returns (bytes memory) { return functionCallWithValue(target, data, 0, errorMessage); }
+    function functionCallWithValue(address target, bytes memory data, uint256 value) internal returns (bytes memory) { return functionCallWithValue(target, data, value, "Address: low-level call with value failed"); }
+    function functionCallWithValue(address target, bytes memory data, uint256 value, string memory errorMessage) internal returns (bytes memory) {
+        require(address(this).balance >= value, "Address: insufficient balance for call");
+        require(isContract(target), "Address: call to non-contract");
+        (bool success, bytes memory returndata) = target.call{value: value}(data);
+        return verifyCallResult(success, returndata, errorMessage);
+    }
+    function functionStaticCall(address target, bytes memory data) internal view returns (bytes memory) { return functionStaticCall(target, data, "Address: low-level static call failed"); }
+    function functionStaticCall(address target, bytes memory data, string memory errorMessage) internal view returns (bytes memory) {
+        require(isContract(target), "Address: static call to non-contract");
+        (bool success, bytes memory returndata) = target.staticcall(data);
+        return verifyCallResult(success, returndata, errorMessage);
+    }
+    function functionDelegateCall(address target, bytes memory data) internal returns (bytes memory) { return functionDelegateCall(target, data, "Address: low-level delegate call failed"); }
+    function functionDelegateCall(address target, bytes memory data, string memory errorMessage) internal returns (bytes memory) {
+        require(isContract(target), "Address: delegate call to non-contract");
+        (bool success, bytes memory returndata) = target.delegatecall(data);
+        return verifyCallResult(success, returndata, errorMessage);
+    }
+    function verifyCallResult(bool success, bytes memory returndata, string memory errorMessage) internal pure returns (bytes memory) {
+        if (success) { return returndata; } else { if (returndata.length > 0) { assembly { let returndata_size := mload(returndata) revert(add(32, returndata), returndata_size) } } else { revert(errorMessage); } }
+    }
+}
+"""
+STRINGS_SOURCE_CODE = """
+// SPDX-License-Identifier: MIT
+pragma solidity ^0.8.0;
+library Strings {
+    bytes16 private constant _HEX_SYMBOLS = "0123456789abcdef";
+    function toString(uint256 value) internal pure returns (string memory) {
+        if (value == 0) { return "0"; }
+        uint256 temp = value;
+        uint256 digits;
+        while (temp != 0) { digits++; temp /= 10; }
+        bytes memory buffer = new bytes(digits);
+        while (value != 0) { digits -= 1; buffer[digits] = bytes1(uint8(48 + uint256(value % 10))); value /= 10; }
+        return string(buffer);
+    }
+    function toHexString(uint256 value) internal pure returns (string memory) {
+        if (value == 0) { return "0x00"; }
+        uint256 length = 0;
+        uint256 temp = value;
+        while (temp != 0) { length++; temp >>= 8; }
+        return toHexString(value, length);
+    }
+    function toHexString(uint256 value, uint256 length) internal pure returns (string memory) {
+        bytes memory buffer = new bytes(2 * length + 2);
+        buffer[0] = "0";
+        buffer[1] = "x";
+        for (uint256 i = 2 * length + 1; i > 1; --i) { buffer[i] = _HEX_SYMBOLS[value & 0xf]; value >>= 4; }
+        return string(buffer);
+    }
+}
+"""
+ERC721_SOURCE_CODE = """
+// SPDX-License-Identifier: MIT
+pragma solidity ^0.8.0;
+import "@openzeppelin/contracts/utils/Context.sol";
+import "@openzeppelin/contracts/utils/Address.sol";
+import "@openzeppelin/contracts/utils/Strings.sol";
+import "@openzeppelin/contracts/utils/introspection/ERC165.sol";
+import "@openzeppelin/contracts/token/ERC721/IERC721.sol";
+import "@openzeppelin/contracts/token/ERC721/IERC721Metadata.sol";
+import "@openzeppelin/contracts/token/ERC721/IERC721Receiver.sol";
+contract ERC721 is Context, ERC165, IERC721, IERC721Metadata {
+    using Address for address;
+    using Strings for uint256;
+    string private _name;
+    string private _symbol;
+    mapping(uint256 => address) private _owners;
+    mapping(address => uint256) private _balances;
+    mapping(uint256 => address) private _tokenApprovals;
+    mapping(address => mapping(address => bool)) private _operatorApprovals;
+    constructor(string memory name_, string memory symbol_) {
+        _name = name_;
+        _symbol = symbol_;
+    }
+    function _initializeMetadata(string memory name_, string memory symbol_) internal virtual {
+        _name = name_;
+        _symbol = symbol_;
+    }
+    function supportsInterface(bytes4 interfaceId) public view virtual override(ERC165, IERC165) returns (bool) {
+        return
+            interfaceId == type(IERC721).interfaceId ||
+            interfaceId == type(IERC721Metadata).interfaceId ||
+            super.supportsInterface(interfaceId);
+    }
+    function balanceOf(address owner) public view virtual override returns (uint256) {
+        require(owner != address(0), "ERC721: balance query for the zero address");
+        return _balances[owner];
+    }
+    function ownerOf(uint256 tokenId) public view virtual override returns (address) {
+        address owner = _owners[tokenId];
+        require(owner != address(0), "ERC721: owner query for nonexistent token");
+        return owner;
+    }
+    function name() public view virtual override returns (string memory) { return _name; }
+    function symbol() public view virtual override returns (string memory) { return _symbol; }
+    function tokenURI(uint256 tokenId) public view virtual override returns (string memory) {
+        require(_exists(tokenId), "ERC721Metadata: URI query for nonexistent token");
+        string memory baseURI = _baseURI();
+        return bytes(baseURI).length > 0 ? string(abi.encodePacked(baseURI, tokenId.toString())) : "";
+    }
+    function _baseURI() internal view virtual returns (string memory) { return ""; }
+    function approve(address to, uint256 tokenId) public virtual override {
+        address owner = ERC721.ownerOf(tokenId);
+        require(to != owner, "ERC721: approval to current owner");
+        require(_msgSender() == owner || isApprovedForAll(owner, _msgSender()), "ERC721: approve caller is not owner nor approved for all");
+        _approve(to, tokenId);
+    }
+    function getApproved(uint256 tokenId) public view virtual override returns (address) {
+        require(_exists(tokenId), "ERC721: approved query for nonexistent token");
+        return _tokenApprovals[tokenId];
+    }
+    function setApprovalForAll(address operator, bool approved) public virtual override {
+        require(operator != _msgSender(), "ERC721: approve to caller");
+        _operatorApprovals[_msgSender()][operator] = approved;
+        emit ApprovalForAll(_msgSender(), operator, approved);
+    }
+    function isApprovedForAll(address owner, address operator) public view virtual override returns (bool) { return _operatorApprovals[owner][operator]; }
+    function transferFrom(address from, address to, uint256 tokenId) public virtual override {
+        require(ERC721.ownerOf(tokenId) == from, "ERC721: transfer of token that is not own");
+        require(to != address(0), "ERC721: transfer to the zero address");
+        _beforeTokenTransfer(from, to, tokenId);
+        _approve(address(0), tokenId);
+        _balances[from] -= 1;
+        _balances[to] += 1;
+        _owners[tokenId] = to;
+        emit Transfer(from, to, tokenId);
+    }
+    function safeTransferFrom(address from, address to, uint256 tokenId) public virtual override { safeTransferFrom(from, to, tokenId, ""); }
+    function safeTransferFrom(address from, address to, uint256 tokenId, bytes memory _data) public virtual override {
+        transferFrom(from, to, tokenId);
+        require(_checkOnERC721Received(from, to, tokenId, _data), "ERC721: transfer to non ERC721Receiver implementer");
+    }
+    function _exists(uint256 tokenId) internal view virtual returns (bool) { return _owners[tokenId] != address(0); }
+    function _safeMint(address to, uint256 tokenId) internal virtual {
+        _mint(to, tokenId);
+        require(_checkOnERC721Received(address(0), to, tokenId, ""), "ERC721: transfer to non ERC721Receiver implementer");
+    }
+    function _mint(address to, uint256 tokenId) internal virtual {
+        require(to != address(0), "ERC721: mint to the zero address");
+        require(!_exists(tokenId), "ERC721: token already minted");
+        _beforeTokenTransfer(address(0), to, tokenId);
+        _balances[to] += 1;
+        _owners[tokenId] = to;
+        emit Transfer(address(0), to, tokenId);
+    }
+    function _burn(uint256 tokenId) internal virtual {
+        address owner = ERC721.ownerOf(tokenId);
+        _beforeTokenTransfer(owner, address(0), tokenId);
+        _approve(address(0), tokenId);
+        _balances[owner] -= 1;
+        delete _owners[tokenId];
+        emit Transfer(owner, address(0), tokenId);
+    }
+    function _approve(address to, uint256 tokenId) internal virtual {
+        _tokenApprovals[tokenId] = to;
+        emit Approval(ERC721.ownerOf(tokenId), to, tokenId);
+    }
+    function _checkOnERC721Received(address from, address to, uint256 tokenId, bytes memory _data) private returns (bool) {
+        if (to.isContract()) {
+            try IERC721Receiver(to).onERC721Received(_msgSender(), from, tokenId, _data) returns (bytes4 retval) {
+                return retval == IERC721Receiver.onERC721Received.selector;
+            } catch (bytes memory reason) {
+                if (reason.length == 0) {
+                    revert("ERC721: transfer to non ERC721Receiver implementer");
+                } else { assembly { revert(add(32, reason), mload(reason)) } }
+            }
+        } else { return true; }
+    }
+    function _beforeTokenTransfer(address from, address to, uint256 tokenId) internal virtual {}
+}
+"""
@@ -0,0 +1,129 @@
+import hashlib
+import json
+import os
+import threading
+import uuid
+
+from eth_account import Account
+
+from .compiler import build_standard_input, compilation_key
+from .config import CHAIN_ID, FACTORY_STATE_FILE, PRIVATE_KEY
+from .fees import get_fee_oracle
+from .gas import argument_shape, code_hash, send_with_gas_retry
+from .journal import get_journal
+from .minting import generate_collection_name
+from .receipts import get_receipt_tracker
+from .signing import send_and_record
+
+# ==============================================================================
+# --- FACTORY MODE ---
+# ==============================================================================
+# A MyNFT implementation and an EIP-1167 clone factory are deployed once per
+# wallet and chain; afterwards every collection is a single createAndMint call
+# that clones the implementation, initializes name/symbol and mints in one tx.
+# Wallets set up concurrently merge their entries into FACTORY_STATE_FILE under
+# a lock, and addresses confirmed on chain are not checked again in-process.
+
+_factory_state_lock = threading.Lock()
+_verified_factories = {}
+
+def _load_factory_state():
+    try:
+        with open(FACTORY_STATE_FILE) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def _store_factory_state(state):
+    tmp_path = f"{FACTORY_STATE_FILE}.{os.getpid()}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(state, f, indent=2)
+    os.replace(tmp_path, FACTORY_STATE_FILE)
+
+def ensure_factory(w3, artifacts, private_key=PRIVATE_KEY, chain_id=CHAIN_ID):
+    """Return (factory_address, implementation_address), deploying them if needed."""
+    factory_address, implementation_address, _ = _ensure_factory(w3, artifacts, private_key, chain_id)
+    return factory_address, implementation_address
+
+def _ensure_factory(w3, artifacts, private_key, chain_id, nonce=None, fees=None):
+    # Also returns how many nonces the one-time setup used, so callers that
+    # already know the next nonce can carry on without asking the node again.
+    sender = Account.from_key(private_key).address
+    nft_artifact = artifacts["MyNFT.sol"]["MyNFT"]
+    factory_artifact = artifacts["MyNFTFactory.sol"]["MyNFTFactory"]
+    code_hash = hashlib.sha256((nft_artifact["bytecode"] + factory_artifact["bytecode"]).encode()).hexdigest()
+    state_key = f"{chain_id}:{sender}:{code_hash}"
+
+    known = _verified_factories.get(state_key)
+    if known:
+        return known["factory"], known["implementation"], 0
+    known = _load_factory_state().get(state_key)
+    if known and w3.eth.get_code(known["factory"]) and w3.eth.get_code(known["implementation"]):
+        _verified_factories[state_key] = known
+        return known["factory"], known["implementation"], 0
+
+    print("Deploying MyNFT implementation and clone factory (one-time setup)...")
+    tracker = get_receipt_tracker(w3).start()
+    if nonce is None:
+        nonce = w3.eth.get_transaction_count(sender, "pending")
+    if fees is None:
+        fees = get_fee_oracle(w3).fees(w3)
+    tx_hashes = []
+    for offset, (artifact, args) in enumerate([(nft_artifact, ("MyNFT Implementation", "IMPL")), (factory_artifact, ())]):
+        contract = w3.eth.contract(abi=artifact["abi"], bytecode=artifact["bytecode"])
+        transaction = contract.constructor(*args).build_transaction({
+            "chainId": chain_id, "from": sender, "nonce": nonce + offset, **fees,
+        })
+        signed_txn = w3.eth.account.sign_transaction(transaction, private_key=private_key)
+        tx_hashes.append(w3.eth.send_raw_transaction(signed_txn.rawTransaction))
+    implementation_receipt, factory_receipt = tracker.wait(tx_hashes)
+    if implementation_receipt.status != 1 or factory_receipt.status != 1:
+        raise ValueError(f"Factory setup reverted (implementation status {implementation_receipt.status}, "
+                         f"factory status {factory_receipt.status}); nothing was recorded.")
+
+    known = {"factory": factory_receipt.contractAddress, "implementation": implementation_receipt.contractAddress}
+    with _factory_state_lock:
+        # Re-read right before writing: other wallets may have finished their own setup meanwhile.
+        state = _load_factory_state()
+        state[state_key] = known
+        _store_factory_state(state)
+    _verified_factories[state_key] = known
+    print(f"Factory: {known['factory']}  Implementation: {known['implementation']}")
+    return known["factory"], known["implementation"], len(tx_hashes)
+
+def deploy_and_mint_via_factory(w3, artifacts, recipients, private_key=PRIVATE_KEY, chain_id=CHAIN_ID, journal=None, nonce=None, fees=None):
+    """nonce and fees, when the caller already fetched them, save the factory path its own round trips."""
+    if journal is None:
+        journal = get_journal()
+    sender = Account.from_key(private_key).address
+    if nonce is None:
+        nonce = w3.eth.get_transaction_count(sender, "pending")
+    if fees is None:
+        fees = get_fee_oracle(w3).fees(w3)
+    factory_address, implementation_address, used = _ensure_factory(w3, artifacts, private_key, chain_id, nonce, fees)
+    nonce += used
+    factory = w3.eth.contract(address=factory_address, abi=artifacts["MyNFTFactory.sol"]["MyNFTFactory"]["abi"])
+
+    contract_name, token_symbol = generate_collection_name()
+    print(f"Cloning collection: {contract_name} ({token_symbol}) and minting {len(recipients)} token(s)")
+    args = [implementation_address, contract_name, token_symbol, recipients]
+    call = {"from": sender, "to": factory_address, "data": factory.encodeABI(fn_name="createAndMint", args=args)}
+    gas_key = (code_hash(artifacts["MyNFTFactory.sol"]["MyNFTFactory"]["bytecode"]), call["data"][:10], argument_shape(args))
+    job_id = uuid.uuid4().hex
+    journal.start_job(job_id, sender, chain_id, "factory", compilation_key(build_standard_input()), contract_name, token_symbol, recipients)
+    tracker = get_receipt_tracker(w3).start()
+    (tx_receipt,), _ = send_with_gas_retry(
+        w3, [call], [gas_key], nonce, {"chainId": chain_id, "value": 0, **fees},
+        lambda _, transactions: send_and_record(w3, transactions, private_key, journal, job_id, "factory", tracker), "createAndMint")
+    if tx_receipt.status != 1:
+        journal.finish_job(job_id, "failed", "createAndMint reverted")
+        print(f"createAndMint reverted. TX Hash: {tx_receipt.transactionHash.hex()}")
+        return
+    created = factory.events.CollectionCreated().process_receipt(tx_receipt)
+    contract_address = created[0]["args"]["collection"]
+    journal.set_contract(job_id, contract_address)
+    journal.finish_job(job_id)
+    print(f"Collection deployed and minted! Address: {contract_address}")
+    print(f"View on Block Explorer: https://chainscan-galileo.0g.ai/tx/{tx_receipt.transactionHash.hex()}")
+    print("-" * 40)
+    return {"contract_address": contract_address, "deploy_receipt": tx_receipt, "mint_receipts": [tx_receipt]}
@@ -0,0 +1,137 @@
+import time
+
+from web3.exceptions import MethodUnavailable, Web3Exception
+
+from .config import FEE_CACHE_TTL, FEE_HISTORY_BLOCKS, FEE_MIN_PRIORITY_WEI, FEE_PERCENTILE
+from .rpc import to_int
+
+# ==============================================================================
+# --- FEE ORACLE ---
+# ==============================================================================
+# Samples eth_feeHistory once per TTL and shares the resulting EIP-1559 fees
+# across every transaction in the run. Chains without 1559 (no baseFeePerGas in
+# the history, or no eth_feeHistory at all) fall back to legacy gasPrice, and the
+# oracle stops asking; any other error only costs that one refresh.
+
+def _method_missing(error):
+    if isinstance(error, MethodUnavailable):
+        return True
+    detail = error.args[0] if error.args else error
+    if isinstance(detail, dict):
+        if detail.get("code") == -32601:
+            return True
+        detail = detail.get("message", "")
+    detail = str(detail).lower()
+    return "method not found" in detail or "does not exist" in detail or "not supported" in detail
+
+class FeeOracle:
+    def __init__(self, percentile=FEE_PERCENTILE, history_blocks=FEE_HISTORY_BLOCKS, ttl=FEE_CACHE_TTL,
+                 base_fee_multiplier=2, min_priority_fee=FEE_MIN_PRIORITY_WEI):
+        self.percentile = percentile
+        self.history_blocks = history_blocks
+        self.ttl = ttl
+        self.base_fee_multiplier = base_fee_multiplier
+        self.min_priority_fee = min_priority_fee
+        self.supports_1559 = None
+        self.stats = {"hits": 0, "refreshes": 0, "rpc_calls": 0}
+        self._cached = None
+        self._cached_at = 0.0
+
+    def _fresh(self):
+        if self._cached is not None and time.monotonic() - self._cached_at < self.ttl:
+            self.stats["hits"] += 1
+            return self._cached
+        return None
+
+    def _remember(self, fees):
+        self._cached = fees
+        self._cached_at = time.monotonic()
+        self.stats["refreshes"] += 1
+        return fees
+
+    def _fees_from_history(self, history):
+        base_fees = history.get("baseFeePerGas") or []
+        if not base_fees or not base_fees[-1]:
+            self.supports_1559 = False
+            return None
+        self.supports_1559 = True
+        rewards = sorted(block_rewards[0] for block_rewards in history.get("reward") or [] if block_rewards)
+        priority_fee = max(rewards[len(rewards) // 2] if rewards else 0, self.min_priority_fee)
+        # The last baseFeePerGas entry is the base fee of the next (pending) block.
+        return {
+            "maxFeePerGas": base_fees[-1] * self.base_fee_multiplier + priority_fee,
+            "maxPriorityFeePerGas": priority_fee,
+        }
+
+    def refresh_request(self):
+        """The (method, params) that would refresh the cache, or None while cached fees are fresh."""
+        if self._cached is not None and time.monotonic() - self._cached_at < self.ttl:
+            return None
+        if self.supports_1559 is False:
+            return ("eth_gasPrice", [])
+        return ("eth_feeHistory", [hex(self.history_blocks), "latest", [self.percentile]])
+
+    def accept(self, method, result):
+        """Feed the result of refresh_request() fetched elsewhere (e.g. in a batch); None if unusable."""
+        self.stats["rpc_calls"] += 1
+        if isinstance(result, Exception):
+            if method == "eth_feeHistory" and _method_missing(result):
+                self.supports_1559 = False
+            return None
+        if method == "eth_gasPrice":
+            return self._remember({"gasPrice": to_int(result)})
+        fees = self._fees_from_history({
+            "baseFeePerGas": [to_int(value) for value in result.get("baseFeePerGas") or []],
+            "reward": [[to_int(value) for value in rewards] for rewards in result.get("reward") or []],
+        })
+        return self._remember(fees) if fees is not None else None
+
+    def fees(self, w3):
+        """Return the fee fields ({"maxFeePerGas", ...} or {"gasPrice"}) for a transaction."""
+        cached = self._fresh()
+        if cached is not None:
+            return cached
+        fees = None
+        if self.supports_1559 is not False:
+            self.stats["rpc_calls"] += 1
+            try:
+                fees = self._fees_from_history(w3.eth.fee_history(self.history_blocks, "latest", [self.percentile]))
+            except (ValueError, Web3Exception) as e:
+                if not _method_missing(e):
+                    # A one-off failure: price this call legacy, but don't cache it.
+                    self.stats["rpc_calls"] += 1
+                    return {"gasPrice": w3.eth.gas_price}
+                self.supports_1559 = False
+        if fees is None:
+            self.stats["rpc_calls"] += 1
+            fees = {"gasPrice": w3.eth.gas_price}
+        return self._remember(fees)
+
+    async def fees_async(self, w3):
+        cached = self._fresh()
+        if cached is not None:
+            return cached
+        fees = None
+        if self.supports_1559 is not False:
+            self.stats["rpc_calls"] += 1
+            try:
+                fees = self._fees_from_history(await w3.eth.fee_history(self.history_blocks, "latest", [self.percentile]))
+            except (ValueError, Web3Exception) as e:
+                if not _method_missing(e):
+                    # A one-off failure: price this call legacy, but don't cache it.
+                    self.stats["rpc_calls"] += 1
+                    return {"gasPrice": await w3.eth.gas_price}
+                self.supports_1559 = False
+        if fees is None:
+            self.stats["rpc_calls"] += 1
+            fees = {"gasPrice": await w3.eth.gas_price}
+        return self._remember(fees)
+
+_fee_oracles = {}
+
+def get_fee_oracle(w3):
+    """One shared oracle per RPC endpoint, so fees are reused across jobs in a run."""
+    key = getattr(w3.provider, "endpoint_uri", None) or id(w3.provider)
+    if key not in _fee_oracles:
+        _fee_oracles[key] = FeeOracle()
+    return _fee_oracles[key]
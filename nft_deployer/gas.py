@@ -0,0 +1,153 @@
+import hashlib
+import time
+
+from .config import GAS_CACHE_TTL, GAS_ESTIMATE_MARGIN, GAS_REVALIDATE_EVERY
+from .metrics import METRICS
+
+# ==============================================================================
+# --- GAS ESTIMATE CACHE ---
+# ==============================================================================
+# eth_estimateGas for the same bytecode, function and argument shape returns
+# the same number run after run, so estimates are cached under
+# (code hash, selector, shape) with a safety margin on top. Entries are
+# re-estimated after GAS_REVALIDATE_EVERY hits or GAS_CACHE_TTL seconds, and a
+# transaction that runs out of gas on a cached limit drops the entry so the
+# retry is estimated live. send_with_gas_retry() is that send-and-retry loop,
+# shared by every deploy, createAndMint and mint path.
+
+def code_hash(bytecode):
+    return hashlib.sha256(bytecode.encode() if isinstance(bytecode, str) else bytes(bytecode)).hexdigest()[:16]
+
+def argument_shape(args):
+    """What the gas cost depends on: 32-byte word counts of dynamic values, list lengths and integer values."""
+    shape = []
+    for arg in args:
+        if isinstance(arg, str) and arg.startswith("0x") and len(arg) == 42:
+            shape.append("address")
+        elif isinstance(arg, (str, bytes)):
+            size = len(arg.encode()) if isinstance(arg, str) else len(arg)
+            shape.append(("bytes", (size + 31) // 32))
+        elif isinstance(arg, (list, tuple)):
+            shape.append(("list", len(arg)))
+        else:
+            shape.append(arg)
+    return tuple(shape)
+
+def ran_out_of_gas(receipt, gas_limit):
+    # A top-level out-of-gas burns the whole limit; an out-of-gas inside a call
+    # reverts with at least the 63/64 the callee was given already spent.
+    return receipt.status == 0 and receipt.gasUsed * 64 >= gas_limit * 63
+
+class GasEstimateCache:
+    def __init__(self, margin=GAS_ESTIMATE_MARGIN, ttl=GAS_CACHE_TTL, revalidate_every=GAS_REVALIDATE_EVERY):
+        self.margin = margin
+        self.ttl = ttl
+        self.revalidate_every = revalidate_every
+        self.stats = {"hits": 0, "misses": 0, "revalidations": 0, "fallbacks": 0}
+        self._entries = {}
+
+    @property
+    def hit_rate(self):
+        lookups = self.stats["hits"] + self.stats["misses"] + self.stats["revalidations"]
+        return self.stats["hits"] / lookups if lookups else 0.0
+
+    def _cached(self, key):
+        entry = self._entries.get(key)
+        if entry is None:
+            self.stats["misses"] += 1
+            METRICS.inc("gas_cache_total", result="miss")
+            return None
+        if self.ttl <= 0 or entry["hits"] >= self.revalidate_every or time.monotonic() - entry["at"] >= self.ttl:
+            self.stats["revalidations"] += 1
+            METRICS.inc("gas_cache_total", result="revalidate")
+            return None
+        entry["hits"] += 1
+        self.stats["hits"] += 1
+        METRICS.inc("gas_cache_total", result="hit")
+        return entry["limit"]
+
+    def _remember(self, key, estimate):
+        limit = int(estimate * (1 + self.margin))
+        self._entries[key] = {"limit": limit, "estimate": estimate, "hits": 0, "at": time.monotonic()}
+        return limit
+
+    def estimate(self, w3, transaction, key):
+        """Gas limit for transaction ({"from", "to"?, "data"}); key is (code_hash, selector, shape)."""
+        limit = self._cached(key)
+        if limit is not None:
+            return limit
+        with METRICS.span("estimate_gas"):
+            return self._remember(key, w3.eth.estimate_gas(transaction))
+
+    async def estimate_async(self, w3, transaction, key):
+        limit = self._cached(key)
+        if limit is not None:
+            return limit
+        with METRICS.span("estimate_gas"):
+            return self._remember(key, await w3.eth.estimate_gas(transaction))
+
+    def invalidate(self, key):
+        """Drop an entry whose limit proved too low; the next lookup estimates live."""
+        if self._entries.pop(key, None) is not None:
+            self.stats["fallbacks"] += 1
+            METRICS.inc("gas_cache_total", result="fallback")
+
+    def clear(self):
+        self._entries.clear()
+
+_gas_caches = {}
+
+def get_gas_cache(w3):
+    """One shared cache per RPC endpoint, like the fee oracle."""
+    key = getattr(w3.provider, "endpoint_uri", None) or id(w3.provider)
+    if key not in _gas_caches:
+        _gas_caches[key] = GasEstimateCache()
+    return _gas_caches[key]
+
+def _retry_out_of_gas(gas_cache, receipts, transactions, gas_keys, label):
+    """Indexes of the transactions that ran out of gas; their cache entries are dropped."""
+    out_of_gas = [index for index, receipt in enumerate(receipts) if ran_out_of_gas(receipt, transactions[index]["gas"])]
+    if out_of_gas:
+        print(f"{len(out_of_gas)} {label}(s) ran out of gas on a cached limit; re-estimating and sending again...")
+        for index in out_of_gas:
+            gas_cache.invalidate(gas_keys[index])
+    return out_of_gas
+
+def send_with_gas_retry(w3, calls, gas_keys, nonce, fields, send, label="transaction"):
+    """Send calls at consecutive nonces from nonce, with gas limits from the shared cache.
+
+    calls are {"from", "to"?, "data"} dicts and fields the rest of every transaction
+    (chainId, value, fees). send(indexes, transactions) signs, journals, broadcasts
+    and waits, returning receipts in order. A call that ran out of gas is estimated
+    live and sent once more at the next free nonce. Returns (receipts, next_nonce),
+    with each retry's receipt in place of the failed attempt.
+    """
+    gas_cache = get_gas_cache(w3)
+    transactions = [dict(call, nonce=nonce + offset, gas=gas_cache.estimate(w3, call, key), **fields)
+                    for offset, (call, key) in enumerate(zip(calls, gas_keys))]
+    receipts = list(send(range(len(calls)), transactions))
+    nonce += len(transactions)
+    out_of_gas = _retry_out_of_gas(gas_cache, receipts, transactions, gas_keys, label)
+    if out_of_gas:
+        retry_txns = [dict(transactions[index], nonce=nonce + offset, gas=gas_cache.estimate(w3, calls[index], gas_keys[index]))
+                      for offset, index in enumerate(out_of_gas)]
+        for index, receipt in zip(out_of_gas, send(out_of_gas, retry_txns)):
+            receipts[index] = receipt
+        nonce += len(retry_txns)
+    return receipts, nonce
+
+async def send_with_gas_retry_async(w3, calls, gas_keys, nonce, fields, send, label="transaction"):
+    """send_with_gas_retry() for AsyncWeb3; send is a coroutine function."""
+    gas_cache = get_gas_cache(w3)
+    transactions = [dict(call, nonce=nonce + offset, gas=await gas_cache.estimate_async(w3, call, key), **fields)
+                    for offset, (call, key) in enumerate(zip(calls, gas_keys))]
+    receipts = list(await send(range(len(calls)), transactions))
+    nonce += len(transactions)
+    out_of_gas = _retry_out_of_gas(gas_cache, receipts, transactions, gas_keys, label)
+    if out_of_gas:
+        retry_txns = [dict(transactions[index], nonce=nonce + offset, gas=await gas_cache.estimate_async(w3, calls[index], gas_keys[index]))
+                      for offset, index in enumerate(out_of_gas)]
+        for index, receipt in zip(out_of_gas, await send(out_of_gas, retry_txns)):
+            receipts[index] = receipt
+        nonce += len(retry_txns)
+    return receipts, nonce
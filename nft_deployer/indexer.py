@@ -0,0 +1,269 @@
+import sqlite3
+import threading
+
+from web3 import Web3
+from web3.exceptions import Web3Exception
+
+from .config import INDEX_CHUNK_SIZE, INDEX_MAX_CHUNK, INDEX_PATH, INDEX_REORG_DEPTH, INDEX_TARGET_LOGS
+from .metrics import METRICS
+from .rpc import batch_call
+
+# ==============================================================================
+# --- INVENTORY INDEXER ---
+# ==============================================================================
+# Local SQLite record of every collection our jobs deployed and every Transfer
+# on it, so "which tokens do we hold" is answered without ownerOf/balanceOf
+# calls. Transfer logs for all tracked collections come in bulk from
+# eth_getLogs; the block range per request grows while responses stay small and
+# halves when the node rejects it or times out. Each collection remembers the
+# block it is synced to, so reruns only fetch new blocks, and the hashes of the
+# last INDEX_REORG_DEPTH blocks are kept to roll the index back past a reorg.
+
+TRANSFER_TOPIC = "0xddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef"  # Transfer(address,address,uint256)
+ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
+
+def _hex(value):
+    return value.lower() if isinstance(value, str) else "0x" + bytes(value).hex()
+
+class InventoryIndexer:
+    def __init__(self, w3, chain_id=None, path=INDEX_PATH, reorg_depth=INDEX_REORG_DEPTH, chunk_size=INDEX_CHUNK_SIZE,
+                 max_chunk=INDEX_MAX_CHUNK, target_logs=INDEX_TARGET_LOGS):
+        self.w3 = w3
+        self.chain_id = w3.eth.chain_id if chain_id is None else chain_id
+        self.path = path
+        self.reorg_depth = reorg_depth
+        self.chunk_size = chunk_size
+        self.max_chunk = max_chunk
+        # Largest range not yet rejected; growth stops below a range the node refused.
+        self.range_ceiling = max_chunk
+        self.target_logs = target_logs
+        self.stats = {"log_requests": 0, "logs": 0, "split_ranges": 0, "reorgs": 0}
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS collections (
+                chain_id INTEGER, address TEXT, name TEXT, symbol TEXT, deployer TEXT, job_id TEXT,
+                start_block INTEGER, synced_to INTEGER, PRIMARY KEY (chain_id, address)
+            );
+            CREATE TABLE IF NOT EXISTS transfers (
+                chain_id INTEGER, block_number INTEGER, log_index INTEGER, address TEXT, token_id INTEGER,
+                from_address TEXT, to_address TEXT, tx_hash TEXT, PRIMARY KEY (chain_id, block_number, log_index)
+            );
+            CREATE TABLE IF NOT EXISTS tokens (
+                chain_id INTEGER, address TEXT, token_id INTEGER, owner TEXT, block_number INTEGER, log_index INTEGER,
+                PRIMARY KEY (chain_id, address, token_id)
+            );
+            CREATE TABLE IF NOT EXISTS blocks (chain_id INTEGER, number INTEGER, hash TEXT, PRIMARY KEY (chain_id, number));
+            CREATE INDEX IF NOT EXISTS transfers_by_token ON transfers (chain_id, address, token_id);
+            CREATE INDEX IF NOT EXISTS tokens_by_owner ON tokens (chain_id, owner);
+        """)
+
+    def close(self):
+        self._conn.close()
+
+    def _transaction(self, statements):
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                for sql, params in statements:
+                    if isinstance(params, list):
+                        self._conn.executemany(sql, params)
+                    else:
+                        self._conn.execute(sql, params)
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def _query(self, sql, params=()):
+        with self._lock:
+            return [dict(row) for row in self._conn.execute(sql, params)]
+
+    # --- Tracking ---
+
+    def track(self, address, start_block=0, name=None, symbol=None, deployer=None, job_id=None):
+        """Index address from start_block on; tracking it again with an earlier block backfills the gap."""
+        self._transaction([(
+            "INSERT INTO collections (chain_id, address, name, symbol, deployer, job_id, start_block, synced_to) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?) ON CONFLICT (chain_id, address) DO UPDATE SET "
+            "name = COALESCE(collections.name, excluded.name), symbol = COALESCE(collections.symbol, excluded.symbol), "
+            "deployer = COALESCE(collections.deployer, excluded.deployer), job_id = COALESCE(collections.job_id, excluded.job_id), "
+            "synced_to = CASE WHEN excluded.start_block < collections.start_block THEN MIN(collections.synced_to, excluded.synced_to) "
+            "ELSE collections.synced_to END, start_block = MIN(collections.start_block, excluded.start_block)",
+            (self.chain_id, Web3.to_checksum_address(address), name, symbol, deployer, job_id, start_block, start_block - 1),
+        )])
+
+    def track_journal(self, journal):
+        """Track every collection the job journal recorded on this chain; returns how many there are."""
+        jobs = journal.deployed_collections(self.chain_id)
+        for job in jobs:
+            self.track(job["contract_address"], job["first_block"] or 0, job["name"], job["symbol"], job["sender"], job["job_id"])
+        return len(jobs)
+
+    # --- Sync ---
+
+    def sync(self, head=None):
+        """Fetch Transfer logs up to head (default: latest block); returns the number of logs applied."""
+        with METRICS.span("index"):
+            if head is None:
+                head = self.w3.eth.block_number
+            self._check_reorg()
+            pending = {row["address"]: row["synced_to"] for row in self._query(
+                "SELECT address, synced_to FROM collections WHERE chain_id = ? AND synced_to < ?", (self.chain_id, head))}
+            applied = 0
+            while pending:
+                from_block = min(pending.values()) + 1
+                to_block = min(head, from_block + self.chunk_size - 1)
+                # Collections further ahead are fetched again for the overlap; applying a log twice is a no-op.
+                addresses = sorted(address for address, synced_to in pending.items() if synced_to < to_block)
+                try:
+                    logs = self._get_logs(from_block, to_block, addresses)
+                except (ValueError, Web3Exception, OSError) as e:
+                    size = to_block - from_block + 1
+                    if size == 1:
+                        raise
+                    self.range_ceiling = size - 1
+                    self.chunk_size = max(1, size // 2)
+                    self.stats["split_ranges"] += 1
+                    METRICS.inc("index_log_requests_total", result="split")
+                    print(f"eth_getLogs over blocks {from_block}..{to_block} failed ({e}); retrying with {self.chunk_size}-block ranges.")
+                    continue
+                self._apply(logs, addresses, to_block, head)
+                applied += len(logs)
+                for address in addresses:
+                    pending[address] = to_block
+                    if to_block >= head:
+                        del pending[address]
+                if len(logs) > self.target_logs:
+                    self.chunk_size = max(1, self.chunk_size // 2)
+                elif len(logs) < self.target_logs // 2:
+                    self.chunk_size = min(self.range_ceiling, self.chunk_size * 2)
+            self._record_blocks(head)
+            return applied
+
+    def _get_logs(self, from_block, to_block, addresses):
+        self.stats["log_requests"] += 1
+        logs = self.w3.eth.get_logs({"fromBlock": from_block, "toBlock": to_block, "address": addresses, "topics": [TRANSFER_TOPIC]})
+        METRICS.inc("index_log_requests_total", result="ok")
+        return logs
+
+    def _apply(self, logs, addresses, to_block, head):
+        transfers, tokens, blocks = [], [], []
+        for log in logs:
+            # ERC-20 Transfer shares the topic but indexes only two arguments.
+            if len(log["topics"]) != 4:
+                continue
+            address = Web3.to_checksum_address(log["address"])
+            token_id = int.from_bytes(bytes(log["topics"][3]), "big")
+            sender = Web3.to_checksum_address(bytes(log["topics"][1])[-20:])
+            receiver = Web3.to_checksum_address(bytes(log["topics"][2])[-20:])
+            transfers.append((self.chain_id, log["blockNumber"], log["logIndex"], address, token_id, sender, receiver, _hex(log["transactionHash"])))
+            tokens.append((self.chain_id, address, token_id, receiver, log["blockNumber"], log["logIndex"]))
+            if log["blockNumber"] > head - self.reorg_depth:
+                blocks.append((self.chain_id, log["blockNumber"], _hex(log["blockHash"])))
+        self.stats["logs"] += len(transfers)
+        METRICS.inc("index_logs_total", len(transfers))
+        placeholders = ", ".join("?" * len(addresses))
+        self._transaction([
+            ("INSERT OR IGNORE INTO transfers VALUES (?, ?, ?, ?, ?, ?, ?, ?)", transfers),
+            # Owner is whoever received the latest transfer, so replays and out-of-order chunks are harmless.
+            ("INSERT INTO tokens VALUES (?, ?, ?, ?, ?, ?) ON CONFLICT (chain_id, address, token_id) DO UPDATE SET "
+             "owner = excluded.owner, block_number = excluded.block_number, log_index = excluded.log_index "
+             "WHERE excluded.block_number > tokens.block_number OR "
+             "(excluded.block_number = tokens.block_number AND excluded.log_index > tokens.log_index)", tokens),
+            ("INSERT OR REPLACE INTO blocks VALUES (?, ?, ?)", blocks),
+            (f"UPDATE collections SET synced_to = ? WHERE chain_id = ? AND synced_to < ? AND address IN ({placeholders})",
+             (to_block, self.chain_id, to_block, *addresses)),
+        ])
+
+    # --- Reorgs ---
+
+    def _block_hashes(self, numbers):
+        """Return ({number: hash} for every block fetched, [numbers whose lookup failed])."""
+        results = batch_call(self.w3, [("eth_getBlockByNumber", [hex(number), False]) for number in numbers])
+        hashes, failed = {}, []
+        for number, block in zip(numbers, results):
+            if isinstance(block, Exception):
+                failed.append(number)
+            elif block:
+                hashes[number] = _hex(block["hash"])
+        return hashes, failed
+
+    def _record_blocks(self, head):
+        low = max(0, head - self.reorg_depth + 1)
+        known = {row["number"] for row in self._query("SELECT number FROM blocks WHERE chain_id = ? AND number >= ?", (self.chain_id, low))}
+        missing = [number for number in range(low, head + 1) if number not in known]
+        # Blocks whose lookup failed stay missing and are fetched again on the next sync.
+        hashes = self._block_hashes(missing)[0] if missing else {}
+        self._transaction([
+            ("INSERT OR REPLACE INTO blocks VALUES (?, ?, ?)", [(self.chain_id, number, block_hash) for number, block_hash in hashes.items()]),
+            ("DELETE FROM blocks WHERE chain_id = ? AND number < ?", (self.chain_id, low)),
+        ])
+
+    def _check_reorg(self):
+        stored = self._query("SELECT number, hash FROM blocks WHERE chain_id = ? ORDER BY number DESC", (self.chain_id,))
+        if not stored:
+            return
+        current, failed = self._block_hashes([row["number"] for row in stored])
+        if failed:
+            # A failed lookup says nothing about the chain; syncing on top of an unchecked index could keep orphaned transfers.
+            raise ValueError(f"Could not fetch {len(failed)} block hash(es) for the reorg check (e.g. block {failed[0]}); try again later.")
+        # Only blocks the node returned are compared; one it does not have yet (a lagging endpoint) is no evidence of a reorg.
+        fetched = [row for row in stored if row["number"] in current]
+        if all(current[row["number"]] == row["hash"] for row in fetched):
+            return
+        fork = next((row["number"] for row in fetched if current[row["number"]] == row["hash"]), None)
+        if fork is None:
+            fork = -1
+            print(f"Reorg deeper than {self.reorg_depth} blocks; re-indexing every collection from its first block.")
+        else:
+            print(f"Reorg detected above block {fork}; rolling the index back.")
+        self.stats["reorgs"] += 1
+        METRICS.inc("index_reorgs_total")
+        self.rollback(fork)
+
+    def rollback(self, block_number):
+        """Forget every transfer after block_number and re-derive the owners those transfers touched."""
+        affected = self._query("SELECT DISTINCT address, token_id FROM transfers WHERE chain_id = ? AND block_number > ?",
+                               (self.chain_id, block_number))
+        statements = [("DELETE FROM transfers WHERE chain_id = ? AND block_number > ?", (self.chain_id, block_number))]
+        for token in affected:
+            key = (self.chain_id, token["address"], token["token_id"])
+            statements.append(("DELETE FROM tokens WHERE chain_id = ? AND address = ? AND token_id = ?", key))
+            statements.append((
+                "INSERT INTO tokens SELECT chain_id, address, token_id, to_address, block_number, log_index FROM transfers "
+                "WHERE chain_id = ? AND address = ? AND token_id = ? ORDER BY block_number DESC, log_index DESC LIMIT 1", key))
+        statements.append(("UPDATE collections SET synced_to = MAX(start_block - 1, MIN(synced_to, ?)) WHERE chain_id = ?",
+                           (block_number, self.chain_id)))
+        statements.append(("DELETE FROM blocks WHERE chain_id = ? AND number > ?", (self.chain_id, block_number)))
+        self._transaction(statements)
+
+    # --- Queries ---
+
+    def collections(self, owner=None):
+        """Tracked collections with their live token count (held by owner, if given)."""
+        owner_filter, params = ("AND t.owner = ?", (Web3.to_checksum_address(owner),)) if owner else ("", ())
+        return self._query(
+            "SELECT c.address, c.name, c.symbol, c.deployer, c.start_block, c.synced_to, COUNT(t.token_id) AS tokens "
+            f"FROM collections c LEFT JOIN tokens t ON t.chain_id = c.chain_id AND t.address = c.address AND t.owner != ? {owner_filter} "
+            "WHERE c.chain_id = ? GROUP BY c.address ORDER BY c.start_block, c.address",
+            (ZERO_ADDRESS, *params, self.chain_id))
+
+    def tokens_per_collection(self, owner=None):
+        return {collection["address"]: collection["tokens"] for collection in self.collections(owner)}
+
+    def tokens(self, address=None, owner=None):
+        """(collection, token_id, owner) rows for live (unburned) tokens, optionally filtered."""
+        sql, params = "SELECT address, token_id, owner FROM tokens WHERE chain_id = ? AND owner != ?", [self.chain_id, ZERO_ADDRESS]
+        if address:
+            sql, params = sql + " AND address = ?", params + [Web3.to_checksum_address(address)]
+        if owner:
+            sql, params = sql + " AND owner = ?", params + [Web3.to_checksum_address(owner)]
+        return [(row["address"], row["token_id"], row["owner"]) for row in self._query(sql + " ORDER BY address, token_id", params)]
+
+    def owner_of(self, address, token_id):
+        rows = self._query("SELECT owner FROM tokens WHERE chain_id = ? AND address = ? AND token_id = ?",
+                           (self.chain_id, Web3.to_checksum_address(address), token_id))
+        return rows[0]["owner"] if rows and rows[0]["owner"] != ZERO_ADDRESS else None
@@ -0,0 +1,264 @@
+import time
+import uuid
+from collections import Counter
+
+from eth_account import Account
+from web3.exceptions import TransactionNotFound
+
+from .compiler import build_standard_input, compilation_key, compile_contracts, variant_artifact
+from .config import CHAIN_ID, CONTRACT_VARIANT, DEPLOY_MODE, MINT_COUNT, PRIVATE_KEY, PRIVATE_KEYS
+from .factory import deploy_and_mint_via_factory
+from .fees import get_fee_oracle
+from .gas import argument_shape, code_hash, send_with_gas_retry
+from .journal import get_journal
+from .metrics import METRICS
+from .minting import generate_collection_name, mint_batch
+from .receipts import get_receipt_tracker
+from .rpc import batch_call, get_web3, to_int
+from .signing import NonceAlreadyUsed, broadcast_raw, send_and_record
+
+# ==============================================================================
+# --- DEPLOY AND MINT JOBS ---
+# ==============================================================================
+# One job deploys a collection (directly or through the factory) and mints into
+# it; resume_unfinished_jobs() finishes whatever a previous process journaled.
+
+def deploy_and_mint(w3=None, private_key=PRIVATE_KEY, chain_id=CHAIN_ID, mint_count=None, recipients=None, mode=None, journal=None,
+                    variant=None):
+    if journal is None:
+        journal = get_journal()
+    if w3 is None:
+        w3 = get_web3()
+    sender = Account.from_key(private_key).address
+
+    # Chain id, nonce, head and (when the cache is stale) fee data in one round trip.
+    oracle = get_fee_oracle(w3)
+    fee_call = oracle.refresh_request()
+    calls = [("eth_chainId", []), ("eth_getTransactionCount", [sender, "pending"]), ("eth_blockNumber", [])]
+    try:
+        with METRICS.span("preflight"):
+            results = batch_call(w3, calls + ([fee_call] if fee_call else []))
+        connected = not isinstance(results[0], Exception)
+    except OSError:
+        connected = False
+    if not connected:
+        print("Failed to connect to the blockchain.")
+        return
+    # A failed fee lookup falls back to oracle.fees() below; the nonce and head have no fallback.
+    errors = [f"{method}: {result}" for (method, _), result in zip(calls, results) if isinstance(result, Exception)]
+    if errors:
+        print(f"Preflight failed ({'; '.join(errors)}).")
+        return
+    print(f"Connected to blockchain. Chain ID: {to_int(results[0])}")
+    artifacts = compile_contracts()
+    if artifacts is None:
+        return
+
+    if recipients is None:
+        recipients = [sender] * (MINT_COUNT if mint_count is None else mint_count)
+    nonce = to_int(results[1])
+    fees = oracle.accept(fee_call[0], results[3]) if fee_call else None
+    if fees is None:
+        with METRICS.span("fees"):
+            fees = oracle.fees(w3)
+    if (mode or DEPLOY_MODE) == "factory":
+        return deploy_and_mint_via_factory(w3, artifacts, recipients, private_key=private_key, chain_id=chain_id, journal=journal,
+                                           nonce=nonce, fees=fees)
+    variant = variant or CONTRACT_VARIANT
+    bytecode = variant_artifact(artifacts, variant)["bytecode"]
+    abi = variant_artifact(artifacts, variant)["abi"]
+
+    contract_name, token_symbol = generate_collection_name()
+    
+    print(f"Compilation successful. Deploying contract: {contract_name} ({token_symbol})")
+    
+    MyNFT = w3.eth.contract(abi=abi, bytecode=bytecode)
+    tracker = get_receipt_tracker(w3).start(block_number=to_int(results[2]))
+    constructor = MyNFT.constructor(contract_name, token_symbol)
+    gas_key = (code_hash(bytecode), "constructor", argument_shape([contract_name, token_symbol]))
+    
+    job_id = uuid.uuid4().hex
+    journal_mode = "batch" if variant == "batch" else "direct"
+    journal.start_job(job_id, sender, chain_id, journal_mode, compilation_key(build_standard_input()), contract_name, token_symbol, recipients)
+    print("Deploying contract, waiting for receipt...")
+    (tx_receipt,), nonce = send_with_gas_retry(
+        w3, [{"from": sender, "data": constructor.data_in_transaction}], [gas_key], nonce, {"chainId": chain_id, "value": 0, **fees},
+        lambda _, transactions: send_and_record(w3, transactions, private_key, journal, job_id, "deploy", tracker), "deployment")
+    if tx_receipt.status != 1:
+        journal.finish_job(job_id, "failed", "deployment reverted")
+        print(f"Deployment reverted. TX Hash: {tx_receipt.transactionHash.hex()}")
+        return
+    contract_address = tx_receipt.contractAddress
+    print(f"Contract deployed! Address: {contract_address}")
+    print(f"View on Block Explorer: https://chainscan-galileo.0g.ai/address/{contract_address}")
+    
+    nft_contract = w3.eth.contract(address=contract_address, abi=abi)
+    mint_receipts = mint_batch(w3, nft_contract, recipients, nonce, private_key=private_key, chain_id=chain_id, fees=fees, tracker=tracker,
+                               journal=journal, job_id=job_id, variant=variant, code_hash=code_hash(bytecode))
+    journal.finish_job(job_id)
+    for mint_tx_receipt in mint_receipts:
+        print(f"NFT minted successfully! Transaction Hash: {mint_tx_receipt.transactionHash.hex()}")
+        print(f"View on Block Explorer: https://chainscan-galileo.0g.ai/tx/{mint_tx_receipt.transactionHash.hex()}")
+    print("-" * 40)
+    return {"contract_address": contract_address, "deploy_receipt": tx_receipt, "mint_receipts": mint_receipts}
+
+def _rebroadcast_journaled_txs(w3, journal, job):
+    """Re-send the stored bytes of every journaled tx of job not known to be mined, in nonce order.
+
+    Returns (receipts already available, hashes now waiting to be mined).
+    """
+    receipts, waiting, dropped = {}, [], []
+    for tx in sorted((tx for tx in job["txs"] if tx["status"] in ("signed", "sent")), key=lambda tx: tx["nonce"]):
+        try:
+            receipts[tx["tx_hash"]] = w3.eth.get_transaction_receipt(tx["tx_hash"])
+            continue
+        except TransactionNotFound:
+            pass
+        try:
+            broadcast_raw(w3, tx["raw_tx"])
+        except NonceAlreadyUsed:
+            try:
+                # Mined between the lookup and the re-send?
+                receipts[tx["tx_hash"]] = w3.eth.get_transaction_receipt(tx["tx_hash"])
+            except TransactionNotFound:
+                # Another tx took the nonce (e.g. a later job after a broadcaster failure).
+                tx["status"] = "dropped"
+                dropped.append(tx["tx_hash"])
+            continue
+        waiting.append(tx["tx_hash"])
+    if dropped:
+        print(f"[{job['job_id']}] {len(dropped)} journaled transaction(s) lost their nonce to another transaction; marked dropped.")
+        journal.mark_dropped(dropped)
+    if waiting:
+        journal.mark_sent(waiting)
+    return receipts, waiting
+
+def _settle_journaled_txs(w3, journal, job, receipts, waiting, tracker):
+    if waiting:
+        print(f"[{job['job_id']}] Re-broadcast {len(waiting)} journaled transaction(s), waiting for receipts...")
+        receipts.update(zip(waiting, tracker.wait(waiting)))
+    for tx in job["txs"]:
+        if tx["status"] in ("signed", "sent") and tx["tx_hash"] in receipts:
+            journal.record_receipt(job["job_id"], receipts[tx["tx_hash"]])
+    return receipts
+
+def _receipt_for(w3, receipts, tx):
+    if tx is None:
+        return None
+    return receipts.get(tx["tx_hash"]) or w3.eth.get_transaction_receipt(tx["tx_hash"])
+
+def _reverted(receipts, tx):
+    receipt = receipts.get(tx["tx_hash"])
+    return tx["status"] in ("reverted", "dropped") or (receipt is not None and receipt.status != 1)
+
+def _unminted_recipients(w3, job, receipts, abi):
+    """The job's recipients still owed a token, after every successful mint tx is subtracted by who it minted to."""
+    minted = Counter()
+    for tx in job["txs"]:
+        if tx["step"] != "mint" or _reverted(receipts, tx):
+            continue
+        if tx["token_count"] is None:
+            # Journaled before mint txs recorded what they mint: read it back from the calldata.
+            transaction = w3.eth.get_transaction(tx["tx_hash"])
+            _, args = w3.eth.contract(abi=abi).decode_function_input(transaction.get("input", transaction.get("data")))
+            minted[args["to"].lower()] += args.get("quantity", 1)
+        else:
+            minted[tx["recipient"].lower()] += tx["token_count"]
+    remaining = []
+    for recipient in job["recipients"]:
+        if minted[recipient.lower()]:
+            minted[recipient.lower()] -= 1
+        else:
+            remaining.append(recipient)
+    return remaining
+
+def _finish_resumed_job(w3, journal, job, receipts, artifacts, private_keys, tracker):
+    job_id = job["job_id"]
+    if not job["txs"]:
+        # Nothing was ever signed, so nothing was paid for; the next scheduled run replaces it.
+        journal.finish_job(job_id, "abandoned")
+        return
+
+    contract_address = job["contract_address"]
+    if job["mode"] == "factory":
+        if contract_address is None:
+            receipt = _receipt_for(w3, receipts, next((tx for tx in job["txs"] if not _reverted(receipts, tx)), None))
+            factory = w3.eth.contract(abi=artifacts["MyNFTFactory.sol"]["MyNFTFactory"]["abi"])
+            created = factory.events.CollectionCreated().process_receipt(receipt) if receipt is not None else []
+            contract_address = created[0]["args"]["collection"] if created else None
+            if contract_address:
+                journal.set_contract(job_id, contract_address)
+    else:
+        if contract_address is None:
+            # A deploy that ran out of gas is retried at the next nonce; the successful one holds the address.
+            deployed = next((tx for tx in job["txs"] if tx["step"] == "deploy" and not _reverted(receipts, tx)), None)
+            receipt = _receipt_for(w3, receipts, deployed)
+            contract_address = receipt.contractAddress if receipt is not None and receipt.status == 1 else None
+        variant = "batch" if job["mode"] == "batch" else "standard"
+        artifact = variant_artifact(artifacts, variant)
+        remaining = _unminted_recipients(w3, job, receipts, artifact["abi"]) if contract_address else []
+        if remaining:
+            private_key = private_keys.get(job["sender"])
+            if private_key is None:
+                journal.finish_job(job_id, "failed", "no key configured for sender")
+                return
+            nft_contract = w3.eth.contract(address=contract_address, abi=artifact["abi"])
+            nonce = w3.eth.get_transaction_count(job["sender"], "pending")
+            mint_batch(w3, nft_contract, remaining, nonce, private_key=private_key, chain_id=job["chain_id"],
+                       tracker=tracker, journal=journal, job_id=job_id, variant=variant, code_hash=code_hash(artifact["bytecode"]))
+
+    if contract_address is None:
+        journal.finish_job(job_id, "failed", "collection was not created")
+    else:
+        print(f"[{job_id}] Resumed job completed. Collection: {contract_address}")
+        journal.finish_job(job_id)
+
+def resume_unfinished_jobs(w3=None, journal=None, private_keys=None):
+    """Finish jobs a previous process left running, re-sending journaled txs rather than re-signing."""
+    if journal is None:
+        journal = get_journal()
+    jobs = journal.unfinished_jobs()
+    if not jobs:
+        return []
+    if w3 is None:
+        w3 = get_web3()
+    artifacts = compile_contracts()
+    if artifacts is None:
+        return []
+    keys = {Account.from_key(key).address: key for key in (private_keys or PRIVATE_KEYS)}
+    chain_id = w3.eth.chain_id
+    jobs = [job for job in jobs if job["chain_id"] == chain_id]
+    print(f"Found {len(jobs)} unfinished job(s) in the journal, resuming...")
+
+    # Re-send every job's journaled txs before any job mints again, so new mints never reuse a
+    # nonce that is already signed. A job that fails here is left for the next restart; it does
+    # not hold up the others.
+    tracker = get_receipt_tracker(w3).start()
+    settled = []
+    for job in jobs:
+        try:
+            settled.append((job, _rebroadcast_journaled_txs(w3, journal, job)))
+        except Exception as e:
+            print(f"[{job['job_id']}] Could not re-broadcast journaled transactions: {e}")
+    resumed = []
+    for job, (receipts, waiting) in settled:
+        try:
+            _settle_journaled_txs(w3, journal, job, receipts, waiting, tracker)
+            _finish_resumed_job(w3, journal, job, receipts, artifacts, keys, tracker)
+            resumed.append(job["job_id"])
+        except Exception as e:
+            print(f"[{job['job_id']}] Could not resume job: {e}")
+    return resumed
+
+def wallet_job(private_key):
+    print(f"Running scheduled job for {Account.from_key(private_key).address} at {time.ctime()}...")
+    deploy_and_mint(private_key=private_key)
+
+def job():
+    """One run for every configured wallet, one after another (run-scheduler schedules each wallet on its own)."""
+    print(f"Running scheduled job at {time.ctime()}...")
+    for private_key in PRIVATE_KEYS:
+        try:
+            deploy_and_mint(private_key=private_key)
+        except Exception as e:
+            print(f"An error occurred during the job: {e}")
@@ -0,0 +1,167 @@
+import atexit
+import json
+import sqlite3
+import threading
+import time
+
+from .config import JOURNAL_BATCH_SIZE, JOURNAL_FLUSH_INTERVAL, JOURNAL_PATH
+
+# ==============================================================================
+# --- JOB JOURNAL ---
+# ==============================================================================
+# Append-style SQLite record of every job step: artifact hash, signed raw tx, tx
+# hash, receipt and contract address. Writes are queued and committed in
+# batches; signed transactions are always flushed before they are broadcast so
+# a restart can re-send the exact same bytes instead of signing again.
+
+class JobJournal:
+    def __init__(self, path=JOURNAL_PATH, batch_size=JOURNAL_BATCH_SIZE, flush_interval=JOURNAL_FLUSH_INTERVAL):
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.stats = {"writes": 0, "flushes": 0}
+        self._lock = threading.Lock()
+        self._queue = []
+        self._last_flush = time.monotonic()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=FULL")
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS jobs (
+                job_id TEXT PRIMARY KEY, sender TEXT, chain_id INTEGER, mode TEXT, artifact_hash TEXT,
+                name TEXT, symbol TEXT, recipients TEXT, contract_address TEXT, status TEXT, error TEXT,
+                created_at REAL, updated_at REAL
+            );
+            CREATE TABLE IF NOT EXISTS txs (
+                tx_hash TEXT PRIMARY KEY, job_id TEXT, step TEXT, nonce INTEGER, raw_tx BLOB,
+                status TEXT, receipt TEXT, created_at REAL, updated_at REAL, recipient TEXT, token_count INTEGER
+            );
+            CREATE INDEX IF NOT EXISTS jobs_by_status ON jobs (status);
+            CREATE INDEX IF NOT EXISTS txs_by_job ON txs (job_id);
+        """)
+        # Journals written before mint txs recorded what they mint get the columns added (NULL for old rows).
+        columns = {row["name"] for row in self._conn.execute("PRAGMA table_info(txs)")}
+        for column, kind in (("recipient", "TEXT"), ("token_count", "INTEGER")):
+            if column not in columns:
+                self._conn.execute(f"ALTER TABLE txs ADD COLUMN {column} {kind}")
+
+    @staticmethod
+    def _hex(tx_hash):
+        return tx_hash if isinstance(tx_hash, str) else "0x" + bytes(tx_hash).hex()
+
+    def _write(self, sql, params):
+        with self._lock:
+            self._queue.append((sql, params))
+            self.stats["writes"] += 1
+            due = len(self._queue) >= self.batch_size or time.monotonic() - self._last_flush >= self.flush_interval
+        if due:
+            self.flush()
+
+    def flush(self):
+        with self._lock:
+            if not self._queue:
+                return
+            batch, self._queue = self._queue, []
+            self._conn.execute("BEGIN")
+            try:
+                for sql, params in batch:
+                    self._conn.execute(sql, params)
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                self._queue = batch + self._queue
+                raise
+            self.stats["flushes"] += 1
+            self._last_flush = time.monotonic()
+
+    def close(self):
+        self.flush()
+        self._conn.close()
+
+    def start_job(self, job_id, sender, chain_id, mode, artifact_hash, name, symbol, recipients):
+        now = time.time()
+        self._write(
+            "INSERT INTO jobs (job_id, sender, chain_id, mode, artifact_hash, name, symbol, recipients, status, created_at, updated_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, 'running', ?, ?)",
+            (job_id, sender, chain_id, mode, artifact_hash, name, symbol, json.dumps(recipients), now, now),
+        )
+
+    def record_signed(self, job_id, step, nonce, tx_hash, raw_tx, recipient=None, token_count=None):
+        """Mint txs also record who they mint to and how many tokens, so a resume knows what is still owed."""
+        now = time.time()
+        self._write(
+            "INSERT OR IGNORE INTO txs (tx_hash, job_id, step, nonce, raw_tx, status, created_at, updated_at, recipient, token_count) "
+            "VALUES (?, ?, ?, ?, ?, 'signed', ?, ?, ?, ?)",
+            (self._hex(tx_hash), job_id, step, nonce, bytes(raw_tx), now, now, recipient, token_count),
+        )
+
+    def mark_sent(self, tx_hashes):
+        for tx_hash in tx_hashes:
+            self._write("UPDATE txs SET status = 'sent', updated_at = ? WHERE tx_hash = ? AND status = 'signed'", (time.time(), self._hex(tx_hash)))
+
+    def mark_dropped(self, tx_hashes):
+        """Journaled txs that can never be mined because their nonce went to another tx."""
+        for tx_hash in tx_hashes:
+            self._write("UPDATE txs SET status = 'dropped', updated_at = ? WHERE tx_hash = ?", (time.time(), self._hex(tx_hash)))
+
+    def record_receipt(self, job_id, receipt):
+        from web3 import Web3
+
+        now = time.time()
+        status = "mined" if receipt.status == 1 else "reverted"
+        self._write("UPDATE txs SET status = ?, receipt = ?, updated_at = ? WHERE tx_hash = ?",
+                    (status, Web3.to_json(receipt), now, self._hex(receipt.transactionHash)))
+        if receipt.get("contractAddress") and receipt.status == 1:
+            self.set_contract(job_id, receipt.contractAddress)
+
+    def set_contract(self, job_id, contract_address):
+        self._write("UPDATE jobs SET contract_address = ?, updated_at = ? WHERE job_id = ?", (contract_address, time.time(), job_id))
+
+    def finish_job(self, job_id, status="done", error=None):
+        self._write("UPDATE jobs SET status = ?, error = ?, updated_at = ? WHERE job_id = ?", (status, error, time.time(), job_id))
+        self.flush()
+
+    def unfinished_jobs(self):
+        self.flush()
+        with self._lock:
+            jobs = [dict(row) for row in self._conn.execute("SELECT * FROM jobs WHERE status = 'running' ORDER BY created_at")]
+            for job in jobs:
+                job["recipients"] = json.loads(job["recipients"] or "[]")
+                job["txs"] = [dict(row) for row in self._conn.execute("SELECT * FROM txs WHERE job_id = ? ORDER BY nonce", (job["job_id"],))]
+        return jobs
+
+    def recent_jobs(self, limit=10):
+        """Newest jobs first, each with per-status tx counts (no raw transactions)."""
+        self.flush()
+        with self._lock:
+            jobs = [dict(row) for row in self._conn.execute("SELECT * FROM jobs ORDER BY created_at DESC LIMIT ?", (limit,))]
+            for job in jobs:
+                job["recipients"] = json.loads(job["recipients"] or "[]")
+                job["txs"] = {row["status"]: row["count"] for row in self._conn.execute(
+                    "SELECT status, COUNT(*) AS count FROM txs WHERE job_id = ? GROUP BY status", (job["job_id"],))}
+        return jobs
+
+    def deployed_collections(self, chain_id):
+        """Every collection a job on chain_id ended up with, plus the first block any of its txs was mined in."""
+        self.flush()
+        with self._lock:
+            jobs = [dict(row) for row in self._conn.execute(
+                "SELECT job_id, sender, name, symbol, contract_address FROM jobs "
+                "WHERE chain_id = ? AND contract_address IS NOT NULL ORDER BY created_at", (chain_id,))]
+            for job in jobs:
+                blocks = [json.loads(row["receipt"])["blockNumber"] for row in self._conn.execute(
+                    "SELECT receipt FROM txs WHERE job_id = ? AND receipt IS NOT NULL", (job["job_id"],))]
+                job["first_block"] = min(blocks) if blocks else None
+        return jobs
+
+_journal = None
+_journal_lock = threading.Lock()
+
+def get_journal():
+    global _journal
+    with _journal_lock:
+        if _journal is None:
+            _journal = JobJournal()
+            atexit.register(_journal.close)
+    return _journal
@@ -0,0 +1,181 @@
+import bisect
+import contextlib
+import json
+import threading
+import time
+
+from .config import METRICS_ADDR, METRICS_LOG, METRICS_PORT
+
+# ==============================================================================
+# --- METRICS ---
+# ==============================================================================
+# Per-stage spans, counters and latency histograms. Instrumentation calls are
+# no-ops until start_metrics() enables an exporter (a Prometheus text endpoint
+# on METRICS_PORT and/or a JSON-lines span log at METRICS_LOG), so they cost a
+# flag check when nothing is listening.
+
+METRICS_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+_NULL_SPAN = contextlib.nullcontext()
+
+def _escape_label(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+class _Span:
+    __slots__ = ("metrics", "stage", "labels", "start")
+
+    def __init__(self, metrics, stage, labels):
+        self.metrics = metrics
+        self.stage = stage
+        self.labels = labels
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.metrics.finish_span(self.stage, self.labels, time.perf_counter() - self.start, exc)
+        return False
+
+class Metrics:
+    def __init__(self, prefix="nft_deployer"):
+        self.prefix = prefix
+        self.enabled = False
+        self._lock = threading.Lock()
+        self._counters = {}
+        self._histograms = {}
+        self._log = None
+        self._server = None
+
+    def enable(self, log_path=None):
+        with self._lock:
+            if log_path and self._log is None:
+                self._log = open(log_path, "a", buffering=1)
+            self.enabled = True
+        return self
+
+    def disable(self):
+        with self._lock:
+            self.enabled = False
+            if self._log is not None:
+                self._log.close()
+                self._log = None
+
+    def span(self, stage, **labels):
+        """Context manager timing one stage into stage_duration_seconds{stage=...}."""
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, stage, labels)
+
+    def inc(self, name, value=1, **labels):
+        if not self.enabled:
+            return
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def observe(self, name, value, **labels):
+        if not self.enabled:
+            return
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = {"buckets": [0] * (len(METRICS_BUCKETS) + 1), "sum": 0.0, "count": 0}
+            histogram["buckets"][bisect.bisect_left(METRICS_BUCKETS, value)] += 1
+            histogram["sum"] += value
+            histogram["count"] += 1
+
+    def finish_span(self, stage, labels, elapsed, error=None):
+        self.observe("stage_duration_seconds", elapsed, stage=stage, **labels)
+        if error is not None:
+            self.inc("stage_failures_total", stage=stage, **labels)
+        if self._log is not None:
+            record = {"ts": time.time(), "stage": stage, "duration": elapsed, "ok": error is None, **labels}
+            if error is not None:
+                record["error"] = str(error)
+            line = json.dumps(record, default=str)
+            with self._lock:
+                if self._log is not None:
+                    self._log.write(line + "\n")
+
+    def snapshot(self):
+        """Plain-dict view of every series: {"counters": {...}, "histograms": {...}}, keyed by name{labels}."""
+        with self._lock:
+            return {
+                "counters": {self._series(name, labels): value for (name, labels), value in self._counters.items()},
+                "histograms": {self._series(name, labels): {"count": h["count"], "sum": h["sum"]}
+                               for (name, labels), h in self._histograms.items()},
+            }
+
+    @staticmethod
+    def _series(name, labels, extra=()):
+        pairs = list(labels) + list(extra)
+        if not pairs:
+            return name
+        rendered = ",".join(f'{key}="{_escape_label(value)}"' for key, value in pairs)
+        return f"{name}{{{rendered}}}"
+
+    def render(self):
+        """Prometheus text exposition (version 0.0.4) of every counter and histogram."""
+        lines, typed = [], set()
+        with self._lock:
+            counters = sorted(self._counters.items())
+            histograms = sorted((key, dict(h, buckets=list(h["buckets"]))) for key, h in self._histograms.items())
+        for (name, labels), value in counters:
+            full_name = f"{self.prefix}_{name}"
+            if full_name not in typed:
+                typed.add(full_name)
+                lines.append(f"# TYPE {full_name} counter")
+            lines.append(f"{self._series(full_name, labels)} {value}")
+        for (name, labels), histogram in histograms:
+            full_name = f"{self.prefix}_{name}"
+            if full_name not in typed:
+                typed.add(full_name)
+                lines.append(f"# TYPE {full_name} histogram")
+            cumulative = 0
+            for bound, count in zip(METRICS_BUCKETS + ("+Inf",), histogram["buckets"]):
+                cumulative += count
+                lines.append(f"{self._series(full_name + '_bucket', labels, [('le', bound)])} {cumulative}")
+            lines.append(f"{self._series(full_name + '_sum', labels)} {histogram['sum']}")
+            lines.append(f"{self._series(full_name + '_count', labels)} {histogram['count']}")
+        return "\n".join(lines) + "\n"
+
+    def serve(self, port, addr="127.0.0.1"):
+        """Expose render() on http://addr:port/metrics from a daemon thread."""
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        metrics = self
+
+        class MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = metrics.render().encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer((addr, port), MetricsHandler)
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self._server.server_address
+
+METRICS = Metrics()
+
+def start_metrics(port=METRICS_PORT, log_path=METRICS_LOG, addr=METRICS_ADDR):
+    """Enable instrumentation if an exporter is configured; returns METRICS either way."""
+    if not port and not log_path:
+        return METRICS
+    METRICS.enable(log_path or None)
+    if port:
+        host, bound_port = METRICS.serve(port, addr)
+        print(f"Metrics available at http://{host}:{bound_port}/metrics")
+    if log_path:
+        print(f"Writing stage spans to {log_path}")
+    return METRICS
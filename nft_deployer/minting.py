@@ -0,0 +1,103 @@
+import random
+from itertools import groupby
+
+from eth_account import Account
+
+from .config import CHAIN_ID, CONTRACT_VARIANT, MINT_BATCH_MAX, PRIVATE_KEY
+from .fees import get_fee_oracle
+from .gas import argument_shape, send_with_gas_retry
+from .receipts import get_receipt_tracker
+from .signing import Broadcaster, sign_in_chunks
+
+# --- NAME GENERATION LISTS ---
+ADJECTIVES = [
+    "Bahlil", "Jokowi", "Prabowo", "SPBU", "Icikiwir", "Forgotten", "Glimmering",
+    "Storm", "Iron", "Ethereal", "Whispering", "Ancient", "Cursed", "Crimson",
+    "Void", "Astral", "Frozen", "Living", "Fallen", "Sacred", "Corrupted"
+]
+NOUNS = [
+    "Hunter", "Dragon", "Relic", "Guardian", "Shard", "Knight", "Orb", "Crown",
+    "Sentinel", "Voyager", "Golem", "Wisp", "Key", "Idol", "Spire", "Behemoth",
+    "Gate", "Rune", "Soul", "Echo", "Star"
+]
+
+# ==============================================================================
+# --- BATCH MINTING ---
+# ==============================================================================
+# Nonces are allocated locally from a single starting nonce, every signed
+# transaction is broadcast back to back, and receipts are awaited together
+# through a ReceiptTracker so a batch of N mints costs roughly one block time.
+
+def generate_collection_name():
+    adjective = random.choice(ADJECTIVES)
+    noun = random.choice(NOUNS)
+    cool_name = f"{adjective} {noun}"
+    contract_name = f"{cool_name} Collection"
+    token_symbol = "".join([word[0] for word in cool_name.split()]).upper()
+    return contract_name, token_symbol
+
+def plan_mint_calls(recipients, variant=None, max_batch=MINT_BATCH_MAX):
+    """Return [(fn_name, args, token_count)] minting to recipients in order, one entry per transaction."""
+    if (variant or CONTRACT_VARIANT) != "batch":
+        return [("safeMint", [recipient], 1) for recipient in recipients]
+    # Consecutive mints to the same address collapse into mintBatch calls of up to max_batch tokens.
+    calls = []
+    for recipient, run in groupby(recipients):
+        remaining = sum(1 for _ in run)
+        while remaining:
+            quantity = min(remaining, max_batch)
+            calls.append(("mintBatch", [recipient, quantity], quantity))
+            remaining -= quantity
+    return calls
+
+def _send_mints(w3, mint_txns, minted, private_key, tracker, timeout, journal, job_id):
+    """Sign (journaling each chunk before it is sent), broadcast and wait; receipts come back in order.
+
+    minted holds the (recipient, token_count) of each transaction, for the journal.
+    """
+    broadcaster = Broadcaster(w3)
+    journaled = iter(zip(mint_txns, minted))
+    for signed_chunk in sign_in_chunks(private_key, mint_txns):
+        if journal is not None:
+            for signed_mint_txn in signed_chunk:
+                transaction, (recipient, token_count) = next(journaled)
+                journal.record_signed(job_id, "mint", transaction["nonce"], signed_mint_txn.hash, signed_mint_txn.rawTransaction,
+                                      recipient, token_count)
+            journal.flush()
+        for signed_mint_txn in signed_chunk:
+            broadcaster.submit(signed_mint_txn.rawTransaction)
+    tx_hashes = broadcaster.join()
+    if journal is not None:
+        journal.mark_sent(tx_hashes)
+    first_nonce = mint_txns[0]["nonce"]
+    print(f"Broadcast {len(tx_hashes)} mint transaction(s) (nonces {first_nonce}..{first_nonce + len(tx_hashes) - 1}), waiting for receipts...")
+    receipts = tracker.wait(tx_hashes, timeout=timeout)
+    if journal is not None:
+        for receipt in receipts:
+            journal.record_receipt(job_id, receipt)
+    return receipts
+
+def mint_batch(w3, nft_contract, recipients, start_nonce, private_key=PRIVATE_KEY, chain_id=CHAIN_ID, fees=None, tracker=None, timeout=None,
+               journal=None, job_id=None, variant=None, code_hash=None):
+    sender = Account.from_key(private_key).address
+    if tracker is None:
+        tracker = get_receipt_tracker(w3).start()
+    if fees is None:
+        fees = get_fee_oracle(w3).fees(w3)
+    if not recipients:
+        return []
+    # Gas limits come from the shared estimate cache, keyed by the contract's code
+    # (its address when the code hash is not known), selector and argument shape,
+    # so the batch is built offline (later nonces are not valid for estimation anyway).
+    code_identity = code_hash or nft_contract.address
+    calls, gas_keys, minted = [], [], []
+    for fn_name, args, token_count in plan_mint_calls(recipients, variant):
+        data = nft_contract.encodeABI(fn_name=fn_name, args=args)
+        calls.append({"from": sender, "to": nft_contract.address, "data": data})
+        gas_keys.append((code_identity, data[:10], argument_shape(args)))
+        minted.append((args[0], token_count))
+    receipts, _ = send_with_gas_retry(
+        w3, calls, gas_keys, start_nonce, {"chainId": chain_id, "value": 0, **fees},
+        lambda indexes, transactions: _send_mints(w3, transactions, [minted[index] for index in indexes], private_key, tracker, timeout,
+                                                  journal, job_id), "mint")
+    return receipts
@@ -0,0 +1,246 @@
+import asyncio
+import threading
+import time
+
+from web3._utils.method_formatters import receipt_formatter
+from web3.datastructures import AttributeDict
+from web3.exceptions import TimeExhausted, TransactionNotFound, Web3Exception
+
+from .config import RECEIPT_CONFIRMATIONS, RECEIPT_POLL_INTERVAL, RECEIPT_TIMEOUT
+from .metrics import METRICS
+
+# ==============================================================================
+# --- RECEIPT TRACKER ---
+# ==============================================================================
+# Follows the chain head with one eth_blockNumber call per poll and fetches each
+# new block's receipts in bulk (eth_getBlockReceipts, or the block's transaction
+# list where that method is unavailable). Every waiting transaction is resolved
+# from those per-block fetches, so RPC cost tracks blocks, not pending txs.
+# Call start() before broadcasting so blocks mined in between are not skipped.
+# get_receipt_tracker() shares one tracker per endpoint: concurrent wait() calls
+# from job threads share one poll per interval instead of polling each.
+
+class ReceiptTracker:
+    def __init__(self, w3, confirmations=RECEIPT_CONFIRMATIONS, poll_interval=RECEIPT_POLL_INTERVAL,
+                 timeout=RECEIPT_TIMEOUT, retain_blocks=256):
+        self.w3 = w3
+        self.confirmations = confirmations
+        self.poll_interval = poll_interval
+        self.timeout = timeout
+        self.retain_blocks = retain_blocks
+        self.stats = {"rpc_calls": 0, "blocks_scanned": 0}
+        self._bulk_receipts = True
+        self._next_block = None
+        self._head = None
+        self._mined = {}  # tx hash -> (block number, receipt or None until fetched)
+        self._waiters = {}
+        self._poller = None
+        self._lock = threading.Lock()
+        self._waiting = 0
+        self._polled_at = 0.0
+
+    @staticmethod
+    def _key(tx_hash):
+        return (tx_hash if isinstance(tx_hash, str) else tx_hash.hex()).lower()
+
+    def _record_receipts(self, number, raw_receipts):
+        for raw_receipt in raw_receipts:
+            receipt = AttributeDict.recursive(receipt_formatter(raw_receipt))
+            self._mined[self._key(receipt.transactionHash)] = (number, receipt)
+
+    def _record_hashes(self, number, tx_hashes):
+        for tx_hash in tx_hashes:
+            self._mined.setdefault(self._key(tx_hash), (number, None))
+
+    def _advance_head(self, head):
+        self._head = head
+        self.stats["blocks_scanned"] += 1
+        horizon = head - self.confirmations - self.retain_blocks
+        if horizon > 0:
+            for key in [key for key, (number, _) in self._mined.items() if number < horizon]:
+                del self._mined[key]
+
+    def _needs_receipt(self, tx_hash):
+        entry = self._mined.get(self._key(tx_hash))
+        if entry is None or self._head is None or self._head < entry[0] + self.confirmations:
+            return None
+        return entry
+
+    def _timeout_error(self, pending, timeout):
+        missing = ", ".join(pending)
+        return TimeExhausted(f"Transactions not mined after {timeout} seconds: {missing}")
+
+    # --- Synchronous API ---
+
+    def start(self, block_number=None):
+        with self._lock:
+            # A shared tracker nobody has waited on for longer than the timeout
+            # skips ahead instead of scanning every block since its last use.
+            idle = self._waiting == 0 and time.monotonic() - self._polled_at > self.timeout
+            if self._next_block is None or idle:
+                if block_number is None:
+                    self.stats["rpc_calls"] += 1
+                    block_number = self.w3.eth.block_number
+                self._next_block = block_number if self._next_block is None else max(self._next_block, block_number)
+        return self
+
+    def _scan_block(self, number):
+        if self._bulk_receipts:
+            self.stats["rpc_calls"] += 1
+            try:
+                self._record_receipts(number, self.w3.manager.request_blocking("eth_getBlockReceipts", [hex(number)]))
+                return
+            except (ValueError, Web3Exception):
+                self._bulk_receipts = False
+        self.stats["rpc_calls"] += 1
+        self._record_hashes(number, self.w3.eth.get_block(number).transactions)
+
+    def poll(self):
+        self.stats["rpc_calls"] += 1
+        head = self.w3.eth.block_number
+        if self._next_block is None:
+            self._next_block = head
+        while self._next_block <= head:
+            self._scan_block(self._next_block)
+            self._next_block += 1
+            self._advance_head(head)
+
+    def receipt(self, tx_hash):
+        """Return the receipt once mined with enough confirmations, else None (no polling)."""
+        entry = self._needs_receipt(tx_hash)
+        if entry is None:
+            return None
+        number, receipt = entry
+        if receipt is None:
+            self.stats["rpc_calls"] += 1
+            try:
+                receipt = self.w3.eth.get_transaction_receipt(tx_hash)
+            except TransactionNotFound:
+                # Block seen but receipt not yet served (e.g. a lagging backend); retry next poll.
+                return None
+            self._mined[self._key(tx_hash)] = (number, receipt)
+        return receipt
+
+    def wait(self, tx_hashes, timeout=None):
+        with METRICS.span("receipts"):
+            return self._wait(tx_hashes, timeout)
+
+    def _wait(self, tx_hashes, timeout=None):
+        timeout = self.timeout if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+        receipts = {}
+        with self._lock:
+            self._waiting += 1
+        try:
+            while True:
+                with self._lock:
+                    # Another waiter may have polled a moment ago; its scan serves us too.
+                    if time.monotonic() - self._polled_at >= self.poll_interval:
+                        self.poll()
+                        self._polled_at = time.monotonic()
+                    for tx_hash in tx_hashes:
+                        key = self._key(tx_hash)
+                        if key not in receipts:
+                            receipt = self.receipt(tx_hash)
+                            if receipt is not None:
+                                receipts[key] = receipt
+                if len(receipts) == len({self._key(tx_hash) for tx_hash in tx_hashes}):
+                    return [receipts[self._key(tx_hash)] for tx_hash in tx_hashes]
+                if time.monotonic() > deadline:
+                    raise self._timeout_error([self._key(h) for h in tx_hashes if self._key(h) not in receipts], timeout)
+                time.sleep(self.poll_interval)
+        finally:
+            with self._lock:
+                self._waiting -= 1
+
+    # --- Asynchronous API (AsyncWeb3) ---
+    # Concurrent wait_async() callers share a single polling task.
+
+    async def start_async(self):
+        if self._next_block is None:
+            self.stats["rpc_calls"] += 1
+            self._next_block = await self.w3.eth.block_number
+        return self
+
+    async def _scan_block_async(self, number):
+        if self._bulk_receipts:
+            self.stats["rpc_calls"] += 1
+            try:
+                self._record_receipts(number, await self.w3.manager.coro_request("eth_getBlockReceipts", [hex(number)]))
+                return
+            except (ValueError, Web3Exception):
+                self._bulk_receipts = False
+        self.stats["rpc_calls"] += 1
+        self._record_hashes(number, (await self.w3.eth.get_block(number)).transactions)
+
+    async def poll_async(self):
+        self.stats["rpc_calls"] += 1
+        head = await self.w3.eth.block_number
+        if self._next_block is None:
+            self._next_block = head
+        while self._next_block <= head:
+            await self._scan_block_async(self._next_block)
+            self._next_block += 1
+            self._advance_head(head)
+
+    async def receipt_async(self, tx_hash):
+        entry = self._needs_receipt(tx_hash)
+        if entry is None:
+            return None
+        number, receipt = entry
+        if receipt is None:
+            self.stats["rpc_calls"] += 1
+            try:
+                receipt = await self.w3.eth.get_transaction_receipt(tx_hash)
+            except TransactionNotFound:
+                return None
+            self._mined[self._key(tx_hash)] = (number, receipt)
+        return receipt
+
+    async def _poll_loop(self):
+        try:
+            while self._waiters:
+                await self.poll_async()
+                for key, future in list(self._waiters.items()):
+                    receipt = await self.receipt_async(key)
+                    if receipt is not None:
+                        if not future.done():
+                            future.set_result(receipt)
+                        del self._waiters[key]
+                if self._waiters:
+                    await asyncio.sleep(self.poll_interval)
+        except Exception as e:
+            for future in self._waiters.values():
+                if not future.done():
+                    future.set_exception(e)
+            self._waiters.clear()
+
+    async def wait_async(self, tx_hashes, timeout=None):
+        with METRICS.span("receipts"):
+            return await self._wait_async(tx_hashes, timeout)
+
+    async def _wait_async(self, tx_hashes, timeout=None):
+        timeout = self.timeout if timeout is None else timeout
+        loop = asyncio.get_running_loop()
+        keys = [self._key(tx_hash) for tx_hash in tx_hashes]
+        futures = [self._waiters.setdefault(key, loop.create_future()) for key in keys]
+        if self._poller is None or self._poller.done():
+            self._poller = asyncio.ensure_future(self._poll_loop())
+        try:
+            return await asyncio.wait_for(asyncio.gather(*(asyncio.shield(f) for f in futures)), timeout)
+        except asyncio.TimeoutError:
+            pending = [key for key, future in zip(keys, futures) if not future.done()]
+            for key in pending:
+                self._waiters.pop(key, None)
+            raise self._timeout_error(pending, timeout)
+
+_receipt_trackers = {}
+_receipt_trackers_lock = threading.Lock()
+
+def get_receipt_tracker(w3):
+    """One shared tracker per RPC endpoint, like the fee oracle and gas cache."""
+    key = getattr(w3.provider, "endpoint_uri", None) or id(w3.provider)
+    with _receipt_trackers_lock:
+        if key not in _receipt_trackers:
+            _receipt_trackers[key] = ReceiptTracker(w3)
+    return _receipt_trackers[key]
@@ -0,0 +1,246 @@
+import json
+import threading
+import time
+
+import requests
+from web3 import AsyncWeb3, Web3
+from web3.exceptions import Web3Exception
+from web3.providers import JSONBaseProvider
+
+from .config import RPC_ENDPOINTS, RPC_FAILURE_COOLDOWN, RPC_POOL_SIZE, RPC_TIMEOUT
+from .metrics import METRICS
+
+# ==============================================================================
+# --- RPC PROVIDER ---
+# ==============================================================================
+# One long-lived provider per process: a keep-alive requests session per
+# endpoint, latency-ranked routing over RPC_ENDPOINTS, failover on transport
+# errors (a failing endpoint sits out an exponentially growing cooldown) and
+# JSON-RPC batch requests for independent reads. An endpoint that refuses batches
+# (a 4xx status or a single error object) is not penalised; it is remembered and
+# gets its calls one at a time from then on. Calls and failures are counted
+# per method by a middleware on every Web3 this package builds, whatever its
+# provider; batches skip the middleware stack and are counted by the provider.
+
+class BatchRefused(ValueError):
+    """No usable endpoint accepts JSON-RPC batches; send the calls one at a time instead."""
+
+def to_int(value):
+    if isinstance(value, str):
+        return int(value, 16)
+    return int(value)
+
+class EndpointState:
+    def __init__(self, uri, pool_size):
+        self.uri = uri
+        self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.latency = None
+        self.failures = 0
+        self.unhealthy_until = 0.0
+        self.refuses_batches = False
+
+    def record_success(self, elapsed):
+        self.latency = elapsed if self.latency is None else 0.8 * self.latency + 0.2 * elapsed
+        self.failures = 0
+        self.unhealthy_until = 0.0
+
+    def record_failure(self, cooldown):
+        self.failures += 1
+        self.unhealthy_until = time.monotonic() + cooldown * min(2 ** (self.failures - 1), 32)
+
+class PooledHTTPProvider(JSONBaseProvider):
+    def __init__(self, endpoints=None, timeout=RPC_TIMEOUT, pool_size=RPC_POOL_SIZE, cooldown=RPC_FAILURE_COOLDOWN):
+        super().__init__()
+        self.endpoints = [EndpointState(uri, pool_size) for uri in (endpoints or RPC_ENDPOINTS)]
+        self.timeout = timeout
+        self.cooldown = cooldown
+        self.stats = {"requests": 0, "batches": 0, "round_trips": 0, "failovers": 0}
+        self._lock = threading.Lock()
+
+    def __str__(self):
+        return f"Pooled RPC connection {', '.join(endpoint.uri for endpoint in self.endpoints)}"
+
+    @property
+    def endpoint_uri(self):
+        return self.endpoints[0].uri
+
+    def _ranked_endpoints(self):
+        now = time.monotonic()
+        healthy = [e for e in self.endpoints if e.unhealthy_until <= now]
+        cooling = [e for e in self.endpoints if e.unhealthy_until > now]
+        # Untried endpoints rank first so every endpoint gets a latency sample.
+        healthy.sort(key=lambda e: -1.0 if e.latency is None else e.latency)
+        cooling.sort(key=lambda e: e.unhealthy_until)
+        return healthy + cooling
+
+    def _post(self, payload, endpoints=None, batch=False):
+        """POST payload to the best endpoint that answers; returns (endpoint, response body)."""
+        last_error = None
+        for attempt, endpoint in enumerate(endpoints or self._ranked_endpoints()):
+            start = time.monotonic()
+            if attempt:
+                METRICS.inc("rpc_retries_total", endpoint=endpoint.uri)
+            try:
+                response = endpoint.session.post(endpoint.uri, data=payload, timeout=self.timeout,
+                                                 headers={"Content-Type": "application/json"})
+                if batch and 400 <= response.status_code < 500:
+                    # The endpoint is up, it just does not take batches; that is not a transport failure.
+                    with self._lock:
+                        self.stats["round_trips"] += 1
+                    raise self._refuse_batches(endpoint, f"HTTP {response.status_code}")
+                response.raise_for_status()
+            except requests.RequestException as e:
+                with self._lock:
+                    endpoint.record_failure(self.cooldown)
+                    self.stats["round_trips"] += 1
+                    if attempt:
+                        self.stats["failovers"] += 1
+                METRICS.inc("rpc_endpoint_failures_total", endpoint=endpoint.uri)
+                last_error = e
+                continue
+            elapsed = time.monotonic() - start
+            with self._lock:
+                endpoint.record_success(elapsed)
+                self.stats["round_trips"] += 1
+                if attempt:
+                    self.stats["failovers"] += 1
+            METRICS.observe("rpc_round_trip_seconds", elapsed, endpoint=endpoint.uri)
+            return endpoint, response.content
+        raise last_error
+
+    def _refuse_batches(self, endpoint, reason):
+        with self._lock:
+            first = not endpoint.refuses_batches
+            endpoint.refuses_batches = True
+        if first:
+            print(f"{endpoint.uri} refused a JSON-RPC batch ({reason}); sending its calls one at a time from now on.")
+        return BatchRefused(f"{endpoint.uri} does not accept batches ({reason})")
+
+    def make_request(self, method, params):
+        self.stats["requests"] += 1
+        return self.decode_rpc_response(self._post(self.encode_rpc_request(method, params))[1])
+
+    def make_batch_request(self, calls):
+        """Send [(method, params), ...] as one JSON-RPC batch; responses come back in call order.
+
+        Raises BatchRefused when the endpoint asked refuses the batch, or straight away once every endpoint has.
+        """
+        self.stats["batches"] += 1
+        payload = json.dumps([
+            {"jsonrpc": "2.0", "id": index, "method": method, "params": params}
+            for index, (method, params) in enumerate(calls)
+        ])
+        try:
+            endpoints = [endpoint for endpoint in self._ranked_endpoints() if not endpoint.refuses_batches]
+            if not endpoints:
+                raise BatchRefused("no endpoint accepts JSON-RPC batches")
+            endpoint, content = self._post(payload, endpoints, batch=True)
+            try:
+                responses = json.loads(content)
+            except ValueError:
+                responses = {"error": "response is not JSON"}
+            if not isinstance(responses, list):
+                # A single error object instead of per-call responses: the same refusal, sent with HTTP 200.
+                raise self._refuse_batches(endpoint, responses.get("error", responses) if isinstance(responses, dict) else responses)
+        except BatchRefused:
+            # Not counted here: batch_call re-sends these calls one by one through the metrics middleware.
+            raise
+        except Exception:
+            if METRICS.enabled:
+                for method, _ in calls:
+                    METRICS.inc("rpc_calls_total", method=method)
+                    METRICS.inc("rpc_failures_total", method=method)
+            raise
+        by_id = {response.get("id"): response for response in responses}
+        results = [by_id.get(index, {"error": "missing response"}) for index in range(len(calls))]
+        if METRICS.enabled:
+            for (method, _), response in zip(calls, results):
+                METRICS.inc("rpc_calls_total", method=method)
+                if "error" in response:
+                    METRICS.inc("rpc_failures_total", method=method)
+        return results
+
+    def health_check(self):
+        """Probe every endpoint with eth_blockNumber, refreshing latency and health."""
+        payload = self.encode_rpc_request("eth_blockNumber", [])
+        for endpoint in self.endpoints:
+            start = time.monotonic()
+            try:
+                endpoint.session.post(endpoint.uri, data=payload, timeout=self.timeout,
+                                      headers={"Content-Type": "application/json"}).raise_for_status()
+            except requests.RequestException:
+                endpoint.record_failure(self.cooldown)
+            else:
+                endpoint.record_success(time.monotonic() - start)
+        return {endpoint.uri: endpoint.latency if not endpoint.failures else None for endpoint in self.endpoints}
+
+def rpc_metrics_middleware(make_request, w3):
+    """Count rpc_calls_total / rpc_failures_total by method; injected innermost so each provider call counts once."""
+    def middleware(method, params):
+        if not METRICS.enabled:
+            return make_request(method, params)
+        METRICS.inc("rpc_calls_total", method=method)
+        try:
+            response = make_request(method, params)
+        except Exception:
+            METRICS.inc("rpc_failures_total", method=method)
+            raise
+        if "error" in response:
+            METRICS.inc("rpc_failures_total", method=method)
+        return response
+    return middleware
+
+async def async_rpc_metrics_middleware(make_request, w3):
+    async def middleware(method, params):
+        if not METRICS.enabled:
+            return await make_request(method, params)
+        METRICS.inc("rpc_calls_total", method=method)
+        try:
+            response = await make_request(method, params)
+        except Exception:
+            METRICS.inc("rpc_failures_total", method=method)
+            raise
+        if "error" in response:
+            METRICS.inc("rpc_failures_total", method=method)
+        return response
+    return middleware
+
+def instrument_web3(w3):
+    """Install the RPC metrics middleware on w3 (sync or async) unless it is already there."""
+    if "rpc_metrics" not in w3.middleware_onion:
+        middleware = async_rpc_metrics_middleware if isinstance(w3, AsyncWeb3) else rpc_metrics_middleware
+        w3.middleware_onion.inject(middleware, "rpc_metrics", layer=0)
+    return w3
+
+def batch_call(w3, calls):
+    """Run independent reads in one round trip; failed calls come back as ValueError instances."""
+    results = []
+    if hasattr(w3.provider, "make_batch_request"):
+        try:
+            responses = w3.provider.make_batch_request(calls)
+        except BatchRefused:
+            # Batching disabled or capped on every endpoint (the provider already said so); ask one call at a time.
+            responses = None
+        if responses is not None:
+            for response in responses:
+                results.append(ValueError(response["error"]) if "error" in response else response["result"])
+            return results
+    for method, params in calls:
+        try:
+            results.append(w3.manager.request_blocking(method, params))
+        except (ValueError, Web3Exception) as e:
+            results.append(ValueError(str(e)))
+    return results
+
+_web3 = None
+_web3_lock = threading.Lock()
+
+def get_web3():
+    global _web3
+    with _web3_lock:
+        if _web3 is None:
+            _web3 = instrument_web3(Web3(PooledHTTPProvider()))
+    return _web3
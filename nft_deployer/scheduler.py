@@ -0,0 +1,212 @@
+import heapq
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+from .config import SCHEDULER_WORKERS
+from .metrics import METRICS
+
+# ==============================================================================
+# --- SCHEDULER ---
+# ==============================================================================
+# Sleeps exactly until the next due entry, then hands it to a bounded worker
+# pool. Entries tied to the same wallet never run at the same time; an entry
+# that is still running (or whose wallet is busy) when it comes due again is
+# skipped (overlap="skip") or run once the wallet frees up (overlap="queue").
+# A queued entry holds at most one pending run, and it waits in the scheduler,
+# not on a pool worker, so a busy wallet never starves the others.
+
+class CronSchedule:
+    """Five-field cron expression: minute hour day-of-month month day-of-week."""
+
+    RANGES = [(0, 59), (0, 23), (1, 31), (1, 12), (0, 6)]
+
+    def __init__(self, expression):
+        fields = expression.split()
+        if len(fields) != 5:
+            raise ValueError(f"Invalid cron expression '{expression}': expected 5 fields")
+        self.expression = expression
+        self.minutes, self.hours, self.days, self.months, self.weekdays = (
+            self._parse(field, low, high) for field, (low, high) in zip(fields, self.RANGES)
+        )
+        self.days_restricted = fields[2] != "*"
+        self.weekdays_restricted = fields[4] != "*"
+
+    @staticmethod
+    def _parse(field, low, high):
+        values = set()
+        for part in field.split(","):
+            step = 1
+            if "/" in part:
+                part, step_text = part.split("/", 1)
+                step = int(step_text)
+            if part == "*":
+                start, end = low, high
+            elif "-" in part:
+                start, end = (int(value) for value in part.split("-", 1))
+            else:
+                start = int(part)
+                end = high if step > 1 else start
+            if high == 6 and end == 7:  # 7 is also Sunday
+                values.add(0)
+                end = 6
+                if start == 7:
+                    continue
+            if start < low or end > high or start > end or step < 1:
+                raise ValueError(f"Invalid cron field '{field}'")
+            values.update(range(start, end + 1, step))
+        return values
+
+    def _day_matches(self, moment):
+        day_ok = moment.day in self.days
+        weekday_ok = (moment.weekday() + 1) % 7 in self.weekdays
+        if self.days_restricted and self.weekdays_restricted:
+            return day_ok or weekday_ok
+        return day_ok and weekday_ok
+
+    def next_after(self, timestamp):
+        moment = datetime.fromtimestamp(timestamp).replace(second=0, microsecond=0) + timedelta(minutes=1)
+        limit = moment + timedelta(days=366 * 5)
+        while moment < limit:
+            if moment.month not in self.months:
+                moment = (moment.replace(day=1) + timedelta(days=32)).replace(day=1, hour=0, minute=0)
+            elif not self._day_matches(moment):
+                moment = (moment + timedelta(days=1)).replace(hour=0, minute=0)
+            elif moment.hour not in self.hours:
+                moment = (moment + timedelta(hours=1)).replace(minute=0)
+            elif moment.minute not in self.minutes:
+                moment += timedelta(minutes=1)
+            else:
+                return moment.timestamp()
+        raise ValueError(f"Cron expression '{self.expression}' never fires")
+
+class IntervalSchedule:
+    def __init__(self, seconds):
+        if seconds <= 0:
+            raise ValueError("Interval must be positive")
+        self.seconds = seconds
+
+    def next_after(self, timestamp):
+        return timestamp + self.seconds
+
+class ScheduledJob:
+    def __init__(self, name, trigger, fn, wallet=None, overlap="skip"):
+        if overlap not in ("skip", "queue"):
+            raise ValueError(f"Unknown overlap policy '{overlap}'")
+        self.name = name
+        self.trigger = trigger
+        self.fn = fn
+        self.wallet = wallet
+        self.overlap = overlap
+        self.running = False
+        self.next_run = None
+        self.queued_for = None  # the slot a pending overlap="queue" run stands for
+
+class Scheduler:
+    def __init__(self, max_workers=SCHEDULER_WORKERS):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="job")
+        self._heap = []
+        self._seq = 0
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopped = False
+        self._busy_wallets = set()
+        self._queued = []
+        self.stats = {"dispatched": 0, "skipped": 0, "coalesced": 0, "failed": 0, "completed": 0,
+                      "lag_last": 0.0, "lag_max": 0.0, "lag_total": 0.0}
+
+    def _push(self, job, when):
+        job.next_run = when
+        heapq.heappush(self._heap, (when, self._seq, job))
+        self._seq += 1
+
+    def add(self, name, trigger, fn, wallet=None, overlap="skip", run_now=False):
+        job = ScheduledJob(name, trigger, fn, wallet=wallet, overlap=overlap)
+        now = time.time()
+        with self._lock:
+            self._push(job, now if run_now else trigger.next_after(now))
+        self._wake.set()
+        return job
+
+    def add_interval(self, name, seconds, fn, **kwargs):
+        return self.add(name, IntervalSchedule(seconds), fn, **kwargs)
+
+    def add_cron(self, name, expression, fn, **kwargs):
+        return self.add(name, CronSchedule(expression), fn, **kwargs)
+
+    def metrics(self):
+        with self._lock:
+            metrics = dict(self.stats)
+        metrics["lag_mean"] = metrics["lag_total"] / metrics["dispatched"] if metrics["dispatched"] else 0.0
+        return metrics
+
+    def _run(self, job):
+        try:
+            with METRICS.span("job"):
+                job.fn()
+            outcome = "completed"
+        except Exception as e:
+            print(f"Scheduled job '{job.name}' failed: {e}")
+            outcome = "failed"
+        METRICS.inc("jobs_total", outcome=outcome)
+        with self._lock:
+            job.running = False
+            self._busy_wallets.discard(job.wallet)
+            self.stats[outcome] += 1
+            for queued in list(self._queued):
+                if not self._busy(queued):
+                    self._queued.remove(queued)
+                    scheduled_for, queued.queued_for = queued.queued_for, None
+                    self._submit(queued, scheduled_for)
+
+    def _busy(self, job):
+        return job.running or (job.wallet is not None and job.wallet in self._busy_wallets)
+
+    def _dispatch(self, job, scheduled_for):
+        # Called with self._lock held.
+        if self._busy(job):
+            if job.overlap == "skip":
+                self.stats["skipped"] += 1
+            elif job.queued_for is not None:
+                # Already has a pending run; this slot folds into it.
+                self.stats["coalesced"] += 1
+            else:
+                job.queued_for = scheduled_for
+                self._queued.append(job)
+            return
+        self._submit(job, scheduled_for)
+
+    def _submit(self, job, scheduled_for):
+        # Lag runs from the slot the run stands for, so time spent queued behind the wallet counts.
+        lag = max(0.0, time.time() - scheduled_for)
+        self.stats["dispatched"] += 1
+        self.stats["lag_last"] = lag
+        self.stats["lag_max"] = max(self.stats["lag_max"], lag)
+        self.stats["lag_total"] += lag
+        METRICS.observe("schedule_lag_seconds", lag)
+        job.running = True
+        if job.wallet is not None:
+            self._busy_wallets.add(job.wallet)
+        self._executor.submit(self._run, job)
+
+    def run_forever(self):
+        while not self._stopped:
+            with self._lock:
+                now = time.time()
+                while self._heap and self._heap[0][0] <= now:
+                    scheduled_for, _, job = heapq.heappop(self._heap)
+                    self._dispatch(job, scheduled_for)
+                    next_run = job.trigger.next_after(scheduled_for)
+                    if next_run <= now:
+                        # Fell behind (e.g. the host slept); resume from now instead of replaying every missed slot.
+                        next_run = job.trigger.next_after(now)
+                    self._push(job, next_run)
+                timeout = self._heap[0][0] - now if self._heap else None
+                self._wake.clear()
+            self._wake.wait(timeout)
+
+    def stop(self, wait=True):
+        self._stopped = True
+        self._wake.set()
+        self._executor.shutdown(wait=wait)
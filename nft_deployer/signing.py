@@ -0,0 +1,131 @@
+import atexit
+import multiprocessing
+import queue
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
+from eth_account import Account
+from web3 import Web3
+
+from .config import SIGNING_CHUNK_SIZE, SIGNING_WORKERS
+from .metrics import METRICS
+
+# ==============================================================================
+# --- SIGNING PIPELINE ---
+# ==============================================================================
+# Fully populated transactions (nonce, gas and fees already set) are signed in
+# chunks on a process pool, and each signed chunk is handed to a Broadcaster
+# thread while later chunks are still being signed. Small batches are signed
+# inline, where the pool round trip would cost more than it saves. Workers are
+# spawned rather than forked: the pool is created lazily from scheduler and
+# broadcaster threads, and a fork would copy their held locks into the child.
+
+def _sign_chunk(private_key, transactions):
+    account = Account.from_key(private_key)
+    return [account.sign_transaction(transaction) for transaction in transactions]
+
+_signing_pool = None
+_signing_pool_lock = threading.Lock()
+
+def get_signing_pool():
+    global _signing_pool
+    with _signing_pool_lock:
+        if _signing_pool is None:
+            _signing_pool = ProcessPoolExecutor(max_workers=SIGNING_WORKERS, mp_context=multiprocessing.get_context("spawn"))
+            atexit.register(_signing_pool.shutdown)
+    return _signing_pool
+
+def sign_in_chunks(private_key, transactions, workers=None, chunk_size=SIGNING_CHUNK_SIZE):
+    """Yield lists of signed transactions, chunk by chunk, in the original order."""
+    workers = SIGNING_WORKERS if workers is None else workers
+    chunks = [transactions[i:i + chunk_size] for i in range(0, len(transactions), chunk_size)]
+    if workers <= 1 or len(chunks) <= 1:
+        signed_chunks = (_sign_chunk(private_key, chunk) for chunk in chunks)
+    else:
+        signed_chunks = get_signing_pool().map(_sign_chunk, repeat(private_key), chunks)
+    # The span covers the time the caller waits on each chunk, inline or from the pool.
+    signed_chunks = iter(signed_chunks)
+    while True:
+        with METRICS.span("sign", step="mint"):
+            signed_chunk = next(signed_chunks, None)
+        if signed_chunk is None:
+            return
+        yield signed_chunk
+
+class Broadcaster:
+    """Drains signed raw transactions from a queue on its own thread, sending them in order."""
+
+    _DONE = object()
+
+    def __init__(self, w3):
+        self.w3 = w3
+        self.tx_hashes = []
+        self.error = None
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._drain, daemon=True)
+        self._thread.start()
+
+    def _drain(self):
+        while True:
+            raw_tx = self._queue.get()
+            if raw_tx is self._DONE:
+                return
+            if self.error is not None:
+                continue  # a failed send leaves a nonce gap; later txs would only queue behind it
+            try:
+                with METRICS.span("broadcast"):
+                    self.tx_hashes.append(self.w3.eth.send_raw_transaction(raw_tx))
+            except Exception as e:
+                self.error = e
+
+    def submit(self, raw_tx):
+        self._queue.put(raw_tx)
+
+    def join(self):
+        self._queue.put(self._DONE)
+        self._thread.join()
+        if self.error is not None:
+            raise self.error
+        return self.tx_hashes
+
+class NonceAlreadyUsed(ValueError):
+    """A replayed transaction whose nonce another transaction has already taken; it can never be mined."""
+
+_NONCE_USED_ERRORS = ("nonce too low", "invalid transaction nonce", "nonce has already been used")
+
+def broadcast_raw(w3, raw_tx):
+    """Send a signed transaction, treating "already known" as success (used for replays).
+
+    Raises NonceAlreadyUsed when the node reports the nonce as spent.
+    """
+    try:
+        with METRICS.span("broadcast"):
+            return w3.eth.send_raw_transaction(raw_tx)
+    except Exception as e:
+        message = str(e).lower()
+        if "already known" in message:
+            return Web3.keccak(raw_tx)
+        if any(error in message for error in _NONCE_USED_ERRORS):
+            raise NonceAlreadyUsed(str(e)) from e
+        raise
+
+def sign_and_journal(w3, transactions, private_key, journal, job_id, step, minted=None):
+    """minted: optional [(recipient, token_count)] per transaction, recorded alongside mint txs."""
+    with METRICS.span("sign", step=step):
+        signed_txns = [w3.eth.account.sign_transaction(transaction, private_key=private_key) for transaction in transactions]
+    for transaction, signed_txn, (recipient, token_count) in zip(transactions, signed_txns, minted or repeat((None, None))):
+        journal.record_signed(job_id, step, transaction["nonce"], signed_txn.hash, signed_txn.rawTransaction, recipient, token_count)
+    journal.flush()
+    return signed_txns
+
+def send_and_record(w3, transactions, private_key, journal, job_id, step, tracker):
+    """Sign and journal transactions, broadcast them in order and wait; receipts are journaled and returned in order."""
+    signed_txns = sign_and_journal(w3, transactions, private_key, journal, job_id, step)
+    with METRICS.span("broadcast"):
+        tx_hashes = [w3.eth.send_raw_transaction(signed_txn.rawTransaction) for signed_txn in signed_txns]
+    journal.mark_sent(tx_hashes)
+    receipts = tracker.wait(tx_hashes)
+    for receipt in receipts:
+        journal.record_receipt(job_id, receipt)
+    return receipts
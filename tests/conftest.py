@@ -0,0 +1,133 @@
+import json
+import os
+import sys
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Keep the library's compile cache, journal and factory state out of the project
+# directory before its config is first imported (same as bench.py).
+os.environ.setdefault("COMPILE_CACHE_DIR", tempfile.mkdtemp(prefix="nft-test-cache-"))
+os.environ.setdefault("JOURNAL_PATH", os.path.join(tempfile.mkdtemp(prefix="nft-test-journal-"), "journal.sqlite3"))
+os.environ.setdefault("FACTORY_STATE_FILE", os.path.join(tempfile.mkdtemp(prefix="nft-test-factory-"), "factory.json"))
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+from nft_deployer import fees, gas, receipts
+
+
+# eth-tester funds the accounts derived from private keys 0x...01, 0x...02, ...
+LOCAL_KEYS = ["0x" + f"{i:064x}" for i in range(1, 11)]
+
+# Stand-in for the compiled contracts (solc is not needed): the constructor
+# deploys empty runtime code, so every mint call succeeds and does nothing.
+FAKE_ABI = [
+    {"type": "constructor", "stateMutability": "nonpayable",
+     "inputs": [{"name": "name", "type": "string"}, {"name": "symbol", "type": "string"}]},
+    {"type": "function", "name": "safeMint", "stateMutability": "nonpayable", "outputs": [],
+     "inputs": [{"name": "to", "type": "address"}]},
+    {"type": "function", "name": "mintBatch", "stateMutability": "nonpayable", "outputs": [],
+     "inputs": [{"name": "to", "type": "address"}, {"name": "quantity", "type": "uint256"}]},
+]
+FAKE_BYTECODE = "60016000f3"
+FAKE_ARTIFACTS = {
+    "MyNFT.sol": {"MyNFT": {"abi": FAKE_ABI, "bytecode": FAKE_BYTECODE}},
+    "MyNFTBatch.sol": {"MyNFTBatch": {"abi": FAKE_ABI, "bytecode": FAKE_BYTECODE}},
+}
+
+
+@pytest.fixture(autouse=True)
+def fresh_shared_state(monkeypatch):
+    """Per-endpoint caches are keyed by id(provider) for eth-tester; a recycled id must not see another test's chain."""
+    monkeypatch.setattr(receipts, "_receipt_trackers", {})
+    monkeypatch.setattr(gas, "_gas_caches", {})
+    monkeypatch.setattr(fees, "_fee_oracles", {})
+
+
+@pytest.fixture
+def w3():
+    from web3 import EthereumTesterProvider, Web3
+
+    return Web3(EthereumTesterProvider())
+
+
+@pytest.fixture
+def private_key():
+    return LOCAL_KEYS[0]
+
+
+@pytest.fixture
+def fake_artifacts(monkeypatch):
+    from nft_deployer import jobs
+
+    monkeypatch.setattr(jobs, "compile_contracts", lambda *args, **kwargs: FAKE_ARTIFACTS)
+    return FAKE_ARTIFACTS
+
+
+@pytest.fixture
+def journal(tmp_path):
+    from nft_deployer.journal import JobJournal
+
+    journal = JobJournal(str(tmp_path / "journal.sqlite3"))
+    yield journal
+    journal.close()
+
+
+class JSONRPCServer:
+    """Local JSON-RPC endpoint answering from `results` (method -> value, or callable taking the params).
+
+    refuse_batches is None (answer batches), "http" (HTTP 400) or "object" (a single error object, HTTP 200).
+    """
+
+    def __init__(self, results):
+        self.results = results
+        self.refuse_batches = None
+        self.requests = []
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_POST(self):
+                request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                status, reply = 200, None
+                if isinstance(request, list):
+                    server.requests.append("batch")
+                    if server.refuse_batches == "http":
+                        status, reply = 400, {"error": "batch requests are not allowed"}
+                    elif server.refuse_batches == "object":
+                        reply = {"jsonrpc": "2.0", "id": None, "error": {"code": -32600, "message": "batch requests are not allowed"}}
+                    else:
+                        reply = [server.answer(call) for call in request]
+                else:
+                    server.requests.append(request["method"])
+                    reply = server.answer(request)
+                body = json.dumps(reply).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.uri = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+
+    def answer(self, call):
+        result = self.results[call["method"]]
+        if callable(result):
+            result = result(call["params"])
+        return {"jsonrpc": "2.0", "id": call["id"], "result": result}
+
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+@pytest.fixture
+def rpc_server():
+    server = JSONRPCServer({"eth_chainId": hex(16601), "eth_blockNumber": "0x10"})
+    yield server
+    server.close()
@@ -0,0 +1,57 @@
+import pytest
+
+from nft_deployer import InventoryIndexer
+
+
+def _hide_block(number, error=None):
+    """Answer eth_getBlockByNumber for `number` with an error, or with null like a node that has not seen it yet."""
+    def middleware(make_request, w3):
+        def inner(method, params):
+            if method == "eth_getBlockByNumber" and params[0] == hex(number):
+                if error:
+                    return {"jsonrpc": "2.0", "id": 0, "error": {"code": -32000, "message": error}}
+                return {"jsonrpc": "2.0", "id": 0, "result": None}
+            return make_request(method, params)
+        return inner
+    return middleware
+
+
+@pytest.fixture
+def indexer(w3, tmp_path):
+    w3.provider.ethereum_tester.mine_blocks(5)
+    indexer = InventoryIndexer(w3, path=str(tmp_path / "index.sqlite3"), reorg_depth=4)
+    indexer._record_blocks(w3.eth.block_number)
+    yield indexer
+    indexer.close()
+
+
+def _stored_blocks(indexer):
+    return [row["number"] for row in indexer._query("SELECT number FROM blocks ORDER BY number")]
+
+
+def test_unchanged_chain_is_not_a_reorg(indexer):
+    indexer._check_reorg()
+    assert indexer.stats["reorgs"] == 0
+    assert _stored_blocks(indexer) == [2, 3, 4, 5]
+
+
+def test_failed_block_lookup_aborts_the_check(w3, indexer):
+    w3.middleware_onion.add(_hide_block(4, error="upstream timeout"), "flaky")
+    with pytest.raises(ValueError, match="block 4"):
+        indexer._check_reorg()
+    assert indexer.stats["reorgs"] == 0
+    assert _stored_blocks(indexer) == [2, 3, 4, 5]
+
+
+def test_block_a_lagging_node_lacks_is_not_a_reorg(w3, indexer):
+    w3.middleware_onion.add(_hide_block(5), "lagging")
+    indexer._check_reorg()
+    assert indexer.stats["reorgs"] == 0
+    assert _stored_blocks(indexer) == [2, 3, 4, 5]
+
+
+def test_changed_block_hashes_roll_back_to_the_fork(indexer):
+    indexer._transaction([("UPDATE blocks SET hash = ? WHERE number >= 4", ("0x" + "00" * 32,))])
+    indexer._check_reorg()
+    assert indexer.stats["reorgs"] == 1
+    assert _stored_blocks(indexer) == [2, 3]
@@ -0,0 +1,102 @@
+import pytest
+from eth_account import Account
+from web3 import Web3
+from web3.datastructures import AttributeDict
+
+from nft_deployer import resume_unfinished_jobs
+from nft_deployer.jobs import _unminted_recipients
+
+A, B, C = (Web3.to_checksum_address("0x" + byte * 20) for byte in ("aa", "bb", "cc"))
+
+
+def _mint(tx_hash, status, recipient=None, token_count=None):
+    return {"step": "mint", "tx_hash": tx_hash, "status": status, "recipient": recipient, "token_count": token_count}
+
+
+def test_unminted_recipients_counts_tokens_per_recipient():
+    job = {"recipients": [A, A, A, B, C], "txs": [
+        {"step": "deploy", "tx_hash": "0x01", "status": "mined", "recipient": None, "token_count": None},
+        _mint("0x02", "mined", A, 2),
+        _mint("0x03", "sent", A.lower(), 1),
+        _mint("0x04", "reverted", B, 1),
+        _mint("0x05", "dropped", C, 1),
+    ]}
+    receipts = {"0x03": AttributeDict({"status": 1})}
+    assert _unminted_recipients(None, job, receipts, abi=[]) == [B, C]
+
+
+def test_unminted_recipients_ignores_mints_with_a_failed_receipt():
+    job = {"recipients": [A, B], "txs": [_mint("0x02", "sent", A, 1), _mint("0x03", "sent", B, 1)]}
+    receipts = {"0x02": AttributeDict({"status": 1}), "0x03": AttributeDict({"status": 0})}
+    assert _unminted_recipients(None, job, receipts, abi=[]) == [B]
+
+
+class JournaledWallet:
+    """Signs txs from one funded eth-tester account into a job's journal, like a process that died mid-job."""
+
+    def __init__(self, w3, journal, private_key, job_id="job"):
+        self.w3, self.journal, self.private_key, self.job_id = w3, journal, private_key, job_id
+        self.address = Account.from_key(private_key).address
+
+    def sign(self, nonce, data, to=None, step="mint", recipient=None, token_count=None, send=True, journal=True):
+        tx = {"chainId": self.w3.eth.chain_id, "from": self.address, "nonce": nonce, "gas": 200000, "data": data,
+              "value": 0, "gasPrice": self.w3.eth.gas_price}
+        if to:
+            tx["to"] = to
+        signed = self.w3.eth.account.sign_transaction(tx, self.private_key)
+        if journal:
+            self.journal.record_signed(self.job_id, step, nonce, signed.hash, signed.rawTransaction, recipient, token_count)
+            self.journal.flush()
+        if send:
+            self.w3.eth.send_raw_transaction(signed.rawTransaction)
+        return signed.hash.hex()
+
+
+@pytest.fixture
+def crashed_job(w3, journal, private_key, fake_artifacts):
+    """A batch-mode job for [A, A, A, B, C] that deployed and minted A's three tokens, then stopped."""
+    wallet = JournaledWallet(w3, journal, private_key)
+    journal.start_job("job", wallet.address, w3.eth.chain_id, "batch", "hash", "Name", "SYM", [A, A, A, B, C])
+    deploy = wallet.sign(0, fake_artifacts["MyNFTBatch.sol"]["MyNFTBatch"]["bytecode"], step="deploy")
+    contract = w3.eth.contract(address=w3.eth.get_transaction_receipt(deploy).contractAddress, abi=fake_artifacts["MyNFTBatch.sol"]["MyNFTBatch"]["abi"])
+    wallet.sign(1, contract.encodeABI(fn_name="mintBatch", args=[A, 3]), contract.address, recipient=A, token_count=3)
+    return wallet, contract
+
+
+def _txs(journal):
+    return [dict(row) for row in journal._conn.execute("SELECT nonce, step, status, recipient, token_count FROM txs ORDER BY nonce")]
+
+
+def test_resume_mints_only_what_is_still_owed(w3, journal, private_key, crashed_job):
+    wallet, contract = crashed_job
+    # Journaled before mint rows recorded their recipient: read back from the calldata.
+    wallet.sign(2, contract.encodeABI(fn_name="mintBatch", args=[C, 1]), contract.address)
+
+    assert resume_unfinished_jobs(w3=w3, journal=journal, private_keys=[private_key]) == ["job"]
+    assert journal.unfinished_jobs() == []
+    assert _txs(journal)[3:] == [{"nonce": 3, "step": "mint", "status": "mined", "recipient": B, "token_count": 1}]
+
+
+def test_resume_rebroadcasts_journaled_txs_that_never_left(w3, journal, private_key, crashed_job):
+    wallet, contract = crashed_job
+    wallet.sign(2, contract.encodeABI(fn_name="mintBatch", args=[B, 1]), contract.address, recipient=B, token_count=1, send=False)
+    wallet.sign(3, contract.encodeABI(fn_name="mintBatch", args=[C, 1]), contract.address, recipient=C, token_count=1, send=False)
+
+    assert resume_unfinished_jobs(w3=w3, journal=journal, private_keys=[private_key]) == ["job"]
+    # The stored bytes went out as they were; nothing was re-signed or minted twice.
+    assert [tx["status"] for tx in _txs(journal)] == ["mined"] * 4
+    assert w3.eth.get_transaction_count(wallet.address) == 4
+
+
+def test_resume_replaces_a_journaled_tx_whose_nonce_was_taken(w3, journal, private_key, crashed_job):
+    wallet, contract = crashed_job
+    wallet.sign(2, contract.encodeABI(fn_name="mintBatch", args=[B, 1]), contract.address, recipient=B, token_count=1, send=False)
+    # Another transaction used nonce 2 before the journaled one was broadcast.
+    wallet.sign(2, "0x", wallet.address, journal=False)
+
+    assert resume_unfinished_jobs(w3=w3, journal=journal, private_keys=[private_key]) == ["job"]
+    assert journal.unfinished_jobs() == []
+    txs = _txs(journal)
+    assert txs[2] == {"nonce": 2, "step": "mint", "status": "dropped", "recipient": B, "token_count": 1}
+    # B's token and C's (never signed) are minted anew at the next free nonces.
+    assert [(tx["nonce"], tx["status"], tx["recipient"]) for tx in txs[3:]] == [(3, "mined", B), (4, "mined", C)]
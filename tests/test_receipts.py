@@ -0,0 +1,78 @@
+import pytest
+from eth_account import Account
+
+from nft_deployer import ReceiptTracker
+
+
+def _count_calls(counts):
+    def middleware(make_request, w3):
+        def inner(method, params):
+            counts[method] = counts.get(method, 0) + 1
+            return make_request(method, params)
+        return inner
+    return middleware
+
+
+def _block_receipts(make_request, w3):
+    """Serve eth_getBlockReceipts (missing from eth-tester) as a single RPC call."""
+    def inner(method, params):
+        if method != "eth_getBlockReceipts":
+            return make_request(method, params)
+        block = make_request("eth_getBlockByNumber", [params[0], False])["result"]
+        receipts = [make_request("eth_getTransactionReceipt", [tx_hash])["result"] for tx_hash in block["transactions"]]
+        return {"jsonrpc": "2.0", "id": 0, "result": receipts}
+    return inner
+
+
+def _mine_transfers_in_one_block(w3, funder_key, count):
+    """Mine `count` transfers from fresh wallets into a single block; returns (block number, tx hashes)."""
+    tester = w3.provider.ethereum_tester
+    funder = Account.from_key(funder_key)
+    wallets = [Account.create() for _ in range(count)]
+    chain_id, gas_price = w3.eth.chain_id, w3.eth.gas_price
+    nonce = w3.eth.get_transaction_count(funder.address)
+    for offset, wallet in enumerate(wallets):
+        tx = {"to": wallet.address, "value": 10 ** 18, "gas": 21000, "gasPrice": gas_price, "nonce": nonce + offset, "chainId": chain_id}
+        w3.eth.send_raw_transaction(funder.sign_transaction(tx).rawTransaction)
+
+    tester.disable_auto_mine_transactions()
+    # eth-tester's pending pool only accepts pre-EIP-155 signatures, and one tx per sender.
+    tx_hashes = [
+        w3.eth.send_raw_transaction(wallet.sign_transaction(
+            {"to": wallet.address, "value": 1, "gas": 21000, "gasPrice": gas_price, "nonce": 0}).rawTransaction)
+        for wallet in wallets
+    ]
+    tester.mine_blocks()
+    return w3.eth.block_number, tx_hashes
+
+
+@pytest.mark.parametrize("pending", [1, 10, 100])
+def test_tracker_rpc_calls_do_not_grow_with_pending_txs(w3, private_key, pending):
+    block_number, tx_hashes = _mine_transfers_in_one_block(w3, private_key, pending)
+    w3.middleware_onion.add(_block_receipts, "block_receipts")
+    counts = {}
+    w3.middleware_onion.add(_count_calls(counts), "counter")
+
+    tracker = ReceiptTracker(w3, confirmations=0, poll_interval=0.01, timeout=10).start(block_number)
+    found = tracker.wait(tx_hashes)
+
+    assert [receipt.transactionHash for receipt in found] == tx_hashes
+    # One head lookup and one bulk receipt fetch, whether 1 or 100 txs are waiting.
+    assert counts == {"eth_blockNumber": 1, "eth_getBlockReceipts": 1}
+    assert tracker.stats["rpc_calls"] == 2
+
+
+def test_tracker_falls_back_to_block_transactions(w3, private_key):
+    block_number, tx_hashes = _mine_transfers_in_one_block(w3, private_key, 3)
+    counts = {}
+    w3.middleware_onion.add(_count_calls(counts), "counter")
+
+    tracker = ReceiptTracker(w3, confirmations=0, poll_interval=0.01, timeout=10).start(block_number)
+    assert [receipt.transactionHash for receipt in tracker.wait(tx_hashes)] == tx_hashes
+    assert counts["eth_getBlockReceipts"] == 1
+    assert counts["eth_getBlockByNumber"] == 1
+    assert counts["eth_getTransactionReceipt"] == 3
+
+    # The node said it has no bulk receipts method; the tracker does not ask again.
+    tracker.wait(tx_hashes)
+    assert counts["eth_getBlockReceipts"] == 1
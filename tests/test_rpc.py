@@ -0,0 +1,47 @@
+import pytest
+from web3 import Web3
+
+from nft_deployer import BatchRefused, PooledHTTPProvider, batch_call, instrument_web3, rpc
+from nft_deployer.metrics import Metrics
+
+CALLS = [("eth_chainId", []), ("eth_blockNumber", [])]
+
+
+def test_batch_call_sends_one_round_trip(rpc_server):
+    w3 = Web3(PooledHTTPProvider([rpc_server.uri]))
+    assert batch_call(w3, CALLS) == [hex(16601), "0x10"]
+    assert rpc_server.requests == ["batch"]
+
+
+@pytest.mark.parametrize("refusal", ["http", "object"])
+def test_refused_batch_falls_back_to_single_calls(rpc_server, refusal):
+    rpc_server.refuse_batches = refusal
+    w3 = Web3(PooledHTTPProvider([rpc_server.uri]))
+
+    assert batch_call(w3, CALLS) == [hex(16601), "0x10"]
+    assert rpc_server.requests == ["batch", "eth_chainId", "eth_blockNumber"]
+    endpoint = w3.provider.endpoints[0]
+    # The endpoint answered; refusing batches is not a transport failure.
+    assert endpoint.refuses_batches
+    assert endpoint.failures == 0
+    assert endpoint.unhealthy_until == 0.0
+
+    # The refusal is remembered: no further batch is attempted.
+    assert batch_call(w3, CALLS) == [hex(16601), "0x10"]
+    assert rpc_server.requests.count("batch") == 1
+    with pytest.raises(BatchRefused):
+        w3.provider.make_batch_request(CALLS)
+
+
+def test_refused_batch_is_counted_once_per_call(rpc_server, monkeypatch):
+    metrics = Metrics().enable()
+    monkeypatch.setattr(rpc, "METRICS", metrics)
+    rpc_server.refuse_batches = "http"
+    w3 = instrument_web3(Web3(PooledHTTPProvider([rpc_server.uri])))
+
+    batch_call(w3, CALLS)
+    counters = metrics.snapshot()["counters"]
+    assert counters['rpc_calls_total{method="eth_chainId"}'] == 1
+    assert counters['rpc_calls_total{method="eth_blockNumber"}'] == 1
+    assert not [series for series in counters if series.startswith("rpc_failures_total")]
+    assert not [series for series in counters if series.startswith("rpc_endpoint_failures_total")]
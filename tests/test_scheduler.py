@@ -0,0 +1,69 @@
+import threading
+import time
+from datetime import datetime
+
+import pytest
+
+from nft_deployer import CronSchedule, IntervalSchedule, Scheduler
+
+
+@pytest.mark.parametrize("field, weekdays", [("7", {0}), ("0", {0}), ("5-7", {5, 6, 0}), ("6,7", {6, 0}), ("*", set(range(7)))])
+def test_cron_accepts_7_as_sunday(field, weekdays):
+    assert CronSchedule(f"0 9 * * {field}").weekdays == weekdays
+
+
+def test_cron_sunday_fires_on_sunday():
+    friday = datetime(2026, 10, 16, 12, 0).timestamp()
+    fires = datetime.fromtimestamp(CronSchedule("30 9 * * 7").next_after(friday))
+    assert fires == datetime(2026, 10, 18, 9, 30)
+
+
+@pytest.mark.parametrize("expression", ["0 9 * *", "60 * * * *", "0 9 * * 8", "0 9 * * 5-8"])
+def test_cron_rejects_invalid_expressions(expression):
+    with pytest.raises(ValueError):
+        CronSchedule(expression)
+
+
+def _run_scheduler(scheduler, seconds):
+    thread = threading.Thread(target=scheduler.run_forever, daemon=True)
+    thread.start()
+    time.sleep(seconds)
+    return thread
+
+
+def test_queued_runs_coalesce_while_the_wallet_is_busy():
+    scheduler = Scheduler(max_workers=2)
+    release = threading.Event()
+    runs = []
+    scheduler.add("slow", IntervalSchedule(0.05), lambda: (runs.append(time.time()), release.wait()),
+                  wallet="0xwallet", overlap="queue", run_now=True)
+    _run_scheduler(scheduler, 0.4)
+    release.set()
+    time.sleep(0.1)
+    scheduler.stop()
+
+    # Every slot missed while the first run held the wallet folds into one pending run.
+    assert scheduler.stats["coalesced"] >= 3
+    assert scheduler.stats["skipped"] == 0
+    assert len(runs) >= 2
+
+
+def test_entries_for_one_wallet_never_overlap():
+    scheduler = Scheduler(max_workers=4)
+    active, overlaps = [], []
+
+    def run():
+        active.append(1)
+        if len(active) > 1:
+            overlaps.append(len(active))
+        time.sleep(0.05)
+        active.pop()
+
+    scheduler.add("first", IntervalSchedule(0.02), run, wallet="0xwallet", run_now=True)
+    scheduler.add("second", IntervalSchedule(0.02), run, wallet="0xwallet", run_now=True)
+    _run_scheduler(scheduler, 0.3)
+    scheduler.stop()
+
+    assert overlaps == []
+    assert scheduler.stats["skipped"] > 0
+    assert scheduler.stats["completed"] >= 2